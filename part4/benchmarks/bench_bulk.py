@@ -0,0 +1,110 @@
+"""
+Benchmark bulk creation against one POST per item.
+
+Creates N places (3 amenities each) and then N reviews through the API,
+once with one POST per item (as load_api_data.py did) and once with a
+single POST to the /bulk endpoints, each on a fresh file-backed SQLite
+database so commits cost what they cost on disk.
+
+Usage:
+    python benchmarks/bench_bulk.py [--items 10000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config  # noqa: E402
+from hbnb.app import create_app, db  # noqa: E402
+from hbnb.app.services.facade import HBnBFacade  # noqa: E402
+
+
+def setup(path, count):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + path
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        BCRYPT_LOG_ROUNDS = 4
+        RATE_LIMIT_STORE = 'none'
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        db.create_all()
+        facade = HBnBFacade()
+        owner, reviewer = facade.create_users([
+            {'first_name': 'Owner', 'last_name': 'Bench', 'email': 'owner@bench.io',
+             'password': 'bench123', 'is_admin': True},
+            {'first_name': 'Reviewer', 'last_name': 'Bench', 'email': 'reviewer@bench.io',
+             'password': 'bench123'},
+        ])
+        owner_id = owner.id
+        amenity_ids = [id_ for _, id_ in facade.create_amenities(
+            [{'name': f'Amenity {i}'} for i in range(10)])[0]]
+
+    client = app.test_client()
+
+    def token(email):
+        r = client.post('/api/v1/users/login', json={'email': email, 'password': 'bench123'})
+        return {'Authorization': 'Bearer ' + r.json['access_token']}
+
+    places = [
+        {'title': f'Place {i}', 'price': 50 + i % 200, 'latitude': (i % 180) - 90.0,
+         'longitude': (i % 360) - 180.0, 'owner_id': owner_id,
+         'amenities': [amenity_ids[(i + k) % len(amenity_ids)] for k in range(3)]}
+        for i in range(count)
+    ]
+    return client, token('owner@bench.io'), token('reviewer@bench.io'), places
+
+
+def reviews_for(place_ids):
+    return [{'text': 'Great stay', 'rating': 1 + i % 5, 'place_id': place_id}
+            for i, place_id in enumerate(place_ids)]
+
+
+def one_by_one(path, count):
+    client, owner_h, reviewer_h, places = setup(path, count)
+    start = time.perf_counter()
+    place_ids = [client.post('/api/v1/places/', json=place, headers=owner_h).json['id']
+                 for place in places]
+    places_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for review in reviews_for(place_ids):
+        assert client.post('/api/v1/reviews/', json=review, headers=reviewer_h).status_code == 201
+    return places_time, time.perf_counter() - start
+
+
+def bulk(path, count):
+    client, owner_h, reviewer_h, places = setup(path, count)
+    start = time.perf_counter()
+    r = client.post('/api/v1/places/bulk', json=places, headers=owner_h)
+    assert r.status_code == 201, r.json
+    place_ids = [item['id'] for item in r.json['items']]
+    places_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    r = client.post('/api/v1/reviews/bulk', json=reviews_for(place_ids), headers=reviewer_h)
+    assert r.status_code == 201, r.json
+    return places_time, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--items', type=int, default=10000)
+    args = parser.parse_args()
+
+    n = args.items
+    with tempfile.TemporaryDirectory() as tmp:
+        single = one_by_one(os.path.join(tmp, 'single.db'), n)
+        batched = bulk(os.path.join(tmp, 'bulk.db'), n)
+
+    print(f"{n} places (3 amenities each), then {n} reviews, file-backed SQLite")
+    for name, a, b in (('places', single[0], batched[0]), ('reviews', single[1], batched[1])):
+        print(f"  {name:8} one POST per item: {a:7.2f} s ({n / a:7.0f}/s)   "
+              f"bulk: {b:6.2f} s ({n / b:7.0f}/s)   speed-up {a / b:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark importing a large NDJSON file with hbnb.app.importer.
+
+Writes --users reviewers, 100 hosts, --places places and --reviews
+reviews (1M by default) to an NDJSON file, imports it into a SQLite file
+with the ProductionConfig PRAGMAs in --chunk-size transactions, and
+reports the rows per second of each kind of item. With --baseline N it
+first times creating N reviews one by one through
+HBnBFacade.create_review(), one transaction each, as seeding did.
+
+Usage:
+    python benchmarks/bench_import.py [--reviews 1000000] [--users 10000] [--places 10000]
+                                      [--chunk-size 1000] [--baseline 2000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config, ProductionConfig, engine_options  # noqa: E402
+from hbnb.app import create_app, db  # noqa: E402
+from hbnb.app.importer import Importer  # noqa: E402
+from hbnb.app.services.facade import HBnBFacade  # noqa: E402
+
+HOSTS = 100
+
+
+def make_config(path):
+    uri = 'sqlite:///' + path
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = uri
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        SQLALCHEMY_ENGINE_OPTIONS = engine_options(uri)
+        SQLITE_PRAGMAS = ProductionConfig.SQLITE_PRAGMAS
+        BCRYPT_LOG_ROUNDS = 4
+        RATE_LIMIT_STORE = 'none'
+        LOG_LEVEL = 'WARNING'
+
+    return BenchConfig
+
+
+def write_items(path, args):
+    """Users, then places, then reviews, each (reviewer, place) pair once"""
+    rnd = random.Random(0)
+    with open(path, 'w', encoding='utf-8') as f:
+        def write(item):
+            f.write(json.dumps(item) + '\n')
+
+        for i in range(HOSTS):
+            write({'type': 'user', 'first_name': 'Host', 'last_name': str(i),
+                   'email': f'host{i}@bench.io', 'password': 'bench123'})
+        for i in range(args.users):
+            write({'type': 'user', 'first_name': 'Guest', 'last_name': str(i),
+                   'email': f'guest{i}@bench.io', 'password': 'bench123'})
+        for i in range(args.places):
+            write({'type': 'place', 'title': f'Place {i}', 'description': 'x' * 100,
+                   'price': 50.0 + i % 200, 'latitude': rnd.uniform(-80, 80),
+                   'longitude': rnd.uniform(-170, 170), 'owner_email': f'host{i % HOSTS}@bench.io'})
+        for i in range(args.reviews):
+            write({'type': 'review', 'text': f'Review {i}: great stay, would come back.',
+                   'rating': rnd.randint(1, 5), 'user_email': f'guest{i % args.users}@bench.io',
+                   'place_title': f'Place {(i // args.users + i) % args.places}'})
+
+
+class SectionTimer:
+    """Import progress callback adding up the time spent on each section's chunks"""
+
+    def __init__(self):
+        self.elapsed = {}
+        self.read = {}
+        self.last = time.perf_counter()
+
+    def __call__(self, importer):
+        now = time.perf_counter()
+        for section, counts in importer.stats.items():
+            if counts['read'] != self.read.get(section, 0):
+                self.read[section] = counts['read']
+                self.elapsed[section] = self.elapsed.get(section, 0) + now - self.last
+        self.last = now
+
+
+def baseline(count):
+    """Reviews per second created one by one"""
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(make_config(os.path.join(tmp, 'baseline.db')))
+        with app.app_context():
+            db.create_all()
+            facade = HBnBFacade()
+            host = facade.create_users([{'first_name': 'Host', 'last_name': 'B',
+                                         'email': 'host@b.io', 'password': 'bench123'}])[0]
+            guests = facade.create_users([{'first_name': 'Guest', 'last_name': str(i),
+                                           'email': f'g{i}@b.io', 'password': 'bench123'}
+                                          for i in range(count)])
+            created, _ = facade.create_places([{'title': 'P', 'price': 1, 'latitude': 0.0,
+                                                'longitude': 0.0, 'owner_id': host.id}])
+            place_id = created[0][1]
+            guest_ids = [guest.id for guest in guests]
+            start = time.perf_counter()
+            for guest_id in guest_ids:
+                facade.create_review({'text': 'one by one', 'rating': 4,
+                                      'user_id': guest_id, 'place_id': place_id})
+            return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--reviews', type=int, default=1000000)
+    parser.add_argument('--users', type=int, default=10000, help='reviewers')
+    parser.add_argument('--places', type=int, default=10000)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--baseline', type=int, default=0, help='reviews created one by one first')
+    args = parser.parse_args()
+
+    if args.baseline:
+        print(f"one by one: {baseline(args.baseline):8.0f} reviews/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data = os.path.join(tmp, 'bench.ndjson')
+        write_items(data, args)
+        size = os.path.getsize(data) / 2 ** 20
+        app = create_app(make_config(os.path.join(tmp, 'bench.db')))
+        with app.app_context():
+            db.create_all()
+            timer = SectionTimer()
+            importer = Importer(chunk_size=args.chunk_size, progress=timer)
+            timer.last = start = time.perf_counter()
+            stats = importer.run(data)
+            total = time.perf_counter() - start
+
+    print(f"{HOSTS + args.users} users, {args.places} places, {args.reviews} reviews "
+          f"({size:.0f} MiB NDJSON), {args.chunk_size} items per transaction")
+    for section, counts in stats.items():
+        if counts['read']:
+            print(f"  {section:9} {counts['created']:8} created  {counts['rejected']:4} rejected  "
+                  f"{counts['read'] / timer.elapsed[section]:8.0f} rows/s")
+    print(f"  total     {importer.position:8} items in {total:.1f} s  "
+          f"{importer.position / total:8.0f} items/s")
+
+
+if __name__ == '__main__':
+    main()
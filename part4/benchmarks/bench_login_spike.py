@@ -0,0 +1,108 @@
+"""
+Benchmark light-request latency during a login spike.
+
+Starts --logins threads that log in back to back while one probe thread
+times cheap GET /api/v1/amenities/ requests, once with bcrypt running on
+every request thread (PASSWORD_HASH_EXECUTOR=inline, the previous
+behaviour) and once on the bounded hashing pool. Also reports the login
+throughput and the 503s shed by the pool.
+
+Usage:
+    python benchmarks/bench_login_spike.py [--logins 16] [--seconds 5] [--rounds 10]
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config  # noqa: E402
+from hbnb.app import create_app, db  # noqa: E402
+from hbnb.app.models.amenity import Amenity  # noqa: E402
+from hbnb.app.services.facade import HBnBFacade  # noqa: E402
+
+
+def run(executor, args):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite://'
+        # One shared in-memory database for every thread
+        SQLALCHEMY_ENGINE_OPTIONS = {'connect_args': {'check_same_thread': False},
+                                     'poolclass': StaticPool}
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        BCRYPT_LOG_ROUNDS = args.rounds
+        RESPONSE_CACHE_BACKEND = 'none'
+        PASSWORD_HASH_EXECUTOR = executor
+        PASSWORD_HASH_WORKERS = args.workers
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(Amenity(name=f'Amenity {i}') for i in range(10))
+        db.session.commit()
+        HBnBFacade().create_users([
+            {'first_name': 'Bench', 'last_name': 'User', 'email': f'u{i}@bench.io',
+             'password': 'bench123'}
+            for i in range(args.logins)
+        ])
+
+    stop = threading.Event()
+    codes = []
+    latencies = []
+
+    def login(i):
+        client = app.test_client()
+        while not stop.is_set():
+            r = client.post('/api/v1/users/login',
+                            json={'email': f'u{i}@bench.io', 'password': 'bench123'})
+            codes.append(r.status_code)
+
+    def probe():
+        client = app.test_client()
+        while not stop.is_set():
+            start = time.perf_counter()
+            client.get('/api/v1/amenities/')
+            latencies.append(time.perf_counter() - start)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=login, args=(i,)) for i in range(args.logins)]
+    threads.append(threading.Thread(target=probe))
+    for t in threads:
+        t.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    latencies.sort()
+    return {
+        'logins': codes.count(200) / args.seconds,
+        'shed': codes.count(503),
+        'p50': statistics.median(latencies) * 1000,
+        'p95': latencies[int(len(latencies) * 0.95)] * 1000,
+        'probes': len(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--logins', type=int, default=16, help='concurrent login threads')
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--rounds', type=int, default=10, help='bcrypt cost')
+    parser.add_argument('--workers', type=int, default=None, help='pool size')
+    args = parser.parse_args()
+
+    print(f"{args.logins} login threads, bcrypt cost {args.rounds}, "
+          f"{os.cpu_count()} CPUs, {args.seconds:g}s each")
+    for executor in ('inline', 'thread'):
+        r = run(executor, args)
+        print(f"  {executor:7} light GET p50 {r['p50']:7.1f} ms  p95 {r['p95']:7.1f} ms"
+              f"  ({r['probes']} probes)  logins {r['logins']:5.1f}/s  shed {r['shed']}")
+
+
+if __name__ == '__main__':
+    main()
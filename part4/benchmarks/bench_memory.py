@@ -0,0 +1,91 @@
+"""
+Benchmark the memory held per review by InMemoryRepository.
+
+Adds --reviews Review instances, built as an ORM query loads them (column
+values, no relationships), to a repository indexed on place_id, once
+storing the instances and once in compact mode, and reports the bytes
+still allocated per review once the repository holds them (tracemalloc)
+and the cost of adding and reading.
+
+Usage:
+    python benchmarks/bench_memory.py [--reviews 200000]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.orm.attributes import set_committed_value
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hbnb.app.models.place import Place  # noqa: E402,F401
+from hbnb.app.models.review import Review  # noqa: E402
+from hbnb.app.persistence.repository import Index, InMemoryRepository  # noqa: E402
+
+
+configure_mappers()
+
+
+def loaded(model, **values):
+    """An instance as a query returns it, without running __init__"""
+    obj = model.__mapper__.class_manager.new_instance()
+    for name, value in values.items():
+        set_committed_value(obj, name, value)
+    return obj
+
+
+def reviews(count):
+    rnd = random.Random(0)
+    users = [str(uuid.uuid4()) for _ in range(max(1, count // 20))]
+    places = [str(uuid.uuid4()) for _ in range(max(1, count // 50))]
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        created = start + timedelta(seconds=i)
+        yield loaded(Review, id=str(uuid.uuid4()), text=f'{i}: ' + 'Great place to stay. ' * 3,
+                     rating=rnd.randint(1, 5), user_id=rnd.choice(users),
+                     place_id=rnd.choice(places), created_at=created, updated_at=created)
+
+
+def run(compact, count):
+    gc.collect()
+    tracemalloc.start()
+    items = list(reviews(count))
+    start = time.perf_counter()
+    repo = InMemoryRepository([Index('place_id')], model=Review, compact=compact)
+    repo.add_all(items)
+    add_time = time.perf_counter() - start
+    # Only what the repository keeps is left
+    del items
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    ids = [review.id for review in repo.get_page(20000)[0]]
+    start = time.perf_counter()
+    for obj_id in ids:
+        repo.get(obj_id).rating
+    get_time = (time.perf_counter() - start) / len(ids)
+    return held / count, count / add_time, get_time * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--reviews', type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"{args.reviews} reviews, indexed on place_id")
+    for name, compact in (('instances', False), ('compact', True)):
+        per_review, adds, get_us = run(compact, args.reviews)
+        print(f"  {name:10} {per_review:7.0f} bytes/review   add {adds:8.0f}/s   "
+              f"get {get_us:5.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark radius and k-nearest place queries against a full table scan.
+
+Builds a throw-away SQLite database with N random places for each size,
+then times PlaceRepository.nearby/nearest (grid cell index) and a brute
+force scan over every place. Query time with the index should stay nearly
+flat as N grows while the scan grows linearly.
+
+Usage:
+    python benchmarks/bench_nearby.py [--sizes 10000,100000,1000000] [--queries 50]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config  # noqa: E402
+from hbnb.app import create_app, db  # noqa: E402
+from hbnb.app.models.place import Place  # noqa: E402
+from hbnb.app.persistence.spatial import cell_for, haversine_km  # noqa: E402
+from hbnb.app.services.repositories.place_repository import PlaceRepository  # noqa: E402
+
+
+def build_app(db_path):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///' + db_path
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    return create_app(BenchConfig)
+
+
+def populate(size, rng, batch=50000):
+    owner_id = str(uuid.uuid4())
+    now = datetime.utcnow()
+    for start in range(0, size, batch):
+        rows = []
+        for i in range(start, min(size, start + batch)):
+            lat = rng.uniform(-60, 70)
+            lon = rng.uniform(-180, 180)
+            rows.append({
+                'id': str(uuid.uuid4()), 'title': f'Place {i}', 'description': '',
+                'price': 100.0, 'latitude': lat, 'longitude': lon, 'location': '',
+                'geo_cell': cell_for(lat, lon), 'owner_id': owner_id,
+                'created_at': now, 'updated_at': now,
+            })
+        db.session.execute(Place.__table__.insert(), rows)
+    db.session.commit()
+
+
+def full_scan(lat, lon, radius_km, limit):
+    rows = db.session.query(Place.id, Place.latitude, Place.longitude).all()
+    hits = sorted(
+        (haversine_km(lat, lon, a, b), place_id) for place_id, a, b in rows
+        if haversine_km(lat, lon, a, b) <= radius_km
+    )
+    return hits[:limit]
+
+
+def timed(fn, points):
+    start = time.perf_counter()
+    for lat, lon in points:
+        fn(lat, lon)
+    return (time.perf_counter() - start) / len(points) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', default='10000,100000,1000000')
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--radius-km', type=float, default=5.0)
+    parser.add_argument('--scan-queries', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'places':>10} {'nearby 5km':>12} {'nearest k=10':>14} {'full scan':>12}  (ms/query)")
+    for size in (int(s) for s in args.sizes.split(',')):
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            app = build_app(path)
+            with app.app_context():
+                db.create_all()
+                populate(size, rng)
+                repo = PlaceRepository()
+                points = [(rng.uniform(-60, 70), rng.uniform(-180, 180))
+                          for _ in range(args.queries)]
+                nearby_ms = timed(lambda a, b: repo.nearby(a, b, args.radius_km, 20), points)
+                nearest_ms = timed(lambda a, b: repo.nearest(a, b, 10), points)
+                scan_ms = timed(lambda a, b: full_scan(a, b, args.radius_km, 20),
+                                points[:args.scan_queries])
+                db.session.remove()
+            print(f"{size:>10} {nearby_ms:>12.2f} {nearest_ms:>14.2f} {scan_ms:>12.2f}")
+        finally:
+            os.unlink(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark per-place serialization cost of the place listing.
+
+Loads N places (each with an owner, 3 amenities and 2 reviews) with their
+relationships preloaded, then times the previous hand-written dict building
+of PlaceList.get against the compiled PLACE_CARD plan. Only serialization
+is timed; loading happens once up front.
+
+Usage:
+    python benchmarks/bench_serialize.py [--places 10000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config  # noqa: E402
+from hbnb.app import create_app, db  # noqa: E402
+from hbnb.app.models.amenity import Amenity  # noqa: E402
+from hbnb.app.models.place import Place  # noqa: E402
+from hbnb.app.models.review import Review  # noqa: E402
+from hbnb.app.models.user import User  # noqa: E402
+from hbnb.app.api.v1.serializers import PLACE_CARD, serialize_many  # noqa: E402
+from hbnb.app.services.repositories.place_repository import PlaceRepository  # noqa: E402
+
+
+def legacy_place_to_dict(place):
+    """The place listing serializer before the compiled plans, kept for comparison"""
+    place_dict = {
+        'id': place.id,
+        'title': place.title,
+        'description': place.description,
+        'price': place.price,
+        'latitude': place.latitude,
+        'longitude': place.longitude,
+        'location': getattr(place, 'location', ''),
+        'owner_id': place.owner_id,
+        'amenities': [
+            {'id': amenity.id, 'name': amenity.name}
+            for amenity in place.amenities
+        ],
+        'reviews': [],
+        'review_count': place.review_count or 0,
+        'rating_average': round(place.rating_avg or 0.0, 2),
+        'rating_histogram': place.rating_histogram,
+        'created_at': place.created_at.isoformat(),
+        'updated_at': place.updated_at.isoformat()
+    }
+    try:
+        if hasattr(place, 'owner') and place.owner:
+            place_dict['owner'] = {
+                'id': place.owner_id,
+                'first_name': place.owner.first_name,
+                'last_name': place.owner.last_name,
+                'email': place.owner.email
+            }
+        else:
+            place_dict['owner'] = None
+    except Exception:
+        place_dict['owner'] = None
+    try:
+        place_dict['reviews'] = [
+            {
+                'id': review.id,
+                'text': review.text,
+                'rating': review.rating,
+                'user_id': getattr(review.user, 'id', getattr(review, 'user_id', None)),
+                'user': {
+                    'id': review.user.id,
+                    'first_name': review.user.first_name,
+                    'last_name': review.user.last_name
+                } if hasattr(review, 'user') and review.user else None
+            }
+            for review in place.reviews
+        ]
+    except Exception:
+        place_dict['reviews'] = []
+    return place_dict
+
+
+def populate(count):
+    users = [User(first_name=f'U{i}', last_name='Bench', email=f'u{i}@bench.io')
+             for i in range(20)]
+    for user in users:
+        user.password = 'x'
+    amenities = [Amenity(name=f'Amenity {i}') for i in range(10)]
+    db.session.add_all(users + amenities)
+
+    places = []
+    for i in range(count):
+        place = Place(title=f'Place {i}', price=50 + i % 200, latitude=0.0,
+                      longitude=0.0, owner=users[i % len(users)])
+        place.amenities.extend(amenities[(i + k) % len(amenities)] for k in range(3))
+        places.append(place)
+    db.session.add_all(places)
+    db.session.flush()
+
+    reviews = [
+        {'id': f'{place.id}-{k}', 'text': 'Great stay', 'rating': k + 3,
+         'user_id': users[(i + k) % len(users)].id, 'place_id': place.id,
+         'created_at': place.created_at, 'updated_at': place.updated_at}
+        for i, place in enumerate(places) for k in (1, 2)
+    ]
+    db.session.execute(Review.__table__.insert(), reviews)
+    db.session.commit()
+
+
+def timed(fn, places, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(places)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--places', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite://'
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        db.create_all()
+        populate(args.places)
+        places = PlaceRepository().list_with_relations()
+
+        legacy = timed(lambda ps: [legacy_place_to_dict(p) for p in ps], places, args.repeat)
+        compiled = timed(lambda ps: serialize_many(PLACE_CARD, ps), places, args.repeat)
+
+    n = len(places)
+    print(f"{n} places, best of {args.repeat}")
+    print(f"  legacy dict building: {legacy * 1000:8.1f} ms total, {legacy / n * 1e6:6.2f} us/place")
+    print(f"  compiled PLACE_CARD:  {compiled * 1000:8.1f} ms total, {compiled / n * 1e6:6.2f} us/place")
+    print(f"  speed-up: {legacy / compiled:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
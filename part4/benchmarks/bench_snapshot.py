@@ -0,0 +1,97 @@
+"""
+Benchmark restarting a compact InMemoryRepository from its snapshot.
+
+Fills a repository of --reviews reviews (indexed on place_id, and on
+rating in order) saved to a snapshot, appends --tail more writes to its
+log, then reports the time to open it again (mapping the snapshot and
+replaying the log), to re-add every review as a re-seed would, and the
+cost of the first reads of the reopened repository.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--reviews 1000000] [--tail 10000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_memory import loaded  # noqa: E402
+from hbnb.app.models.review import Review  # noqa: E402
+from hbnb.app.persistence.repository import Index, InMemoryRepository  # noqa: E402
+
+BATCH = 10000
+
+
+def reviews(count, places, rnd, start):
+    users = [str(uuid.uuid4()) for _ in range(max(1, count // 20))]
+    for i in range(count):
+        created = start + timedelta(seconds=i)
+        yield loaded(Review, id=str(uuid.uuid4()), text=f'{i}: ' + 'Great place to stay. ' * 3,
+                     rating=rnd.randint(1, 5), user_id=rnd.choice(users),
+                     place_id=rnd.choice(places), created_at=created, updated_at=created)
+
+
+def open_repo(path):
+    return InMemoryRepository([Index('place_id'), Index('rating', ordered=True)],
+                              model=Review, compact=True, path=path, snapshot_every=0)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--reviews', type=int, default=1000000)
+    parser.add_argument('--tail', type=int, default=10000, help='writes logged after the snapshot')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    places = [str(uuid.uuid4()) for _ in range(max(1, args.reviews // 50))]
+    start = datetime(2024, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'reviews.snapshot')
+        repo = open_repo(path)
+        items = reviews(args.reviews, places, rnd, start)
+        add_time = 0
+        while True:
+            batch = [item for _, item in zip(range(BATCH), items)]
+            if not batch:
+                break
+            _, seconds = timed(repo.add_all, batch)
+            add_time += seconds
+        _, write_time = timed(repo.snapshot)
+        tail = list(reviews(args.tail, places, rnd, start + timedelta(days=3650)))
+        repo.add_all(tail)
+        repo.close()
+        size = os.path.getsize(path) / 2 ** 20
+
+        repo, open_time = timed(open_repo, path)
+        assert len(repo) == args.reviews + args.tail
+        _, get_time = timed(repo.get, tail[0].id)
+        ids = [review.id for review in repo.get_page(1000)[0]]
+        _, gets_time = timed(lambda: [repo.get(obj_id).rating for obj_id in ids])
+        _, page_time = timed(repo.get_page, 20, (start + timedelta(seconds=args.reviews // 2), ids[0]))
+        _, place_time = timed(repo.get_all_by_attribute, 'place_id', [places[0]])
+        repo.close()
+
+    print(f"{args.reviews} reviews + {args.tail} logged writes, snapshot {size:.0f} MiB")
+    print(f"  re-seed (add every review)  {add_time:7.2f} s")
+    print(f"  write snapshot              {write_time:7.2f} s")
+    print(f"  open snapshot + replay log  {open_time:7.3f} s")
+    print(f"  first get                   {get_time * 1e6:7.0f} us, then "
+          f"{gets_time / len(ids) * 1e6:.1f} us")
+    print(f"  get_page(20) mid-store      {page_time * 1e3:7.2f} ms")
+    print(f"  reviews of one place        {place_time * 1e3:7.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Benchmark concurrent read throughput on a SQLite file.
+
+Starts --readers worker processes loading random places back to back
+(HBnBFacade.get_place() in a fresh session, or GET /api/v1/places/<id>
+with --api) while one writer process keeps creating places in bulk
+(--batch per transaction, like an import), once with SQLite's defaults
+(as DevelopmentConfig) and once with the PRAGMAs and pool of
+ProductionConfig. Reports the reads per second and their latency, and
+the places written.
+
+Usage:
+    python benchmarks/bench_sqlite_concurrency.py [--readers 4] [--seconds 5] [--places 20000]
+                                                  [--batch 200] [--api]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config, ProductionConfig, engine_options  # noqa: E402
+from hbnb.app import create_app, db  # noqa: E402
+from hbnb.app.services.facade import HBnBFacade  # noqa: E402
+
+
+def make_config(path, tuned):
+    uri = 'sqlite:///' + path
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = uri
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        BCRYPT_LOG_ROUNDS = 4
+        RATE_LIMIT_STORE = 'none'
+        # Every read goes to the database
+        RESPONSE_CACHE_BACKEND = 'none'
+        USER_CACHE_TTL = 0
+        LOG_LEVEL = 'WARNING'
+        if tuned:
+            SQLALCHEMY_ENGINE_OPTIONS = engine_options(uri)
+            SQLITE_PRAGMAS = ProductionConfig.SQLITE_PRAGMAS
+
+    return BenchConfig
+
+
+def setup(config, count):
+    app = create_app(config)
+    with app.app_context():
+        db.create_all()
+        facade = HBnBFacade()
+        owner = facade.create_users([{'first_name': 'Owner', 'last_name': 'Bench',
+                                      'email': 'owner@bench.io', 'password': 'bench123'}])[0]
+        owner_id = owner.id
+        created, _ = facade.create_places(places(owner_id, count))
+    return owner_id, [place_id for _, place_id in created]
+
+
+def places(owner_id, count):
+    return [
+        {'title': f'Place {i}', 'description': 'x' * 200, 'price': 50 + i % 200,
+         'latitude': (i % 180) - 90.0, 'longitude': (i % 360) - 180.0, 'owner_id': owner_id}
+        for i in range(count)
+    ]
+
+
+def reader(config, place_ids, api, seconds, start, results):
+    app = create_app(config)
+    client = app.test_client()
+    facade = HBnBFacade()
+    start.wait()
+    latencies, deadline = [], time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        place_id = random.choice(place_ids)
+        begin = time.perf_counter()
+        if api:
+            assert client.get(f'/api/v1/places/{place_id}').status_code == 200
+        else:
+            with app.app_context():
+                assert facade.get_place(place_id).title
+        latencies.append(time.perf_counter() - begin)
+    results.put(('read', latencies))
+
+
+def writer(config, owner_id, batch, seconds, start, results):
+    app = create_app(config)
+    start.wait()
+    written, deadline = 0, time.perf_counter() + seconds
+    with app.app_context():
+        facade = HBnBFacade()
+        while time.perf_counter() < deadline:
+            written += len(facade.create_places(places(owner_id, batch))[0])
+    results.put(('write', written))
+
+
+def run(tuned, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(os.path.join(tmp, 'bench.db'), tuned)
+        owner_id, place_ids = setup(config, args.places)
+
+        ctx = multiprocessing.get_context('fork')
+        start, results = ctx.Barrier(args.readers + 1), ctx.Queue()
+        procs = [ctx.Process(target=reader, args=(config, place_ids, args.api, args.seconds,
+                                                      start, results))
+                 for _ in range(args.readers)]
+        procs.append(ctx.Process(target=writer, args=(config, owner_id, args.batch,
+                                                      args.seconds, start, results)))
+        for proc in procs:
+            proc.start()
+        latencies, written = [], 0
+        for _ in procs:
+            kind, result = results.get()
+            if kind == 'read':
+                latencies.extend(result)
+            else:
+                written = result
+        for proc in procs:
+            proc.join()
+    latencies.sort()
+    return {
+        'reads': len(latencies) / args.seconds,
+        'p50': statistics.median(latencies) * 1000,
+        'p95': latencies[int(len(latencies) * 0.95)] * 1000,
+        'max': latencies[-1] * 1000,
+        'written': written / args.seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--readers', type=int, default=4, help='reader processes')
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--places', type=int, default=20000, help='places read')
+    parser.add_argument('--batch', type=int, default=200, help='places per write transaction')
+    parser.add_argument('--api', action='store_true', help='read through the HTTP API')
+    args = parser.parse_args()
+
+    print(f"{args.readers} {'API' if args.api else 'facade'} readers of {args.places} places"
+          f" + 1 writer ({args.batch} places per transaction), "
+          f"{os.cpu_count()} CPUs, {args.seconds:g}s each")
+    for name, tuned in (('default', False), ('production', True)):
+        r = run(tuned, args)
+        print(f"  {name:10} reads {r['reads']:6.0f}/s  p50 {r['p50']:6.1f} ms  "
+              f"p95 {r['p95']:6.1f} ms  max {r['max']:7.1f} ms   "
+              f"places written {r['written']:6.0f}/s")
+
+
+if __name__ == '__main__':
+    main()
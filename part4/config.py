@@ -1,5 +1,34 @@
 import os
 
+
+def database_uri(default):
+    """DATABASE_URL if set (postgres:// accepted for postgresql://), else default"""
+    uri = os.getenv('DATABASE_URL', default)
+    if uri.startswith('postgres://'):
+        uri = 'postgresql://' + uri[len('postgres://'):]
+    return uri
+
+
+def engine_options(uri):
+    """
+    SQLALCHEMY_ENGINE_OPTIONS of a server's database: a pool sized for its
+    worker threads, plus pre-ping and recycling for PostgreSQL, whose
+    connections can be dropped by the server or a proxy while idle.
+    """
+    if uri in ('sqlite://', 'sqlite:///:memory:'):
+        # One connection per thread, not pooled
+        return {}
+    options = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', 10)),
+    }
+    if uri.startswith('postgresql'):
+        options['pool_pre_ping'] = True
+        options['pool_recycle'] = int(os.getenv('DB_POOL_RECYCLE', 1800))
+    return options
+
+
 class Config:
     """Base configuration class"""
     SECRET_KEY = os.getenv('SECRET_KEY', 'default_secret_key')
@@ -9,15 +38,113 @@ class Config:
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'jwt_secret_key')
     JWT_ACCESS_TOKEN_EXPIRES = 3600  # 1 hour in seconds
 
+    # Logging Configuration (level of the 'hbnb' logger hierarchy)
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FORMAT = '%(asctime)s %(levelname)s [%(name)s] %(message)s'
+
+    # Response cache of the hot read endpoints: memory, filesystem or none.
+    # The memory backend is for a single process: other workers only see a
+    # write once their entries expire after RESPONSE_CACHE_TTL seconds. The
+    # filesystem backend is shared by every worker of the host, and is the
+    # default when WEB_CONCURRENCY (the server's worker count) is above 1.
+    WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 1))
+    RESPONSE_CACHE_BACKEND = os.getenv(
+        'RESPONSE_CACHE_BACKEND', 'filesystem' if WEB_CONCURRENCY > 1 else 'memory')
+    RESPONSE_CACHE_TTL = float(os.getenv('RESPONSE_CACHE_TTL', 30))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 1024))
+    RESPONSE_CACHE_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+    RESPONSE_CACHE_DIR = os.getenv('RESPONSE_CACHE_DIR')
+
+    # Per-process cache of user lookups by id and email (0 disables it).
+    # Other workers see a change once their entry expires: keep it short.
+    USER_CACHE_TTL = float(os.getenv('USER_CACHE_TTL', 30))
+    USER_CACHE_NEGATIVE_TTL = float(os.getenv('USER_CACHE_NEGATIVE_TTL', 5))
+    USER_CACHE_MAX_ENTRIES = int(os.getenv('USER_CACHE_MAX_ENTRIES', 4096))
+
+    # Items accepted by one POST .../bulk request
+    BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', 10000))
+
+    # Password hash policy: bcrypt or argon2id (needs argon2-cffi). Stored
+    # hashes made under another scheme or cost are replaced on login.
+    PASSWORD_HASH_SCHEME = os.getenv('PASSWORD_HASH_SCHEME', 'bcrypt')
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+    ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', 3))
+    ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', 65536))  # KiB
+    ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', 4))
+
+    # Login throttling: token buckets of (burst, refills per minute) keyed
+    # by client IP, by email and client IP, and by email. Store: memory (per
+    # worker, so each limit is multiplied by the worker count), sqlite or shm
+    # (shared by the workers of a host, the default when WEB_CONCURRENCY is
+    # above 1), or none.
+    RATE_LIMIT_STORE = os.getenv('RATE_LIMIT_STORE', 'shm' if WEB_CONCURRENCY > 1 else 'memory')
+    RATE_LIMIT_PATH = os.getenv('RATE_LIMIT_PATH')
+    RATE_LIMIT_MAX_ENTRIES = int(os.getenv('RATE_LIMIT_MAX_ENTRIES', 65536))
+    RATE_LIMITS = {
+        'login_ip': (int(os.getenv('LOGIN_IP_BURST', 20)),
+                     float(os.getenv('LOGIN_IP_PER_MINUTE', 10))),
+        'login_client': (int(os.getenv('LOGIN_CLIENT_BURST', 5)),
+                         float(os.getenv('LOGIN_CLIENT_PER_MINUTE', 2))),
+        'login_email': (int(os.getenv('LOGIN_EMAIL_BURST', 30)),
+                        float(os.getenv('LOGIN_EMAIL_PER_MINUTE', 10))),
+    }
+
+    # Password hashing pool: thread, process or inline (on the request thread).
+    # Workers default to half the CPUs so other requests keep running during
+    # login spikes; callers that wait longer than the timeout for a slot get 503.
+    PASSWORD_HASH_EXECUTOR = os.getenv('PASSWORD_HASH_EXECUTOR', 'thread')
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', 0)) or None
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', 0)) or None
+    PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv('PASSWORD_HASH_QUEUE_TIMEOUT', 5))
+
+    # PRAGMAs run on every new SQLite connection (ignored for other
+    # databases), e.g. {'journal_mode': 'WAL'}; see hbnb.app.persistence.engine
+    SQLITE_PRAGMAS = {}
+
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG')
     # Use absolute path for database
     basedir = os.path.abspath(os.path.dirname(__file__))
     SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(basedir, 'development.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+class TestingConfig(Config):
+    """Testing configuration: in-memory database and the cheapest hashes"""
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    BCRYPT_LOG_ROUNDS = 4
+    ARGON2_TIME_COST = 1
+    ARGON2_MEMORY_COST = 1024
+    ARGON2_PARALLELISM = 1
+    PASSWORD_HASH_EXECUTOR = 'inline'
+    RATE_LIMIT_STORE = 'none'
+
+class ProductionConfig(Config):
+    """
+    Production configuration (FLASK_ENV=production): DATABASE_URL or a
+    SQLite file in WAL mode, so readers no longer wait for writers, with a
+    connection pool sized by DB_POOL_SIZE/DB_MAX_OVERFLOW.
+    """
+    basedir = os.path.abspath(os.path.dirname(__file__))
+    SQLALCHEMY_DATABASE_URI = database_uri('sqlite:///' + os.path.join(basedir, 'production.db'))
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        # WAL stays consistent after a crash; only the last commits may be lost
+        'synchronous': 'NORMAL',
+        'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000)),  # ms
+        'cache_size': -int(os.getenv('SQLITE_CACHE_KIB', 65536)),  # negative: KiB
+        'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),  # bytes
+        'temp_store': 'MEMORY',
+    }
+
 config = {
     'development': DevelopmentConfig,
+    'testing': TestingConfig,
+    'production': ProductionConfig,
     'default': DevelopmentConfig
 }
@@ -0,0 +1,137 @@
+"""
+Shared fixtures of the part4 test suite.
+
+Every test gets its own application on a fresh SQLite file (TestingConfig:
+cheapest hashes, inline password pool, no login throttling), so tests can
+also open the database directly, as another worker process would.
+Run with: pytest -q
+"""
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from flask_jwt_extended import create_access_token  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from config import TestingConfig  # noqa: E402
+from hbnb.app import create_app, db  # noqa: E402
+from hbnb.app.services.facade import HBnBFacade  # noqa: E402
+
+
+def make_config(database, **settings):
+    """TestingConfig on an SQLite file, with some settings overridden"""
+    return type('TestConfig', (TestingConfig,), {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{database}', **settings})
+
+
+def make_app(database, **settings):
+    """An application with its tables created"""
+    app = create_app(make_config(database, **settings))
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def auth_headers(app, user):
+    """Authorization headers of a user, as UserLogin.post would issue them"""
+    with app.app_context():
+        token = create_access_token(identity=str(user.id),
+                                    additional_claims={'is_admin': user.is_admin})
+    return {'Authorization': f'Bearer {token}'}
+
+
+@contextmanager
+def count_queries(app):
+    """Collect the SQL statements the app's engine runs in the block"""
+    statements = []
+
+    def collect(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', collect)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', collect)
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Path of the test's SQLite file"""
+    return tmp_path / 'test.db'
+
+
+@pytest.fixture
+def app(database):
+    """Create and configure a test application instance."""
+    return make_app(database)
+
+
+@pytest.fixture
+def client(app):
+    """Create a test client for the app."""
+    return app.test_client()
+
+
+@pytest.fixture
+def facade():
+    """The facade shared by every endpoint."""
+    return HBnBFacade()
+
+
+@pytest.fixture
+def accounts(app, facade):
+    """
+    An admin, a host and a guest: {role: (user id, Authorization headers)}.
+    Their passwords are '<role>-password'.
+    """
+    with app.app_context():
+        users = facade.create_users([
+            {'first_name': role.title(), 'last_name': 'Test', 'email': f'{role}@example.com',
+             'password': f'{role}-password', 'is_admin': role == 'admin'}
+            for role in ('admin', 'host', 'guest')])
+        return {user.email.split('@')[0]: (user.id, auth_headers(app, user)) for user in users}
+
+
+@pytest.fixture
+def create_place(client, accounts):
+    """Create a place owned by the host (or the given role) through the API"""
+    def create(title='Test place', price=100.0, latitude=24.7, longitude=46.7,
+               amenities=(), role='host'):
+        owner_id, headers = accounts[role]
+        response = client.post('/api/v1/places/', headers=headers, json={
+            'title': title, 'description': '', 'price': price, 'latitude': latitude,
+            'longitude': longitude, 'owner_id': owner_id, 'amenities': list(amenities)})
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()
+    return create
+
+
+@pytest.fixture
+def create_amenity(client, accounts):
+    """Create an amenity through the API, as the admin"""
+    def create(name):
+        response = client.post('/api/v1/amenities/', headers=accounts['admin'][1],
+                               json={'name': name})
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()
+    return create
+
+
+@pytest.fixture
+def create_review(client, accounts):
+    """Create a review by the guest (or the given role) through the API"""
+    def create(place_id, rating=4, text='Nice stay', role='guest'):
+        response = client.post('/api/v1/reviews/', headers=accounts[role][1],
+                               json={'text': text, 'rating': rating, 'place_id': place_id})
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()
+    return create
@@ -1,12 +1,19 @@
 from flask import Flask, send_from_directory, redirect
 from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
-from hbnb.app.extensions import bcrypt, jwt
+from hbnb.app.extensions import (
+    identity_cache, jwt, password_hasher, rate_limiter, response_cache,
+)
+from hbnb.app.log import configure_logging
+from hbnb.app.persistence.engine import configure_engine
 from flask_cors import CORS
+import logging
 import os
 
 db = SQLAlchemy()
 
+logger = logging.getLogger(__name__)
+
 
 def create_app(config_class="config.DevelopmentConfig"):
     """
@@ -20,20 +27,26 @@ def create_app(config_class="config.DevelopmentConfig"):
     """
     app = Flask(__name__, static_folder=None)
     app.config.from_object(config_class)
+    configure_logging(app)
     
     # Initialize extensions
     db.init_app(app)
-    bcrypt.init_app(app)
+    configure_engine(app, db)
     jwt.init_app(app)
+    response_cache.init_app(app)
+    identity_cache.init_app(app)
+    password_hasher.init_app(app)
+    rate_limiter.init_app(app)
     
     # Enable CORS for all origins
-    CORS(app, resources={r"/*": {"origins": "*"}})
+    CORS(app, resources={r"/*": {"origins": "*"}},
+         # Readable by scripts of other origins (next page, validators)
+         expose_headers=['X-Next-Cursor', 'Link', 'ETag', 'Last-Modified'])
     
     # Get web_client absolute path
     base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     web_client_path = os.path.join(base_dir, 'web_client')
-    print(f"📂 Web client path: {web_client_path}")
-    print(f"📂 Exists: {os.path.exists(web_client_path)}")
+    logger.debug("Web client path: %s", web_client_path)
     
     # Serve frontend files BEFORE API setup
     @app.route('/', endpoint='home_page')
@@ -97,10 +110,16 @@ def create_app(config_class="config.DevelopmentConfig"):
     from hbnb.app.api.v1.amenities import api as amenities_ns
     from hbnb.app.api.v1.places import api as places_ns
     from hbnb.app.api.v1.reviews import api as reviews_ns
+    from hbnb.app.api.v1.cache import api as cache_ns
 
     api.add_namespace(users_ns, path='/api/v1/users')
     api.add_namespace(amenities_ns, path='/api/v1/amenities')
     api.add_namespace(places_ns, path='/api/v1/places')
     api.add_namespace(reviews_ns, path='/api/v1/reviews')
+    api.add_namespace(cache_ns, path='/api/v1/cache')
+
+    # Register CLI commands
+    from hbnb.app.commands import hbnb_cli
+    app.cli.add_command(hbnb_cli)
 
     return app
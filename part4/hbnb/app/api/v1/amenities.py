@@ -1,7 +1,15 @@
 """Amenity API endpoints for HBnB application"""
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt
+from sqlalchemy.exc import IntegrityError
 from hbnb.app.services.facade import HBnBFacade
+from hbnb.app.api.v1.pagination import get_page_args, next_page_headers
+from hbnb.app.api.v1.conditional import (
+    collection_validators, conditional_headers, resource_validators,
+)
+from hbnb.app.api.v1.caching import cached
+from hbnb.app.api.v1.bulk import get_bulk_items, run_bulk
+from hbnb.app.api.v1.serializers import AMENITY, serialize, serialize_many
 
 api = Namespace('amenities', description='Amenity operations')
 
@@ -32,19 +40,30 @@ class AmenityList(Resource):
     """Handles operations on the amenity collection"""
 
     @api.doc('list_amenities')
+    @api.param('limit', 'Maximum number of amenities per page', type=int)
+    @api.param('cursor', 'Opaque cursor from the previous page')
     @api.response(200, 'List of amenities retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date sent')
+    @api.response(400, 'Invalid pagination parameters')
+    @cached(lambda: ('amenities',))
     def get(self):
         """Get list of all amenities"""
-        amenities = facade.get_all_amenities()
-        return [
-            {
-                'id': amenity.id,
-                'name': amenity.name,
-                'created_at': amenity.created_at.isoformat(),
-                'updated_at': amenity.updated_at.isoformat()
-            }
-            for amenity in amenities
-        ], 200
+        try:
+            page = get_page_args()
+        except ValueError as e:
+            api.abort(400, str(e))
+
+        versions = facade.get_collection_versions('amenities')
+        headers = conditional_headers(*collection_validators(versions))
+
+        if page is None:
+            amenities = facade.get_all_amenities()
+        else:
+            limit, after = page
+            amenities, next_key = facade.get_amenities_page(limit, after)
+            headers.update(next_page_headers(next_key, limit))
+
+        return serialize_many(AMENITY, amenities), 200, headers
 
     @api.doc('create_amenity')
     @api.expect(amenity_model, validate=True)
@@ -68,14 +87,36 @@ class AmenityList(Resource):
 
         try:
             new_amenity = facade.create_amenity(amenity_data)
-            return {
-                'id': new_amenity.id,
-                'name': new_amenity.name,
-                'created_at': new_amenity.created_at.isoformat(),
-                'updated_at': new_amenity.updated_at.isoformat()
-            }, 201
+            return serialize(AMENITY, new_amenity), 201
+        except ValueError as e:
+            api.abort(400, str(e))
+
+
+@api.route('/bulk')
+class AmenityBulk(Resource):
+    """Creates many amenities in one request"""
+
+    @api.doc('create_amenities_bulk')
+    @api.expect([amenity_model])
+    @api.response(201, 'All amenities created')
+    @api.response(207, 'Some amenities created, see the status of each item')
+    @api.response(400, 'Invalid body, or no amenity could be created')
+    @api.response(403, 'Admin privileges required')
+    @api.response(409, 'A name was taken concurrently, nothing was created')
+    @jwt_required()
+    def post(self):
+        """Create many amenities in one transaction (requires admin privileges)"""
+        if not is_admin():
+            api.abort(403, 'Admin privileges required')
+        try:
+            items = get_bulk_items()
         except ValueError as e:
             api.abort(400, str(e))
+        try:
+            return run_bulk(items, facade.create_amenities)
+        except IntegrityError:
+            # A concurrent request took one of the names first
+            api.abort(409, 'Some of these amenities were created concurrently, retry')
 
 
 @api.route('/<amenity_id>')
@@ -85,6 +126,7 @@ class AmenityResource(Resource):
 
     @api.doc('get_amenity')
     @api.response(200, 'Amenity details retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date sent')
     @api.response(404, 'Amenity not found')
     def get(self, amenity_id):
         """Get amenity details by ID"""
@@ -92,12 +134,8 @@ class AmenityResource(Resource):
         if not amenity:
             api.abort(404, 'Amenity not found')
 
-        return {
-            'id': amenity.id,
-            'name': amenity.name,
-            'created_at': amenity.created_at.isoformat(),
-            'updated_at': amenity.updated_at.isoformat()
-        }, 200
+        headers = conditional_headers(*resource_validators(amenity))
+        return serialize(AMENITY, amenity), 200, headers
 
     @api.doc('update_amenity')
     @api.expect(amenity_model, validate=True)
@@ -129,11 +167,6 @@ class AmenityResource(Resource):
 
         try:
             updated_amenity = facade.update_amenity(amenity_id, amenity_data)
-            return {
-                'id': updated_amenity.id,
-                'name': updated_amenity.name,
-                'created_at': updated_amenity.created_at.isoformat(),
-                'updated_at': updated_amenity.updated_at.isoformat()
-            }, 200
+            return serialize(AMENITY, updated_amenity), 200
         except ValueError as e:
             api.abort(400, str(e))
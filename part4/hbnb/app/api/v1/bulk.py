@@ -0,0 +1,79 @@
+"""
+Helpers of the bulk creation endpoints (POST /places/bulk, ...).
+
+A bulk request is a JSON list of items (or {"items": [...]}), each shaped
+like the body of the single-item POST. Valid items are created in one
+transaction; the response reports the outcome of every item:
+
+    {"created": 2, "failed": 1, "items": [
+        {"index": 0, "status": 201, "id": "..."},
+        {"index": 1, "status": 404, "error": "Owner not found"},
+        {"index": 2, "status": 201, "id": "..."}]}
+
+The status is 201 when every item was created, 207 when only some were,
+and the items' common error status (or 400) when none was.
+"""
+from flask import current_app, request
+
+
+def get_bulk_items():
+    """
+    Read the items of a bulk request.
+
+    Raises:
+        ValueError: if the body is not a non-empty list of at most
+            BULK_MAX_ITEMS items
+    """
+    items = request.get_json(silent=True)
+    if isinstance(items, dict):
+        items = items.get('items')
+    if not isinstance(items, list):
+        raise ValueError("body must be a JSON list of items")
+    if not items:
+        raise ValueError("at least one item is required")
+    max_items = current_app.config.get('BULK_MAX_ITEMS', 10000)
+    if len(items) > max_items:
+        raise ValueError(f"at most {max_items} items can be created at once")
+    return items
+
+
+def run_bulk(items, create, reject=None):
+    """
+    Create the items and build the response.
+
+    Args:
+        items: Items read by get_bulk_items()
+        create: Facade method taking a list of items and returning
+            (created, errors), see HBnBFacade.create_places()
+        reject: Optional callable returning (status, message) for an item
+            the caller may not create (e.g. someone else's place), or None
+
+    Returns:
+        (body, status) response tuple
+    """
+    errors, accepted = [], []
+    for index, item in enumerate(items):
+        problem = reject(item) if reject is not None and isinstance(item, dict) else None
+        if problem:
+            errors.append((index, *problem))
+        else:
+            accepted.append(index)
+
+    created, failed = create([items[index] for index in accepted]) if accepted else ([], [])
+    # Map the indexes of the accepted sub-list back to the request's
+    created = [(accepted[index], obj_id) for index, obj_id in created]
+    errors.extend((accepted[index], status, message) for index, status, message in failed)
+
+    results = [{'index': index, 'status': 201, 'id': obj_id} for index, obj_id in created]
+    results.extend({'index': index, 'status': status, 'error': message}
+                   for index, status, message in errors)
+    results.sort(key=lambda result: result['index'])
+
+    if not errors:
+        status = 201
+    elif created:
+        status = 207
+    else:
+        statuses = {status for _, status, _ in errors}
+        status = statuses.pop() if len(statuses) == 1 else 400
+    return {'created': len(created), 'failed': len(errors), 'items': results}, status
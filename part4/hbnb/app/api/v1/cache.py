@@ -0,0 +1,68 @@
+"""Cache statistics API endpoints for HBnB application"""
+from flask_restx import Namespace, Resource, fields
+from flask_jwt_extended import jwt_required, get_jwt
+from hbnb.app.extensions import identity_cache, response_cache
+
+api = Namespace('cache', description='Cache statistics')
+
+
+def is_admin():
+    """Helper function to check if the current user is an admin"""
+    claims = get_jwt()
+    return claims.get('is_admin', False)
+
+
+# Define the cache statistics response model
+cache_stats_model = api.model('CacheStats', {
+    'backend': fields.String(description='Cache backend: memory, filesystem or none'),
+    'entries': fields.Integer(description='Number of cached responses'),
+    'hits': fields.Integer(description='Lookups served from the cache by this process'),
+    'misses': fields.Integer(description='Lookups that had to build the response'),
+    'hit_ratio': fields.Float(description='hits / (hits + misses)')
+})
+
+
+@api.route('/stats')
+class CacheStats(Resource):
+    """Exposes the response cache counters"""
+
+    @api.doc('get_cache_stats')
+    @api.marshal_with(cache_stats_model)
+    @api.response(200, 'Cache statistics retrieved successfully')
+    @api.response(403, 'Admin privileges required')
+    @jwt_required()
+    def get(self):
+        """Get response cache hit/miss counters (requires admin privileges)"""
+        if not is_admin():
+            api.abort(403, 'Admin privileges required')
+        return response_cache.stats(), 200
+
+
+# Define the user lookup cache statistics response model
+user_cache_stats_model = api.model('UserCacheStats', {
+    'enabled': fields.Boolean(description='Whether USER_CACHE_TTL enables the cache'),
+    'entries': fields.Integer(description='Cached ids, emails and misses'),
+    'hits': fields.Integer(description='Lookups answered with a cached user'),
+    'negative_hits': fields.Integer(description='Lookups answered with a cached miss'),
+    'misses': fields.Integer(description='Lookups that queried the database'),
+    'hit_ratio': fields.Float(description='(hits + negative_hits) / lookups'),
+    'evictions': fields.Integer(description='Entries dropped by the LRU bound'),
+    'expirations': fields.Integer(description='Entries dropped after their TTL'),
+    'invalidations': fields.Integer(description='Entries dropped by user writes')
+})
+
+
+@api.route('/users')
+class UserCacheStats(Resource):
+    """Exposes the user lookup cache counters"""
+
+    @api.doc('get_user_cache_stats')
+    @api.marshal_with(user_cache_stats_model)
+    @api.response(200, 'Cache statistics retrieved successfully')
+    @api.response(403, 'Admin privileges required')
+    @jwt_required()
+    def get(self):
+        """Get user lookup cache counters of this process (requires admin privileges)"""
+        if not is_admin():
+            api.abort(403, 'Admin privileges required')
+        return identity_cache.stats(), 200
@@ -0,0 +1,70 @@
+"""
+Response caching for read endpoints, see hbnb.app.cache.
+
+A cached entry holds the encoded JSON body and the response headers
+(ETag, Last-Modified, pagination links), so a hit skips the database,
+serialization and JSON encoding, and still answers conditional requests
+with 304.
+"""
+import json
+from functools import wraps
+
+from flask import Response
+from flask_restx.utils import unpack
+from werkzeug.http import parse_date
+
+from hbnb.app.extensions import response_cache
+from hbnb.app.api.v1.conditional import conditional_headers
+
+
+def _encode(body, headers):
+    return json.dumps(headers).encode() + b'\n' + body
+
+
+def _decode(value):
+    headers, _, body = value.partition(b'\n')
+    return body, json.loads(headers)
+
+
+def cached(tags):
+    """
+    Serve a GET method from the response cache.
+
+    Args:
+        tags: Callable taking the method's URL arguments and returning the
+            tags the response depends on (e.g. ('places', 'users')), or
+            None to bypass the cache for this request (e.g. invalid
+            parameters, which the method then rejects)
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(resource, *args, **kwargs):
+            if not response_cache.enabled:
+                return method(resource, *args, **kwargs)
+            try:
+                request_tags = tags(*args, **kwargs)
+            except ValueError:
+                request_tags = None
+            if request_tags is None:
+                return method(resource, *args, **kwargs)
+
+            key = response_cache.key(request_tags)
+            value = response_cache.get(key)
+            if value is not None:
+                body, headers = _decode(value)
+                # Re-evaluate the client's validators against the cached ones
+                headers.update(conditional_headers(
+                    headers['ETag'].strip('"'), parse_date(headers['Last-Modified'])))
+                headers['X-Cache'] = 'HIT'
+                return Response(body, 200, headers, mimetype='application/json')
+
+            data, code, headers = unpack(method(resource, *args, **kwargs))
+            if code != 200:
+                return data, code, headers
+            headers = dict(headers or {})
+            body = json.dumps(data).encode()
+            response_cache.set(key, _encode(body, headers))
+            headers['X-Cache'] = 'MISS'
+            return Response(body, 200, headers, mimetype='application/json')
+        return wrapper
+    return decorator
@@ -0,0 +1,89 @@
+"""
+Conditional GET helpers for the v1 API.
+
+Every GET response carries a strong ETag and a Last-Modified header. A
+single resource is validated by its id and updated_at, a collection by the
+facade's version counters; both also include the version of any collection
+embedded in the payload (e.g. review authors) and the request path and query,
+since fields, embed and pagination change the representation.
+
+Endpoints compute the validators before loading relationships or
+serializing anything, and conditional_headers() answers 304 Not Modified
+right away when the client's copy is still current.
+"""
+import hashlib
+from datetime import timezone
+
+from flask import request
+from werkzeug.exceptions import abort
+from werkzeug.http import http_date
+from werkzeug.wrappers import Response
+
+
+def _etag(*parts):
+    data = '\x1f'.join(str(part) for part in (request.full_path, *parts))
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+def resource_validators(obj, versions=()):
+    """
+    Validators of a single object.
+
+    Args:
+        obj: Model instance with id and updated_at
+        versions: (token, last change) pairs of the collections embedded in it
+
+    Returns:
+        Tuple of (etag, last_modified)
+    """
+    etag = _etag(obj.id, obj.updated_at.isoformat(), *(token for token, _ in versions))
+    last_modified = max([obj.updated_at, *(modified for _, modified in versions)])
+    return etag, last_modified
+
+
+def collection_validators(versions):
+    """
+    Validators of a collection response.
+
+    Args:
+        versions: (token, last change) pairs of the collections it is built from
+
+    Returns:
+        Tuple of (etag, last_modified)
+    """
+    etag = _etag(*(token for token, _ in versions))
+    last_modified = max(modified for _, modified in versions)
+    return etag, last_modified
+
+
+def conditional_headers(etag, last_modified):
+    """
+    Evaluate If-None-Match / If-Modified-Since against the validators.
+
+    If-None-Match takes precedence; If-Modified-Since is only used when the
+    client sent no ETag.
+
+    Returns:
+        The ETag, Last-Modified and Cache-Control headers to send with the response
+
+    Raises:
+        HTTPException: 304 Not Modified when the client's copy is current
+    """
+    last_modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+    headers = {
+        'ETag': f'"{etag}"',
+        'Last-Modified': http_date(last_modified),
+        # Clients may keep the response but must revalidate it on every use
+        'Cache-Control': 'no-cache',
+    }
+
+    if request.if_none_match:
+        fresh = request.if_none_match.contains_weak(etag)
+    elif request.if_modified_since:
+        fresh = last_modified <= request.if_modified_since
+    else:
+        fresh = False
+
+    if fresh:
+        abort(Response(status=304, headers=headers))
+    return headers
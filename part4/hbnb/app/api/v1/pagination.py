@@ -0,0 +1,78 @@
+"""Keyset pagination helpers shared by the collection endpoints"""
+import base64
+import json
+from datetime import datetime
+from urllib.parse import urlencode
+
+from flask import request
+
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(key):
+    """Encode a (sort value, id) key into an opaque cursor string"""
+    value, obj_id = key
+    if isinstance(value, datetime):
+        payload = ['d', value.isoformat(), obj_id]
+    else:
+        payload = ['v', value, obj_id]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor string back into a (sort value, id) key"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        tag, value, obj_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if tag == 'd':
+            value = datetime.fromisoformat(value)
+        elif tag != 'v':
+            raise ValueError(tag)
+        return value, obj_id
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("cursor is invalid")
+
+
+def get_page_args():
+    """
+    Read the limit and cursor query parameters.
+
+    Returns:
+        (limit, after) tuple, or None when the client did not ask for paging
+
+    Raises:
+        ValueError: if limit or cursor is malformed
+    """
+    limit = request.args.get('limit')
+    cursor = request.args.get('cursor')
+    if limit is None and cursor is None:
+        return None
+
+    if limit is None:
+        limit = MAX_PAGE_SIZE
+    else:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValueError("limit must be an integer")
+        if not (1 <= limit <= MAX_PAGE_SIZE):
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    after = decode_cursor(cursor) if cursor else None
+    return limit, after
+
+
+def next_page_headers(next_key, limit):
+    """Build the Link/X-Next-Cursor headers pointing at the next page"""
+    if next_key is None:
+        return {}
+    cursor = encode_cursor(next_key)
+    args = request.args.to_dict(flat=False)
+    args['limit'] = [str(limit)]
+    args['cursor'] = [cursor]
+    url = f"{request.base_url}?{urlencode(args, doseq=True)}"
+    return {
+        'Link': f'<{url}>; rel="next"',
+        'X-Next-Cursor': cursor,
+    }
@@ -3,6 +3,20 @@ from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from flask import request
 from hbnb.app.services.facade import HBnBFacade
+from hbnb.app.services.repositories.place_repository import PlaceRepository
+from hbnb.app.persistence.spatial import MAX_RADIUS_KM
+from hbnb.app.api.v1.pagination import MAX_PAGE_SIZE, get_page_args, next_page_headers
+from hbnb.app.api.v1.conditional import (
+    collection_validators, conditional_headers, resource_validators,
+)
+from hbnb.app.api.v1.caching import cached
+from hbnb.app.api.v1.bulk import get_bulk_items, run_bulk
+from hbnb.app.api.v1.serializers import (
+    PLACE_CARD, PLACE_EMBEDS, PLACE_FIELD_COLUMNS, PLACE_WRITE,
+    place_columns, place_plan, serialize, serialize_many,
+)
+import logging
+import math
 import os
 from werkzeug.utils import secure_filename
 
@@ -10,12 +24,145 @@ api = Namespace('places', description='Place operations')
 
 facade = HBnBFacade()
 
+logger = logging.getLogger(__name__)
+
 
 def is_admin():
     """Helper function to check if the current user is an admin"""
     claims = get_jwt()
     return claims.get('is_admin', False)
 
+
+def _parse_float(name, value):
+    """Parse a finite float query parameter, raising ValueError with the field name"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number")
+    # float() also accepts nan and inf, which no filter can match
+    if not math.isfinite(number):
+        raise ValueError(f"{name} must be a finite number")
+    return number
+
+
+def resolve_amenities(amenity_ids):
+    """
+    Load the amenities of a payload with one query, in payload order.
+
+    Aborts with 404 on the first unknown ID.
+    """
+    found = facade.get_amenities(amenity_ids)
+    for amenity_id in amenity_ids:
+        if amenity_id not in found:
+            api.abort(404, f'Amenity with ID {amenity_id} not found')
+    return [found[amenity_id] for amenity_id in dict.fromkeys(amenity_ids)]
+
+
+def get_search_args():
+    """
+    Read the place search query parameters.
+
+    Returns:
+        (filters, sort) where filters only holds the parameters that were given
+        and sort is None when not requested
+
+    Raises:
+        ValueError: if a parameter is malformed
+    """
+    args = request.args
+    filters = {}
+
+    for name in ('min_price', 'max_price'):
+        if args.get(name):
+            filters[name] = _parse_float(name, args[name])
+
+    if args.get('bbox'):
+        parts = args['bbox'].strip('()').split(',')
+        if len(parts) != 4:
+            raise ValueError("bbox must be lat1,lon1,lat2,lon2")
+        lat1, lon1, lat2, lon2 = (_parse_float('bbox', part) for part in parts)
+        if not (-90 <= lat1 <= 90 and -90 <= lat2 <= 90):
+            raise ValueError("bbox latitudes must be between -90 and 90")
+        if not (-180 <= lon1 <= 180 and -180 <= lon2 <= 180):
+            raise ValueError("bbox longitudes must be between -180 and 180")
+        filters['bbox'] = (lat1, lon1, lat2, lon2)
+
+    if args.get('amenities'):
+        filters['amenities'] = [a for a in args['amenities'].split(',') if a]
+
+    sort = args.get('sort') or None
+    if sort is not None and sort.lstrip('-') not in PlaceRepository.SORTABLE_FIELDS:
+        raise ValueError(
+            f"sort must be one of {', '.join(PlaceRepository.SORTABLE_FIELDS)}")
+
+    return filters, sort
+
+
+def _parse_names(name, allowed):
+    """Parse a comma-separated list query parameter of allowed names"""
+    names = tuple(dict.fromkeys(n.strip() for n in request.args[name].split(',') if n.strip()))
+    if not names and name == 'fields':
+        raise ValueError("fields must name at least one field")
+    unknown = [n for n in names if n not in allowed]
+    if unknown:
+        raise ValueError(
+            f"unknown {name}: {', '.join(unknown)} (allowed: {', '.join(allowed)})")
+    return names
+
+
+# Collections each embeddable relationship is read from
+EMBED_COLLECTIONS = {
+    'owner': ('users',),
+    'amenities': ('amenities',),
+    'reviews': ('reviews', 'users'),
+}
+
+
+def embedded_collections(embed):
+    """Names of the collections read by the embedded relationships"""
+    return tuple(dict.fromkeys(name for rel in embed for name in EMBED_COLLECTIONS[rel]))
+
+
+def embedded_versions(embed):
+    """Versions of the collections read by the embedded relationships"""
+    return facade.get_collection_versions(*embedded_collections(embed))
+
+
+def place_list_cache_tags():
+    """Response cache tags of the place listing"""
+    _, embed = get_sparse_args()
+    return ('places', *embedded_collections(embed))
+
+
+def place_cache_tags(place_id):
+    """Response cache tags of a single place"""
+    _, embed = get_sparse_args()
+    # Review changes are tagged with the place they belong to
+    return (f'place:{place_id}', 'place:*',
+            *(name for name in embedded_collections(embed) if name != 'reviews'))
+
+
+def get_sparse_args():
+    """
+    Read the fields and embed query parameters of the place endpoints.
+
+    Without either parameter every field and relationship is returned. With
+    fields only, relationships are left out unless also listed in embed.
+
+    Returns:
+        (fields, embed) where fields is None for all fields
+
+    Raises:
+        ValueError: if a name is unknown or fields is empty
+    """
+    fields = _parse_names('fields', PLACE_FIELD_COLUMNS) if 'fields' in request.args else None
+    if 'embed' in request.args:
+        embed = _parse_names('embed', PLACE_EMBEDS)
+    else:
+        embed = PLACE_EMBEDS if fields is None else ()
+    return fields, embed
+
+
 # Define the place model for input validation
 place_model = api.model('Place', {
     'title': fields.String(required=True, description='Place title', min_length=1, max_length=100),
@@ -48,6 +195,9 @@ place_response_model = api.model('PlaceResponse', {
         'id': fields.String(description='Amenity ID'),
         'name': fields.String(description='Amenity name')
     }))),
+    'review_count': fields.Integer(description='Number of reviews'),
+    'rating_average': fields.Float(description='Average rating'),
+    'rating_histogram': fields.Raw(description='Number of reviews per star (1-5)'),
     'created_at': fields.String(description='Creation date'),
     'updated_at': fields.String(description='Last update date')
 })
@@ -58,66 +208,45 @@ class PlaceList(Resource):
     """Handles operations on the place collection"""
 
     @api.doc('list_places')
+    @api.param('limit', 'Maximum number of places per page', type=int)
+    @api.param('cursor', 'Opaque cursor from the previous page')
+    @api.param('min_price', 'Minimum price per night', type=float)
+    @api.param('max_price', 'Maximum price per night', type=float)
+    @api.param('bbox', 'Bounding box as lat1,lon1,lat2,lon2 (south-west, north-east)')
+    @api.param('amenities', 'Comma-separated amenity IDs the place must all have')
+    @api.param('sort', 'Sort field: created_at, price, title or rating, prefix with - for descending')
+    @api.param('fields', 'Comma-separated place fields to return, e.g. id,title,price')
+    @api.param('embed', 'Comma-separated relationships to include: owner, amenities, reviews')
     @api.response(200, 'List of places retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date sent')
+    @api.response(400, 'Invalid search or pagination parameters')
+    @cached(place_list_cache_tags)
     def get(self):
-        """Get list of all places"""
-        places = facade.get_all_places()
-        result = []
-        for place in places:
-            place_dict = {
-                'id': place.id,
-                'title': place.title,
-                'description': place.description,
-                'price': place.price,
-                'latitude': place.latitude,
-                'longitude': place.longitude,
-                'location': getattr(place, 'location', ''),
-                'owner_id': place.owner_id,
-                'amenities': [
-                    {'id': amenity.id, 'name': amenity.name}
-                    for amenity in place.amenities
-                ],
-                'reviews': [],
-                'created_at': place.created_at.isoformat(),
-                'updated_at': place.updated_at.isoformat()
-            }
-            
-            # Safely get owner details
-            try:
-                if hasattr(place, 'owner') and place.owner:
-                    place_dict['owner'] = {
-                        'id': place.owner_id,
-                        'first_name': place.owner.first_name,
-                        'last_name': place.owner.last_name,
-                        'email': place.owner.email
-                    }
-                else:
-                    place_dict['owner'] = None
-            except:
-                place_dict['owner'] = None
-            
-            # Safely get reviews
+        """Get list of all places, optionally filtered and paginated"""
+        try:
+            page = get_page_args()
+            filters, sort = get_search_args()
+            fields, embed = get_sparse_args()
+        except ValueError as e:
+            api.abort(400, str(e))
+
+        versions = facade.get_collection_versions('places') + embedded_versions(embed)
+        headers = conditional_headers(*collection_validators(versions))
+
+        columns = place_columns(fields)
+        if page is None and not filters and sort is None:
+            places = facade.get_all_places_with_relations(embed, columns)
+        else:
+            limit, after = page or (None, None)
             try:
-                place_dict['reviews'] = [
-                    {
-                        'id': review.id,
-                        'text': review.text,
-                        'rating': review.rating,
-                        'user_id': getattr(review.user, 'id', getattr(review, 'user_id', None)),
-                        'user': {
-                            'id': review.user.id,
-                            'first_name': review.user.first_name,
-                            'last_name': review.user.last_name
-                        } if hasattr(review, 'user') and review.user else None
-                    }
-                    for review in place.reviews
-                ]
-            except:
-                place_dict['reviews'] = []
-            
-            result.append(place_dict)
-        
-        return result
+                places, next_key = facade.search_places(
+                    filters, sort or 'created_at', limit, after, embed, columns)
+            except ValueError as e:
+                api.abort(400, str(e))
+            if limit is not None:
+                headers.update(next_page_headers(next_key, limit))
+
+        return serialize_many(place_plan(fields, embed), places), 200, headers
 
     @api.doc('create_place')
     @api.expect(place_model, validate=True)
@@ -142,109 +271,74 @@ class PlaceList(Resource):
         if not owner:
             api.abort(404, 'Owner not found')
 
-        # Validate amenities if provided
-        amenity_ids = place_data.get('amenities', [])
-        amenities = []
-        for amenity_id in amenity_ids:
-            amenity = facade.get_amenity(amenity_id)
-            if not amenity:
-                api.abort(404, f'Amenity with ID {amenity_id} not found')
-            amenities.append(amenity)
+        # Validate amenities if provided; the facade reuses the loaded ones
+        amenities = resolve_amenities(place_data.get('amenities') or [])
 
         try:
-            new_place = facade.create_place(place_data)
-            return {
-                'id': new_place.id,
-                'title': new_place.title,
-                'description': new_place.description,
-                'price': new_place.price,
-                'latitude': new_place.latitude,
-                'longitude': new_place.longitude,
-                'location': getattr(new_place, 'location', ''),
-                'owner_id': new_place.owner.id,
-                'owner': {
-                    'id': new_place.owner.id,
-                    'first_name': new_place.owner.first_name,
-                    'last_name': new_place.owner.last_name,
-                    'email': new_place.owner.email
-                },
-                'amenities': [
-                    {'id': amenity.id, 'name': amenity.name}
-                    for amenity in new_place.amenities
-                ],
-                'created_at': new_place.created_at.isoformat(),
-                'updated_at': new_place.updated_at.isoformat()
-            }, 201
+            new_place = facade.create_place(place_data, amenities)
+            return serialize(PLACE_WRITE, new_place), 201
         except ValueError as e:
             api.abort(400, str(e))
 
 
+@api.route('/bulk')
+class PlaceBulk(Resource):
+    """Creates many places in one request"""
+
+    @api.doc('create_places_bulk')
+    @api.expect([place_model])
+    @api.response(201, 'All places created')
+    @api.response(207, 'Some places created, see the status of each item')
+    @api.response(400, 'Invalid body, or no place could be created')
+    @api.response(401, 'Unauthorized')
+    @jwt_required()
+    def post(self):
+        """Create many places in one transaction (requires authentication)"""
+        try:
+            items = get_bulk_items()
+        except ValueError as e:
+            api.abort(400, str(e))
+
+        current_user_id = get_jwt_identity()
+        admin = is_admin()
+
+        def reject(item):
+            # Only admins may create places for other users
+            if not admin and item.get('owner_id', current_user_id) != current_user_id:
+                return 401, 'Unauthorized: You can only create places for yourself'
+            return None
+
+        return run_bulk(items, facade.create_places, reject)
+
+
 @api.route('/<place_id>')
 @api.param('place_id', 'The place identifier')
 class PlaceResource(Resource):
     """Handles operations on a single place"""
 
     @api.doc('get_place')
+    @api.param('fields', 'Comma-separated place fields to return, e.g. id,title,price')
+    @api.param('embed', 'Comma-separated relationships to include: owner, amenities, reviews')
     @api.response(200, 'Place details retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date sent')
+    @api.response(400, 'Invalid fields or embed parameter')
     @api.response(404, 'Place not found')
+    @cached(place_cache_tags)
     def get(self, place_id):
         """Get place details by ID"""
+        try:
+            fields, embed = get_sparse_args()
+        except ValueError as e:
+            api.abort(400, str(e))
+
+        # Validate on the bare place; relationships are only loaded for a 200
         place = facade.get_place(place_id)
         if not place:
             api.abort(404, 'Place not found')
+        headers = conditional_headers(*resource_validators(place, embedded_versions(embed)))
 
-        result = {
-            'id': place.id,
-            'title': place.title,
-            'description': place.description,
-            'price': place.price,
-            'latitude': place.latitude,
-            'longitude': place.longitude,
-            'location': getattr(place, 'location', ''),
-            'owner_id': place.owner_id,
-            'amenities': [
-                {'id': amenity.id, 'name': amenity.name}
-                for amenity in place.amenities
-            ],
-            'reviews': [],
-            'created_at': place.created_at.isoformat(),
-            'updated_at': place.updated_at.isoformat()
-        }
-        
-        # Safely get owner details
-        try:
-            if hasattr(place, 'owner') and place.owner:
-                result['owner'] = {
-                    'id': place.owner_id,
-                    'first_name': place.owner.first_name,
-                    'last_name': place.owner.last_name,
-                    'email': place.owner.email
-                }
-            else:
-                result['owner'] = None
-        except:
-            result['owner'] = None
-        
-        # Safely get reviews
-        try:
-            result['reviews'] = [
-                {
-                    'id': review.id,
-                    'text': review.text,
-                    'rating': review.rating,
-                    'user_id': getattr(review.user, 'id', getattr(review, 'user_id', None)),
-                    'user': {
-                        'id': review.user.id,
-                        'first_name': review.user.first_name,
-                        'last_name': review.user.last_name
-                    } if hasattr(review, 'user') and review.user else None
-                }
-                for review in place.reviews
-            ]
-        except:
-            result['reviews'] = []
-
-        return result
+        place = facade.get_place_with_relations(place_id, embed, place_columns(fields))
+        return serialize(place_plan(fields, embed), place), 200, headers
 
     @api.doc('update_place')
     @api.expect(place_model, validate=True)
@@ -265,12 +359,8 @@ class PlaceResource(Resource):
         if not existing_place:
             api.abort(404, 'Place not found')
         
-        # Debug: print the IDs for troubleshooting
-        print(f"\n[DEBUG] Update Place:")
-        print(f"  Current User ID (from token): {current_user_id}")
-        print(f"  Place Owner ID: {existing_place.owner.id}")
-        print(f"  Match: {existing_place.owner.id == current_user_id}")
-        print(f"  Is Admin: {is_admin()}")
+        logger.debug("Update place %s: user %s, owner %s",
+                     place_id, current_user_id, existing_place.owner_id)
         
         # Check if the current user is the owner of the place or is admin
         if str(existing_place.owner.id) != str(current_user_id) and not is_admin():
@@ -282,38 +372,14 @@ class PlaceResource(Resource):
             if not owner:
                 api.abort(404, 'Owner not found')
 
-        # Validate amenities if being updated
+        # Validate amenities if being updated; the facade reuses the loaded ones
+        amenities = None
         if 'amenities' in place_data:
-            amenity_ids = place_data['amenities']
-            for amenity_id in amenity_ids:
-                amenity = facade.get_amenity(amenity_id)
-                if not amenity:
-                    api.abort(404, f'Amenity with ID {amenity_id} not found')
+            amenities = resolve_amenities(place_data['amenities'])
 
         try:
-            updated_place = facade.update_place(place_id, place_data)
-            return {
-                'id': updated_place.id,
-                'title': updated_place.title,
-                'description': updated_place.description,
-                'price': updated_place.price,
-                'latitude': updated_place.latitude,
-                'longitude': updated_place.longitude,
-                'location': getattr(updated_place, 'location', ''),
-                'owner_id': updated_place.owner.id,
-                'owner': {
-                    'id': updated_place.owner.id,
-                    'first_name': updated_place.owner.first_name,
-                    'last_name': updated_place.owner.last_name,
-                    'email': updated_place.owner.email
-                },
-                'amenities': [
-                    {'id': amenity.id, 'name': amenity.name}
-                    for amenity in updated_place.amenities
-                ],
-                'created_at': updated_place.created_at.isoformat(),
-                'updated_at': updated_place.updated_at.isoformat()
-            }, 200
+            updated_place = facade.update_place(place_id, place_data, amenities)
+            return serialize(PLACE_WRITE, updated_place), 200
         except ValueError as e:
             api.abort(400, str(e))
     
@@ -337,10 +403,103 @@ class PlaceResource(Resource):
             api.abort(403, 'Unauthorized: You can only delete your own places')
         
         # Delete the place
-        facade.place_repo.delete(place_id)
+        facade.delete_place(place_id)
         return {'message': 'Place deleted successfully'}, 200
 
 
+def get_geo_args():
+    """
+    Read and validate the lat/lon query parameters of the geo endpoints.
+
+    Raises:
+        ValueError: if a coordinate is missing or out of range
+    """
+    args = request.args
+    if not args.get('lat') or not args.get('lon'):
+        raise ValueError("lat and lon are required")
+    latitude = _parse_float('lat', args['lat'])
+    longitude = _parse_float('lon', args['lon'])
+    if not (-90 <= latitude <= 90):
+        raise ValueError("lat must be between -90 and 90")
+    if not (-180 <= longitude <= 180):
+        raise ValueError("lon must be between -180 and 180")
+    return latitude, longitude
+
+
+def _parse_count(name, default):
+    """Parse a positive count query parameter capped at MAX_PAGE_SIZE"""
+    value = request.args.get(name)
+    if not value:
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+    if not (1 <= value <= MAX_PAGE_SIZE):
+        raise ValueError(f"{name} must be between 1 and {MAX_PAGE_SIZE}")
+    return value
+
+
+def ranked_places_to_list(ranked):
+    """Serialize (place, distance_km) pairs, nearest first"""
+    result = []
+    for place, distance in ranked:
+        place_dict = serialize(PLACE_CARD, place)
+        place_dict['distance_km'] = round(distance, 3)
+        result.append(place_dict)
+    return result
+
+
+@api.route('/nearby')
+class PlaceNearby(Resource):
+    """Handles radius searches around a coordinate"""
+
+    @api.doc('list_places_nearby')
+    @api.param('lat', 'Latitude of the search center', type=float, required=True)
+    @api.param('lon', 'Longitude of the search center', type=float, required=True)
+    @api.param('radius_km', 'Search radius in kilometers', type=float, required=True)
+    @api.param('limit', 'Maximum number of places to return', type=int)
+    @api.response(200, 'Places within the radius, nearest first')
+    @api.response(400, 'Invalid search parameters')
+    def get(self):
+        """Get places within a radius of a coordinate, nearest first"""
+        try:
+            latitude, longitude = get_geo_args()
+            if not request.args.get('radius_km'):
+                raise ValueError("radius_km is required")
+            radius_km = _parse_float('radius_km', request.args['radius_km'])
+            if not (0 < radius_km <= MAX_RADIUS_KM):
+                raise ValueError(f"radius_km must be between 0 and {MAX_RADIUS_KM:.0f}")
+            limit = _parse_count('limit', 20)
+        except ValueError as e:
+            api.abort(400, str(e))
+
+        ranked = facade.get_places_nearby(latitude, longitude, radius_km, limit)
+        return ranked_places_to_list(ranked), 200
+
+
+@api.route('/nearest')
+class PlaceNearest(Resource):
+    """Handles k-nearest searches around a coordinate"""
+
+    @api.doc('list_nearest_places')
+    @api.param('lat', 'Latitude of the search center', type=float, required=True)
+    @api.param('lon', 'Longitude of the search center', type=float, required=True)
+    @api.param('k', 'Number of places to return', type=int)
+    @api.response(200, 'The k nearest places, nearest first')
+    @api.response(400, 'Invalid search parameters')
+    def get(self):
+        """Get the k places nearest to a coordinate"""
+        try:
+            latitude, longitude = get_geo_args()
+            k = _parse_count('k', 10)
+        except ValueError as e:
+            api.abort(400, str(e))
+
+        ranked = facade.get_nearest_places(latitude, longitude, k)
+        return ranked_places_to_list(ranked), 200
+
+
 @api.route('/upload-image')
 class PlaceImageUpload(Resource):
     """Handles place image upload"""
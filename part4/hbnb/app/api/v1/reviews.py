@@ -1,12 +1,23 @@
 """Review API endpoints for HBnB application"""
+import logging
+
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from sqlalchemy.exc import IntegrityError
 from hbnb.app.services.facade import HBnBFacade
+from hbnb.app.api.v1.pagination import get_page_args, next_page_headers
+from hbnb.app.api.v1.conditional import (
+    collection_validators, conditional_headers, resource_validators,
+)
+from hbnb.app.api.v1.serializers import PLACE_REVIEW, REVIEW, serialize, serialize_many
+from hbnb.app.api.v1.bulk import get_bulk_items, run_bulk
 
 api = Namespace('reviews', description='Review operations')
 
 facade = HBnBFacade()
 
+logger = logging.getLogger(__name__)
+
 
 def is_admin():
     """Helper function to check if the current user is an admin"""
@@ -42,27 +53,30 @@ class ReviewList(Resource):
     """Handles operations on the review collection"""
 
     @api.doc('list_reviews')
+    @api.param('limit', 'Maximum number of reviews per page', type=int)
+    @api.param('cursor', 'Opaque cursor from the previous page')
     @api.response(200, 'List of reviews retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date sent')
+    @api.response(400, 'Invalid pagination parameters')
     def get(self):
         """Get list of all reviews"""
-        reviews = facade.get_all_reviews()
-        return [
-            {
-                'id': review.id,
-                'text': review.text,
-                'rating': review.rating,
-                'user_id': review.user.id,
-                'place_id': review.place.id,
-                'user': {
-                    'id': review.user.id,
-                    'first_name': review.user.first_name,
-                    'last_name': review.user.last_name
-                },
-                'created_at': review.created_at.isoformat(),
-                'updated_at': review.updated_at.isoformat()
-            }
-            for review in reviews
-        ], 200
+        try:
+            page = get_page_args()
+        except ValueError as e:
+            api.abort(400, str(e))
+
+        # Reviews embed their author
+        versions = facade.get_collection_versions('reviews', 'users')
+        headers = conditional_headers(*collection_validators(versions))
+
+        if page is None:
+            reviews = facade.get_all_reviews()
+        else:
+            limit, after = page
+            reviews, next_key = facade.get_reviews_page(limit, after)
+            headers.update(next_page_headers(next_key, limit))
+
+        return serialize_many(REVIEW, reviews), 200, headers
 
     @api.doc('create_review')
     @api.expect(review_model, validate=True)
@@ -76,12 +90,10 @@ class ReviewList(Resource):
         """Create a new review (requires authentication)"""
         review_data = api.payload
         
-        print(f"\n🔍 DEBUG - Review submission:")
-        print(f"  Payload: {review_data}")
-        
         # Get the current user from JWT token
         current_user_id = get_jwt_identity()
-        print(f"  Current user ID: {current_user_id}")
+        logger.debug("Review submission by user %s for place %s",
+                     current_user_id, review_data.get('place_id'))
         
         # Add user_id from JWT token (don't trust client input)
         review_data['user_id'] = current_user_id
@@ -89,56 +101,67 @@ class ReviewList(Resource):
         # Validate user exists
         user = facade.get_user(current_user_id)
         if not user:
-            print(f"  ❌ User not found: {current_user_id}")
+            logger.debug("Review rejected: user %s not found", current_user_id)
             api.abort(404, 'User not found')
-        print(f"  ✓ User found: {user.email}")
 
         # Validate place exists
         place_id = review_data['place_id']
-        print(f"  Looking for place ID: {place_id}")
-        
-        # Debug: Print all places in repository
-        all_places = facade.get_all_places()
-        print(f"  Total places in repository: {len(all_places)}")
-        for p in all_places:
-            print(f"    - Place: {p.title} (ID: {p.id})")
-        
         place = facade.get_place(place_id)
         if not place:
-            print(f"  ❌ Place not found: {place_id}")
+            logger.debug("Review rejected: place %s not found", place_id)
             api.abort(404, 'Place not found')
-        print(f"  ✓ Place found: {place.title}")
         
         # Prevent users from reviewing their own places (use owner_id to avoid detached instance error)
         if place.owner_id == current_user_id:
             api.abort(403, 'You cannot review your own place')
         
         # Prevent duplicate reviews - check if user already reviewed this place
-        existing_reviews = facade.get_reviews_by_place(review_data['place_id'])
-        for review in existing_reviews:
-            if review.user.id == current_user_id:
-                api.abort(403, 'You have already reviewed this place')
+        if facade.has_user_reviewed(current_user_id, place_id):
+            api.abort(403, 'You have already reviewed this place')
 
         try:
             new_review = facade.create_review(review_data)
-            return {
-                'id': new_review.id,
-                'text': new_review.text,
-                'rating': new_review.rating,
-                'user_id': new_review.user.id,
-                'place_id': new_review.place.id,
-                'user': {
-                    'id': new_review.user.id,
-                    'first_name': new_review.user.first_name,
-                    'last_name': new_review.user.last_name
-                },
-                'created_at': new_review.created_at.isoformat(),
-                'updated_at': new_review.updated_at.isoformat()
-            }, 201
+            return serialize(REVIEW, new_review), 201
+        except IntegrityError:
+            # A concurrent submission won the race on the unique index
+            api.abort(403, 'You have already reviewed this place')
         except ValueError as e:
             api.abort(400, str(e))
 
 
+@api.route('/bulk')
+class ReviewBulk(Resource):
+    """Creates many reviews in one request"""
+
+    @api.doc('create_reviews_bulk')
+    @api.expect([review_model])
+    @api.response(201, 'All reviews created')
+    @api.response(207, 'Some reviews created, see the status of each item')
+    @api.response(400, 'Invalid body, or no review could be created')
+    @api.response(401, 'Unauthorized')
+    @api.response(409, 'A review was created concurrently, nothing was created')
+    @jwt_required()
+    def post(self):
+        """Create many reviews in one transaction (requires authentication)"""
+        try:
+            items = get_bulk_items()
+        except ValueError as e:
+            api.abort(400, str(e))
+
+        # Reviews are written by the caller; admins may name another author
+        current_user_id = get_jwt_identity()
+        admin = is_admin()
+        for item in items:
+            if isinstance(item, dict) and (not admin or not item.get('user_id')):
+                item['user_id'] = current_user_id
+
+        try:
+            return run_bulk(items, facade.create_reviews)
+        except IntegrityError:
+            # A concurrent submission won the race on the unique index
+            api.abort(409, 'Some of these reviews were created concurrently, retry')
+
+
 @api.route('/<review_id>')
 @api.param('review_id', 'The review identifier')
 class ReviewResource(Resource):
@@ -146,6 +169,7 @@ class ReviewResource(Resource):
 
     @api.doc('get_review')
     @api.response(200, 'Review details retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date sent')
     @api.response(404, 'Review not found')
     def get(self, review_id):
         """Get review details by ID"""
@@ -153,20 +177,9 @@ class ReviewResource(Resource):
         if not review:
             api.abort(404, 'Review not found')
 
-        return {
-            'id': review.id,
-            'text': review.text,
-            'rating': review.rating,
-            'user_id': review.user.id,
-            'place_id': review.place.id,
-            'user': {
-                'id': review.user.id,
-                'first_name': review.user.first_name,
-                'last_name': review.user.last_name
-            },
-            'created_at': review.created_at.isoformat(),
-            'updated_at': review.updated_at.isoformat()
-        }, 200
+        versions = facade.get_collection_versions('users')
+        headers = conditional_headers(*resource_validators(review, versions))
+        return serialize(REVIEW, review), 200, headers
 
     @api.doc('update_review')
     @api.expect(review_model, validate=True)
@@ -187,12 +200,8 @@ class ReviewResource(Resource):
         if not existing_review:
             api.abort(404, 'Review not found')
         
-        # Debug: print the IDs for troubleshooting
-        print(f"\n[DEBUG] Update Review:")
-        print(f"  Current User ID (from token): {current_user_id}")
-        print(f"  Review Author ID: {existing_review.user.id}")
-        print(f"  Match: {existing_review.user.id == current_user_id}")
-        print(f"  Is Admin: {is_admin()}")
+        logger.debug("Update review %s: user %s, author %s",
+                     review_id, current_user_id, existing_review.user_id)
         
         # Check if the current user is the author of the review or is admin
         if str(existing_review.user.id) != str(current_user_id) and not is_admin():
@@ -209,23 +218,13 @@ class ReviewResource(Resource):
             place = facade.get_place(review_data['place_id'])
             if not place:
                 api.abort(404, 'Place not found')
+            if (place.id != existing_review.place_id and
+                    facade.has_user_reviewed(existing_review.user_id, place.id)):
+                api.abort(403, 'You have already reviewed this place')
 
         try:
             updated_review = facade.update_review(review_id, review_data)
-            return {
-                'id': updated_review.id,
-                'text': updated_review.text,
-                'rating': updated_review.rating,
-                'user_id': updated_review.user.id,
-                'place_id': updated_review.place.id,
-                'user': {
-                    'id': updated_review.user.id,
-                    'first_name': updated_review.user.first_name,
-                    'last_name': updated_review.user.last_name
-                },
-                'created_at': updated_review.created_at.isoformat(),
-                'updated_at': updated_review.updated_at.isoformat()
-            }, 200
+            return serialize(REVIEW, updated_review), 200
         except ValueError as e:
             api.abort(400, str(e))
 
@@ -258,6 +257,7 @@ class PlaceReviewList(Resource):
 
     @api.doc('get_place_reviews')
     @api.response(200, 'List of reviews for the place retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date sent')
     @api.response(404, 'Place not found')
     def get(self, place_id):
         """Get all reviews for a specific place"""
@@ -265,20 +265,8 @@ class PlaceReviewList(Resource):
         if not place:
             api.abort(404, 'Place not found')
 
+        versions = facade.get_collection_versions('reviews', 'users')
+        headers = conditional_headers(*collection_validators(versions))
+
         reviews = facade.get_reviews_by_place(place_id)
-        return [
-            {
-                'id': review.id,
-                'text': review.text,
-                'rating': review.rating,
-                'user_id': review.user.id,
-                'user': {
-                    'id': review.user.id,
-                    'first_name': review.user.first_name,
-                    'last_name': review.user.last_name
-                },
-                'created_at': review.created_at.isoformat(),
-                'updated_at': review.updated_at.isoformat()
-            }
-            for review in reviews
-        ], 200
+        return serialize_many(PLACE_REVIEW, reviews), 200, headers
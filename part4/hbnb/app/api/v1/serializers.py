@@ -0,0 +1,250 @@
+"""
+Response serializers for the v1 API.
+
+Each output shape is compiled once, at import time, into a flat plan: the
+plain attributes are fetched together by one operator.itemgetter over the
+instance __dict__ (where SQLAlchemy keeps loaded values), and the remaining
+fields are small precompiled accessors. Serializing an object is then a zip
+plus a few calls, with no per-field getattr/hasattr probing. Objects with
+unloaded attributes fall back to regular attribute access.
+"""
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+
+
+class Plan:
+    """A compiled output shape, see compile_plan()"""
+
+    __slots__ = ('keys', 'fetch', 'fetch_slow', 'computed')
+
+    def __init__(self, keys, names, computed):
+        self.keys = keys
+        # itemgetter/attrgetter return a bare value for a single name
+        padded = names + ('id',) if len(names) == 1 else names
+        self.fetch = itemgetter(*padded) if padded else (lambda d: ())
+        self.fetch_slow = attrgetter(*padded) if padded else (lambda o: ())
+        self.computed = computed
+
+
+def compile_plan(fields):
+    """
+    Compile (key, source) pairs into a serialization plan.
+
+    A source is either an attribute name, read directly, or a callable
+    taking the object being serialized.
+    """
+    keys, names, computed = [], [], []
+    for key, source in fields:
+        if isinstance(source, str):
+            keys.append(key)
+            names.append(source)
+        else:
+            computed.append((key, source))
+    return Plan(tuple(keys), tuple(names), tuple(computed))
+
+
+def serialize(plan, obj):
+    """Apply a compiled plan to one object"""
+    try:
+        values = plan.fetch(obj.__dict__)
+    except KeyError:
+        values = plan.fetch_slow(obj)
+    result = dict(zip(plan.keys, values))
+    for key, get in plan.computed:
+        result[key] = get(obj)
+    return result
+
+
+def serialize_many(plan, objs):
+    """Apply a compiled plan to every object of an iterable"""
+    return [serialize(plan, obj) for obj in objs]
+
+
+def _loaded(attr):
+    """Accessor reading an attribute from __dict__ when it is already loaded"""
+    def accessor(obj):
+        try:
+            return obj.__dict__[attr]
+        except KeyError:
+            return getattr(obj, attr)
+    return accessor
+
+
+def one(plan, attr):
+    """Accessor serializing a related object with plan, or None if unset"""
+    get = _loaded(attr)
+
+    def accessor(obj):
+        value = get(obj)
+        if value is None:
+            return None
+        return serialize(plan, value)
+    return accessor
+
+
+def many(plan, attr):
+    """Accessor serializing a related collection with plan"""
+    get = _loaded(attr)
+
+    def accessor(obj):
+        return [serialize(plan, item) for item in get(obj)]
+    return accessor
+
+
+def isoformat(attr):
+    """Accessor returning a datetime attribute as an ISO 8601 string"""
+    get = _loaded(attr)
+
+    def accessor(obj):
+        return get(obj).isoformat()
+    return accessor
+
+
+def _rating_average(place):
+    return round(place.rating_avg or 0.0, 2)
+
+
+_RATING_COUNTS = itemgetter('rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5')
+
+
+def _rating_histogram(place):
+    try:
+        values = _RATING_COUNTS(place.__dict__)
+    except KeyError:
+        return place.rating_histogram
+    return {str(star): value or 0 for star, value in enumerate(values, 1)}
+
+
+TIMESTAMPS = (
+    ('created_at', isoformat('created_at')),
+    ('updated_at', isoformat('updated_at')),
+)
+
+# ----- Stubs embedded in other payloads -----
+
+OWNER_STUB = compile_plan([
+    ('id', 'id'),
+    ('first_name', 'first_name'),
+    ('last_name', 'last_name'),
+    ('email', 'email'),
+])
+
+AUTHOR_STUB = compile_plan([
+    ('id', 'id'),
+    ('first_name', 'first_name'),
+    ('last_name', 'last_name'),
+])
+
+AMENITY_STUB = compile_plan([
+    ('id', 'id'),
+    ('name', 'name'),
+])
+
+REVIEW_STUB = compile_plan([
+    ('id', 'id'),
+    ('text', 'text'),
+    ('rating', 'rating'),
+    ('user_id', 'user_id'),
+    ('user', one(AUTHOR_STUB, 'user')),
+])
+
+# ----- Places -----
+
+# Place fields selectable with ?fields=, and the model columns each one reads
+PLACE_FIELD_COLUMNS = {
+    'id': ('id',),
+    'title': ('title',),
+    'description': ('description',),
+    'price': ('price',),
+    'latitude': ('latitude',),
+    'longitude': ('longitude',),
+    'location': ('location',),
+    'owner_id': ('owner_id',),
+    'review_count': ('review_count',),
+    'rating_average': ('rating_avg',),
+    'rating_histogram': tuple(f'rating_{star}' for star in range(1, 6)),
+    'created_at': ('created_at',),
+    'updated_at': ('updated_at',),
+}
+
+_PLACE_FIELDS = {
+    'id': 'id',
+    'title': 'title',
+    'description': 'description',
+    'price': 'price',
+    'latitude': 'latitude',
+    'longitude': 'longitude',
+    'location': 'location',
+    'owner_id': 'owner_id',
+    'review_count': 'review_count',
+    'rating_average': _rating_average,
+    'rating_histogram': _rating_histogram,
+    'created_at': isoformat('created_at'),
+    'updated_at': isoformat('updated_at'),
+}
+
+# Place relationships selectable with ?embed=
+_PLACE_EMBEDS = {
+    'owner': one(OWNER_STUB, 'owner'),
+    'amenities': many(AMENITY_STUB, 'amenities'),
+    'reviews': many(REVIEW_STUB, 'reviews'),
+}
+
+PLACE_EMBEDS = tuple(_PLACE_EMBEDS)
+
+
+@lru_cache(maxsize=256)
+def place_plan(fields=None, embed=PLACE_EMBEDS):
+    """
+    Compiled plan for a place with only some fields and relationships.
+
+    Args:
+        fields: Tuple of PLACE_FIELD_COLUMNS names, None for all of them
+        embed: Tuple of PLACE_EMBEDS names
+
+    Plans are cached per selection, so each combination is compiled once.
+    """
+    selected = _PLACE_FIELDS if fields is None else {
+        name: _PLACE_FIELDS[name] for name in fields}
+    return compile_plan(
+        list(selected.items())
+        + [(name, _PLACE_EMBEDS[name]) for name in PLACE_EMBEDS if name in embed])
+
+
+def place_columns(fields):
+    """Model columns needed to serialize the given place fields (None for all)"""
+    if fields is None:
+        return None
+    return tuple(dict.fromkeys(
+        column for name in fields for column in PLACE_FIELD_COLUMNS[name]))
+
+
+# Returned by create/update: the place without its reviews
+PLACE_WRITE = place_plan(embed=('owner', 'amenities'))
+
+# A full place, as listed or shown on its own page
+PLACE_CARD = place_plan()
+
+# ----- Reviews -----
+
+_REVIEW_FIELDS = [
+    ('id', 'id'),
+    ('text', 'text'),
+    ('rating', 'rating'),
+    ('user_id', 'user_id'),
+    ('user', one(AUTHOR_STUB, 'user')),
+    *TIMESTAMPS,
+]
+
+# A review listed under its place, where place_id is implied
+PLACE_REVIEW = compile_plan(_REVIEW_FIELDS)
+
+REVIEW = compile_plan(_REVIEW_FIELDS + [('place_id', 'place_id')])
+
+# ----- Amenities -----
+
+AMENITY = compile_plan([
+    ('id', 'id'),
+    ('name', 'name'),
+    *TIMESTAMPS,
+])
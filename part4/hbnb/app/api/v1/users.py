@@ -1,9 +1,20 @@
 """
 User API endpoints for HBnB application
 """
+import math
+
+from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
+from sqlalchemy.exc import IntegrityError
 from hbnb.app.services.facade import HBnBFacade
+from hbnb.app.extensions import password_hasher, rate_limiter
+from hbnb.app.services.repositories.user_repository import normalize_email
+from hbnb.app.password_hasher import PasswordHasherBusy
+from hbnb.app.api.v1.pagination import get_page_args, next_page_headers
+from hbnb.app.api.v1.conditional import (
+    collection_validators, conditional_headers, resource_validators,
+)
 
 api = Namespace('users', description='User operations')
 
@@ -17,6 +28,12 @@ def is_admin():
     return claims.get('is_admin', False)
 
 
+@api.errorhandler(PasswordHasherBusy)
+def handle_hasher_busy(error):
+    """Shed load when too many password hashes are already queued"""
+    return {'message': str(error)}, 503, {'Retry-After': '1'}
+
+
 # Define the user model for input validation and documentation
 user_model = api.model('User', {
     'first_name': fields.String(required=True, description='First name of the user', min_length=1, max_length=50),
@@ -49,12 +66,29 @@ class UserList(Resource):
     """Handles operations on the user collection"""
 
     @api.doc('list_users')
+    @api.param('limit', 'Maximum number of users per page', type=int)
+    @api.param('cursor', 'Opaque cursor from the previous page')
     @api.marshal_list_with(user_response_model)
     @api.response(200, 'List of users retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date sent')
+    @api.response(400, 'Invalid pagination parameters')
     def get(self):
         """Get list of all users"""
-        users = facade.get_all_users()
-        return users, 200
+        try:
+            page = get_page_args()
+        except ValueError as e:
+            api.abort(400, str(e))
+
+        versions = facade.get_collection_versions('users')
+        headers = conditional_headers(*collection_validators(versions))
+
+        if page is None:
+            return facade.get_all_users(), 200, headers
+
+        limit, after = page
+        users, next_key = facade.get_users_page(limit, after)
+        headers.update(next_page_headers(next_key, limit))
+        return users, 200, headers
 
     @api.doc('create_user')
     @api.expect(user_model, validate=True)
@@ -75,14 +109,18 @@ class UserList(Resource):
             if all_users and not is_admin():
                 api.abort(403, 'Admin privileges required to create admin users')
         
-        # Check if email already exists
-        existing_user = facade.get_user_by_email(user_data['email'])
+        # Check if email already exists (in the database: a cached miss may
+        # predate a registration on another worker)
+        existing_user = facade.get_user_by_email(user_data['email'], cached=False)
         if existing_user:
             api.abort(409, 'Email already registered')
 
         try:
             new_user = facade.create_user(user_data)
             return new_user, 201
+        except IntegrityError:
+            # A concurrent registration won the race on the unique index
+            api.abort(409, 'Email already registered')
         except ValueError as e:
             api.abort(400, str(e))
 
@@ -95,13 +133,15 @@ class UserResource(Resource):
     @api.doc('get_user')
     @api.marshal_with(user_response_model)
     @api.response(200, 'User details retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date sent')
     @api.response(404, 'User not found')
     def get(self, user_id):
         """Get user details by ID"""
         user = facade.get_user(user_id)
         if not user:
             api.abort(404, 'User not found')
-        return user, 200
+        headers = conditional_headers(*resource_validators(user))
+        return user, 200, headers
 
     @api.doc('update_user')
     @api.expect(user_model, validate=True)
@@ -130,13 +170,15 @@ class UserResource(Resource):
 
         # Check if email is being changed to one that already exists
         if 'email' in user_data and user_data['email'] != existing_user.email:
-            user_with_email = facade.get_user_by_email(user_data['email'])
+            user_with_email = facade.get_user_by_email(user_data['email'], cached=False)
             if user_with_email:
                 api.abort(409, 'Email already registered')
 
         try:
             updated_user = facade.update_user(user_id, user_data)
             return updated_user, 200
+        except IntegrityError:
+            api.abort(409, 'Email already registered')
         except ValueError as e:
             api.abort(400, str(e))
 
@@ -164,6 +206,60 @@ class UserResource(Resource):
             api.abort(400, str(e))
 
 
+# Define the password hashing pool statistics response model
+hashing_stats_model = api.model('PasswordHashingStats', {
+    'scheme': fields.String(description='Scheme of new hashes: bcrypt or argon2id'),
+    'executor': fields.String(description='Pool type: thread, process or inline'),
+    'workers': fields.Integer(description='Hashes running at once'),
+    'max_pending': fields.Integer(description='Hashes admitted at once, running or queued'),
+    'pending': fields.Integer(description='Hashes admitted right now'),
+    'queue_depth': fields.Integer(description='Admitted hashes waiting for a worker'),
+    'peak_pending': fields.Integer(description='Highest pending count seen'),
+    'completed': fields.Integer(description='Hashes run on the pool'),
+    'rejected': fields.Integer(description='Requests refused with 503 while saturated')
+})
+
+
+@api.route('/password-hashing')
+class PasswordHashingStats(Resource):
+    """Exposes the password hashing pool counters"""
+
+    @api.doc('get_password_hashing_stats')
+    @api.marshal_with(hashing_stats_model)
+    @api.response(200, 'Hashing statistics retrieved successfully')
+    @api.response(403, 'Admin privileges required')
+    @jwt_required()
+    def get(self):
+        """Get password hashing pool counters of this process (requires admin privileges)"""
+        if not is_admin():
+            api.abort(403, 'Admin privileges required')
+        return password_hasher.stats(), 200
+
+
+# Define the login throttling statistics response model
+throttle_stats_model = api.model('LoginThrottleStats', {
+    'store': fields.String(description='Bucket store: memory, sqlite, shm or none'),
+    'buckets': fields.Integer(description='Buckets currently stored'),
+    'rejected': fields.Integer(description='Requests refused with 429 by this process')
+})
+
+
+@api.route('/login-throttle')
+class LoginThrottleStats(Resource):
+    """Exposes the login throttling counters"""
+
+    @api.doc('get_login_throttle_stats')
+    @api.marshal_with(throttle_stats_model)
+    @api.response(200, 'Throttling statistics retrieved successfully')
+    @api.response(403, 'Admin privileges required')
+    @jwt_required()
+    def get(self):
+        """Get login throttling counters (requires admin privileges)"""
+        if not is_admin():
+            api.abort(403, 'Admin privileges required')
+        return rate_limiter.stats(), 200
+
+
 @api.route('/login')
 class UserLogin(Resource):
     """Handles user login and JWT token generation"""
@@ -172,16 +268,38 @@ class UserLogin(Resource):
     @api.expect(login_model, validate=True)
     @api.response(200, 'Login successful')
     @api.response(401, 'Invalid credentials')
+    @api.response(429, 'Too many login attempts, retry later')
+    @api.response(503, 'Too many logins in progress, retry shortly')
     def post(self):
         """Authenticate user and return JWT token"""
         credentials = api.payload
-        
-        # Get user by email
-        user = facade.get_user_by_email(credentials['email'])
-        
-        # Verify user exists and password is correct
-        if not user or not user.verify_password(credentials['password']):
+        email = normalize_email(credentials['email'])
+
+        # Throttle by client, by account and client, and by account before
+        # any lookup or hashing. The account bucket is only charged for
+        # failed verifies: attempts refused by a client's own buckets never
+        # reach it, so one client cannot lock the owner out, while failures
+        # spread over many clients (credential stuffing) still run it dry
+        ip = request.remote_addr or ''
+        client_bucket = ('login_client', f'{email}\0{ip}')
+        account_bucket = ('login_email', email)
+        retry_after = rate_limiter.hit(('login_ip', ip), client_bucket, check=[account_bucket])
+        if retry_after:
+            return ({'message': 'Too many login attempts, retry later'}, 429,
+                    {'Retry-After': str(math.ceil(retry_after))})
+
+        # Verify user exists and password is correct (upgrading stale hashes)
+        try:
+            user = facade.authenticate_user(credentials['email'], credentials['password'])
+        except PasswordHasherBusy as e:
+            # Answered here rather than by the error handler, which logs a
+            # traceback for every 5xx: shedding a login spike stays quiet
+            return {'message': str(e)}, 503, {'Retry-After': '1'}
+        if not user:
+            rate_limiter.charge(account_bucket)
             api.abort(401, 'Invalid credentials')
+        rate_limiter.reset(*client_bucket)
+        rate_limiter.reset(*account_bucket)
         
         # Create JWT token with user identity and additional claims
         additional_claims = {
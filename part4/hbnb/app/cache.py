@@ -0,0 +1,281 @@
+"""
+Response cache for hot read endpoints.
+
+Cached responses are keyed on the request path and query string plus the
+generation of every tag the response depends on: a collection ('places',
+'amenities', ...) or a single entity ('place:<id>'). Invalidation bumps the
+generations of the changed tags, so every key built from them changes at
+once; the old entries are never read again and age out of the LRU. The
+generations are stored in the backend itself, which keeps invalidation
+consistent across workers sharing a backend.
+
+Backends:
+    memory      -- in-process LRU bounded by entry count and total bytes,
+                   for a single process: generations are bumped in the
+                   writing process only, so entries also expire after
+                   RESPONSE_CACHE_TTL seconds, bounding how long another
+                   process can serve a stale response
+    filesystem  -- one file per entry in a directory shared by every
+                   worker; point RESPONSE_CACHE_DIR at /dev/shm to keep it
+                   in shared memory
+    none        -- caching disabled
+"""
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, has_app_context, request
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBackend:
+    """
+    In-process LRU, evicting least recently used entries past either bound
+    and expired ones when read (ttl 0 keeps them until evicted).
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (expiry on the monotonic clock, value)
+        self._entries = OrderedDict()
+        self._size = 0
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if self.ttl and expires <= time.monotonic():
+                del self._entries[key]
+                self._size -= len(value)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[1])
+            self._entries[key] = (expires, value)
+            self._size += len(value)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def generations(self, tags) -> list[int]:
+        return [self._generations.get(tag, 0) for tag in tags]
+
+    def bump(self, tags) -> None:
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FileSystemBackend:
+    """
+    Cache directory shared by every worker of a host.
+
+    Entries are files named after their key hash, written atomically and
+    touched on every read so their mtime orders the LRU. Tag generations are
+    small counter files updated under an exclusive lock.
+    """
+
+    def __init__(self, directory: str, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries_dir = os.path.join(directory, 'entries')
+        self._tags_dir = os.path.join(directory, 'tags')
+        os.makedirs(self._entries_dir, exist_ok=True)
+        os.makedirs(self._tags_dir, exist_ok=True)
+        self._lock_path = os.path.join(directory, 'tags.lock')
+
+    @staticmethod
+    def _name(value: str) -> str:
+        return hashlib.sha1(value.encode()).hexdigest()
+
+    def _write(self, path: str, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def get(self, key: str) -> bytes | None:
+        path = os.path.join(self._entries_dir, self._name(key))
+        try:
+            with open(path, 'rb') as f:
+                value = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        self._write(os.path.join(self._entries_dir, self._name(key)), value)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        with os.scandir(self._entries_dir) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if len(entries) <= self.max_entries and total <= self.max_bytes:
+            return
+        entries.sort()
+        count = len(entries)
+        for _, size, path in entries:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            count -= 1
+            total -= size
+
+    def _read_generation(self, tag: str) -> int:
+        try:
+            with open(os.path.join(self._tags_dir, self._name(tag)), 'rb') as f:
+                return int(f.read() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def generations(self, tags) -> list[int]:
+        return [self._read_generation(tag) for tag in tags]
+
+    def bump(self, tags) -> None:
+        with open(self._lock_path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                for tag in tags:
+                    generation = self._read_generation(tag) + 1
+                    self._write(os.path.join(self._tags_dir, self._name(tag)),
+                                str(generation).encode())
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def __len__(self) -> int:
+        with os.scandir(self._entries_dir) as it:
+            return sum(1 for _ in it)
+
+
+BACKENDS = ('memory', 'filesystem', 'none')
+
+
+class ResponseCache:
+    """
+    Flask extension holding the configured backend and hit/miss counters.
+
+    Config:
+        RESPONSE_CACHE_BACKEND: 'memory' (default), 'filesystem' or 'none'
+        RESPONSE_CACHE_MAX_ENTRIES: Entry count bound of the LRU
+        RESPONSE_CACHE_MAX_BYTES: Total size bound of the LRU
+        RESPONSE_CACHE_TTL: Seconds a memory backend entry is served
+        RESPONSE_CACHE_DIR: Directory of the filesystem backend
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        name = app.config.get('RESPONSE_CACHE_BACKEND', 'memory') or 'none'
+        if name not in BACKENDS:
+            raise ValueError(f"RESPONSE_CACHE_BACKEND must be one of {', '.join(BACKENDS)}")
+        max_entries = app.config.get('RESPONSE_CACHE_MAX_ENTRIES', 1024)
+        max_bytes = app.config.get('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024)
+
+        if name == 'memory':
+            backend = MemoryBackend(max_entries, max_bytes,
+                                    app.config.get('RESPONSE_CACHE_TTL', 30))
+        elif name == 'filesystem':
+            directory = (app.config.get('RESPONSE_CACHE_DIR')
+                         or os.path.join(tempfile.gettempdir(), 'hbnb-response-cache'))
+            backend = FileSystemBackend(directory, max_entries, max_bytes)
+        else:
+            backend = None
+        app.extensions['response_cache'] = {
+            'backend_name': name,
+            'backend': backend,
+            'hits': 0,
+            'misses': 0,
+        }
+        logger.debug("Response cache backend: %s", name)
+
+    @staticmethod
+    def _state():
+        if not has_app_context():
+            return None
+        return current_app.extensions.get('response_cache')
+
+    @property
+    def enabled(self) -> bool:
+        state = self._state()
+        return bool(state and state['backend'] is not None)
+
+    def key(self, tags) -> str:
+        """Cache key of the current request for a response depending on tags"""
+        backend = self._state()['backend']
+        generations = backend.generations(tags)
+        versions = ','.join(f'{tag}={generation}' for tag, generation in zip(tags, generations))
+        return f'{request.full_path}|{versions}'
+
+    def get(self, key: str) -> bytes | None:
+        """Look up a cached response, counting the hit or miss"""
+        state = self._state()
+        value = state['backend'].get(key)
+        # Counters are approximate under concurrency; no lock on the hot path
+        if value is None:
+            state['misses'] += 1
+        else:
+            state['hits'] += 1
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        self._state()['backend'].set(key, value)
+
+    def invalidate(self, *tags: str) -> None:
+        """Make every cached response depending on one of the tags unreachable"""
+        state = self._state()
+        if state and state['backend'] is not None and tags:
+            state['backend'].bump(tags)
+
+    def stats(self) -> dict:
+        """Hit/miss counters of this process and the backend's entry count"""
+        state = self._state()
+        backend = state['backend']
+        lookups = state['hits'] + state['misses']
+        return {
+            'backend': state['backend_name'],
+            'entries': len(backend) if backend is not None else 0,
+            'hits': state['hits'],
+            'misses': state['misses'],
+            'hit_ratio': round(state['hits'] / lookups, 4) if lookups else 0.0,
+        }
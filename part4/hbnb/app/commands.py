@@ -0,0 +1,92 @@
+"""
+Flask CLI commands for HBnB maintenance tasks.
+Registered under the `hbnb` group, e.g. `flask --app run hbnb repair-ratings`.
+"""
+import click
+from flask.cli import AppGroup
+
+hbnb_cli = AppGroup('hbnb', help='HBnB maintenance commands.')
+
+
+@hbnb_cli.command('repair-ratings')
+def repair_ratings():
+    """Recompute every place's rating aggregates from its reviews."""
+    from hbnb.app.services.facade import HBnBFacade
+
+    updated = HBnBFacade().repair_rating_aggregates()
+    click.echo(f"Recomputed rating aggregates for {updated} places.")
+
+
+@hbnb_cli.command('import-users')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+def import_users(path):
+    """Create the users of a JSON file (a list, or {"users": [...]}).
+
+    Existing emails are skipped; passwords are hashed in parallel.
+    """
+    from hbnb.app.importer import Importer
+
+    stats = Importer().run(path, kind='users', sections=('users',),
+                           resume=False, checkpoint=False)['users']
+    click.echo(f"Imported {stats['created']} users ({stats['skipped']} already existed).")
+
+
+@hbnb_cli.command('import')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['json', 'ndjson']),
+              help='File format (default: ndjson for .ndjson/.jsonl files, else json).')
+@click.option('--type', 'kind', type=click.Choice(['users', 'amenities', 'places', 'reviews']),
+              help='Kind of the items that have no "type" field.')
+@click.option('--chunk-size', default=1000, show_default=True, help='Items per transaction.')
+@click.option('--restart', is_flag=True, help='Start over instead of resuming.')
+def import_data(path, fmt, kind, chunk_size, restart):
+    """Import users, amenities, places and reviews from a JSON or NDJSON file.
+
+    The file is streamed and committed in chunks. A run of the same file
+    resumes after the last chunk committed; existing rows are skipped.
+    """
+    import time
+
+    from hbnb.app import db
+    from hbnb.app.importer import Importer
+
+    last = 0.0
+
+    def progress(importer):
+        nonlocal last
+        now = time.perf_counter()
+        if now - last >= 1:
+            last = now
+            click.echo(f"  {importer.position} items, {importer.rate:.0f} items/s", err=True)
+
+    db.create_all()
+    importer = Importer(chunk_size=chunk_size, progress=progress)
+    stats = importer.run(path, fmt=fmt, kind=kind, resume=not restart)
+    if importer.resumed_at:
+        click.echo(f"Resumed after {importer.resumed_at} items.")
+    for section, counts in stats.items():
+        if counts['read']:
+            click.echo(f"{section}: {counts['created']} created, {counts['skipped']} existing, "
+                       f"{counts['rejected']} rejected")
+    click.echo(f"{importer.position - importer.resumed_at} items, {importer.rate:.0f} items/s.")
+
+
+@hbnb_cli.command('seed')
+@click.option('--file', 'seed_file', type=click.Path(exists=True, dir_okay=False),
+              help='Seed file (default: seed_data.json).')
+@click.option('--force', is_flag=True, help='Load the file even if it is unchanged.')
+def seed(seed_file, force):
+    """Create the tables if needed and load the seed data.
+
+    A file whose content was already loaded is skipped.
+    """
+    from hbnb.app import db
+    from hbnb.app.seed import load_seed_data
+
+    db.create_all()
+    counts = load_seed_data(seed_file, force=force)
+    if counts is None:
+        click.echo("Seed data unchanged or missing, nothing loaded.")
+    else:
+        click.echo("Seed data loaded: {users} users, {amenities} amenities, "
+                   "{places} places, {reviews} reviews.".format(**counts))
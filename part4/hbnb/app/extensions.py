@@ -3,9 +3,16 @@ Flask extensions initialization module.
 Extensions are created here without binding to app,
 then initialized in the application factory.
 """
-from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 
+from hbnb.app.cache import ResponseCache
+from hbnb.app.persistence.identity_cache import IdentityCache
+from hbnb.app.password_hasher import PasswordHasher
+from hbnb.app.rate_limit import RateLimiter
+
 # Create extension instances without binding to app
-bcrypt = Bcrypt()
 jwt = JWTManager()
+response_cache = ResponseCache()
+identity_cache = IdentityCache()
+password_hasher = PasswordHasher()
+rate_limiter = RateLimiter()
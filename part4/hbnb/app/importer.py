@@ -0,0 +1,461 @@
+"""
+Streaming import of seed-format data (`flask hbnb import`).
+
+Reads JSON laid out like seed_data.json ({"users": [...], "amenities":
+[...], "places": [...], "reviews": [...]}, or a single array) or NDJSON
+(one object per line) incrementally, holding one chunk of items at a
+time, and creates them with the facade's bulk methods, one transaction
+per chunk:
+
+    - places refer to their owner by owner_email and to amenities by
+      name, reviews to their place by place_title and author by
+      user_email; these are resolved to IDs with one batched query per
+      chunk for the keys not seen yet, and kept in maps
+    - the passwords of a chunk of users are hashed in parallel on the
+      password hashing pool
+    - users, amenities, places and reviews that already exist are
+      skipped, so importing a file again only adds what is new
+    - the number of items committed is saved in the same transaction as
+      each chunk (import_checkpoints table); importing the same file
+      again resumes after them
+    - invalid items, and rows the database refuses (the chunk is then
+      retried item by item), are rejected and logged without stopping
+      the import
+
+Items of a top-level array or an NDJSON line name their kind with a
+"type" field (user, amenity, place or review) unless one is given for
+the whole file. Items must come after the ones they refer to (users
+before their places, places before their reviews), as in seed_data.json.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
+
+from hbnb.app import db
+from hbnb.app.models.import_checkpoint import ImportCheckpoint
+from hbnb.app.services.facade import HBnBFacade
+from hbnb.app.services.repositories.user_repository import normalize_email
+
+logger = logging.getLogger('hbnb.import')
+
+SECTIONS = ('users', 'amenities', 'places', 'reviews')
+# Accepted names of each kind of item
+KINDS = {**{section: section for section in SECTIONS},
+         'user': 'users', 'amenity': 'amenities', 'place': 'places', 'review': 'reviews'}
+
+ALREADY_REVIEWED = "You have already reviewed this place"
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class _JsonStream:
+    """Reads the JSON values of a text file one at a time, block by block"""
+
+    def __init__(self, f, block_size=1 << 16):
+        self._file = f
+        self._block_size = block_size
+        self._buffer = ''
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """Append the next block to the buffer; False at the end of the file"""
+        block = self._file.read(self._block_size)
+        if not block:
+            return False
+        self._buffer = self._buffer[self._pos:] + block
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character, or '' at the end of the file"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def take(self, char):
+        if self.peek() != char:
+            raise ValueError(f"invalid JSON: expected {char!r}")
+        self._pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number ending with the buffer may go on in the next block
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def array(self, key=None):
+        """Yield (key, value) for each value of the array that follows"""
+        self.take('[')
+        while self.peek() != ']':
+            yield key, self.value()
+            if self.peek() == ',':
+                self.take(',')
+        self.take(']')
+
+
+def _json_items(f):
+    stream = _JsonStream(f)
+    if stream.peek() == '[':
+        yield from stream.array()
+        return
+    stream.take('{')
+    while stream.peek() != '}':
+        key = stream.value()
+        stream.take(':')
+        if key in KINDS and stream.peek() == '[':
+            yield from stream.array(KINDS[key])
+        else:
+            stream.value()  # not a list of items
+        if stream.peek() == ',':
+            stream.take(',')
+    stream.take('}')
+
+
+def _ndjson_items(f):
+    for line in f:
+        if line.strip():
+            yield None, json.loads(line)
+
+
+def read_items(path, fmt=None, kind=None):
+    """
+    Yield the (section, item) pairs of a JSON or NDJSON file in file
+    order, section being None for items of an unknown kind.
+
+    Args:
+        fmt: 'json' or 'ndjson' (default: from the .ndjson/.jsonl extension)
+        kind: Kind of the items that do not name theirs
+    """
+    fmt = fmt or ('ndjson' if path.endswith(('.ndjson', '.jsonl')) else 'json')
+    with open(path, encoding='utf-8') as f:
+        items = _ndjson_items(f) if fmt == 'ndjson' else _json_items(f)
+        for section, item in items:
+            if section is None:
+                name = item.pop('type', kind) if isinstance(item, dict) else kind
+                section = KINDS.get(name)
+            yield section, item
+
+
+def fingerprint(path, edge=1 << 16):
+    """Size and hash of the first and last 64 KiB of a file, to recognize it cheaply"""
+    size = os.path.getsize(path)
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        digest.update(f.read(edge))
+        if size > edge:
+            f.seek(max(edge, size - edge))
+            digest.update(f.read())
+    return f'{size}:{digest.hexdigest()}'
+
+
+class Importer:
+    """
+    Imports seed-format files chunk by chunk (see the module docstring).
+
+        importer = Importer(chunk_size=1000, progress=print_progress)
+        stats = importer.run('reviews.ndjson')
+
+    Args:
+        chunk_size: Items per transaction
+        progress: Called with the importer after each chunk
+    """
+
+    def __init__(self, chunk_size=1000, progress=None):
+        self.facade = HBnBFacade()
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.stats = {section: {'read': 0, 'created': 0, 'skipped': 0, 'rejected': 0}
+                      for section in SECTIONS}
+        # Items of the file handled, including the ones committed by an
+        # earlier run that this one resumed after
+        self.position = 0
+        self.resumed_at = 0
+        self.started = None
+        # IDs by normalized email, amenity name and place title
+        self._ids = {'users': {}, 'amenities': {}, 'places': {}}
+
+    @property
+    def rate(self):
+        """Items handled per second by this run"""
+        elapsed = time.perf_counter() - self.started if self.started else 0
+        return (self.position - self.resumed_at) / elapsed if elapsed else 0.0
+
+    def run(self, path, fmt=None, kind=None, sections=SECTIONS, resume=True, checkpoint=True):
+        """
+        Import a file.
+
+        Args:
+            path: JSON or NDJSON file
+            fmt: 'json' or 'ndjson' (default: from the file extension)
+            kind: Kind of the items that do not name theirs ('users', ...)
+            sections: Kinds of items to import; the others are ignored
+            resume: Start after the items committed by an earlier run of
+                the same file
+            checkpoint: Save the position of each chunk committed
+
+        Returns:
+            Dict of section to its read, created, skipped and rejected counts
+        """
+        name = os.path.basename(path)
+        mark = fingerprint(path) if resume or checkpoint else None
+        saved = db.session.get(ImportCheckpoint, name) if resume else None
+        if saved is not None and saved.fingerprint == mark:
+            self.resumed_at = saved.position
+            logger.info("Resuming %s after %d items", name, self.resumed_at)
+
+        self.started = time.perf_counter()
+        chunk, chunk_section = [], None
+        for position, (section, item) in enumerate(read_items(path, fmt, kind), 1):
+            if position <= self.resumed_at:
+                self.position = position
+                continue
+            if section is None:
+                logger.warning("Item #%d ignored: unknown type", position)
+            if section != chunk_section or len(chunk) >= self.chunk_size:
+                self._commit(chunk_section, chunk, name if checkpoint else None, mark)
+                chunk = []
+            chunk_section = section
+            # Ignored items still move the checkpoint
+            chunk.append((position, item if section in sections else None))
+        self._commit(chunk_section, chunk, name if checkpoint else None, mark)
+
+        logger.info("Imported %s: %d items in %.1f s (%.0f items/s)", name,
+                    self.position - self.resumed_at, time.perf_counter() - self.started,
+                    self.rate)
+        return self.stats
+
+    def _commit(self, section, chunk, name, mark):
+        """Import one chunk of items of a section, with its checkpoint"""
+        if not chunk:
+            return
+        items = [(position, item) for position, item in chunk if item is not None]
+        self._write(section, items, name, mark, chunk[-1][0])
+        self.position = chunk[-1][0]
+        if self.progress is not None:
+            self.progress(self)
+
+    def _write(self, section, items, name, mark, end):
+        """
+        Create items in one transaction that also saves the checkpoint at
+        end. A row conflicting with stored data rolls the transaction
+        back: the items are then written one by one and the conflicting
+        ones rejected.
+        """
+        counts = dict(self.stats[section]) if items else None
+        try:
+            with self.facade.transaction():
+                new_ids = getattr(self, f'_import_{section}')(items) if items else {}
+                if name is not None:
+                    self._save_checkpoint(name, mark, end)
+        except IntegrityError as e:
+            if not items:
+                raise
+            self.stats[section] = counts
+            if len(items) > 1:
+                for i, (position, item) in enumerate(items):
+                    last = i == len(items) - 1
+                    self._write(section, [(position, item)], name, mark, end if last else position)
+                return
+            self._reject(section, items[0][0], f"conflicts with stored data: {e.orig}")
+            self.stats[section]['read'] += 1
+            self._write(section, [], name, mark, end)
+            return
+        # Only what was committed can be referred to by later chunks
+        if new_ids:
+            self._ids[section].update(new_ids)
+        if items:
+            self.stats[section]['read'] += len(items)
+
+    @staticmethod
+    def _save_checkpoint(name, mark, position):
+        saved = db.session.get(ImportCheckpoint, name)
+        if saved is None:
+            saved = ImportCheckpoint(name=name)
+            db.session.add(saved)
+        saved.fingerprint = mark
+        saved.position = position
+        saved.updated_at = datetime.utcnow()
+
+    def _reject(self, section, position, message):
+        logger.warning("%s #%d rejected: %s", section, position, message)
+        self.stats[section]['rejected'] += 1
+
+    def _skip(self, section, count=1):
+        self.stats[section]['skipped'] += count
+
+    def _objects(self, section, items):
+        """The items that are JSON objects, rejecting the others"""
+        objects = []
+        for position, item in items:
+            if isinstance(item, dict):
+                objects.append((position, item))
+            else:
+                self._reject(section, position, "item must be an object")
+        return objects
+
+    def _resolve(self, section, keys, lookup):
+        """Add the IDs of the keys not in the section's map yet, with one batched lookup"""
+        ids = self._ids[section]
+        keys = dict.fromkeys(key for key in keys if isinstance(key, str))
+        missing = [key for key in keys if key not in ids]
+        if missing:
+            ids.update(lookup(missing))
+        return ids
+
+    def _report(self, section, batch, created, errors):
+        """Count the results of a facade bulk creation of the batch's items"""
+        self.stats[section]['created'] += len(created)
+        for index, status, message in errors:
+            if status == 409 or message == ALREADY_REVIEWED:
+                self._skip(section)
+            else:
+                self._reject(section, batch[index][0], message)
+
+    # ----- one method per section, returning the natural key -> ID of
+    # ----- the items created
+
+    def _import_users(self, items):
+        items = self._objects('users', items)
+
+        def email(item):
+            value = item.get('email')
+            return normalize_email(value) if isinstance(value, str) else None
+
+        ids = self._resolve('users', map(email, (item for _, item in items)),
+                            self.facade.user_repo.get_ids_by_emails)
+        batch, seen = [], set()
+        for position, item in items:
+            key = email(item)
+            if key is None:
+                self._reject('users', position, "email is required")
+            elif not item.get('password') or not isinstance(item['password'], str):
+                self._reject('users', position, "password is required")
+            elif key in ids or key in seen:
+                self._skip('users')
+            else:
+                seen.add(key)
+                batch.append((position, item))
+        try:
+            users = self.facade.create_users([item for _, item in batch])
+        except (KeyError, TypeError, ValueError):
+            # One invalid user fails the whole call: retry them one by one
+            users = []
+            for position, item in batch:
+                try:
+                    users += self.facade.create_users([item])
+                except KeyError as e:
+                    self._reject('users', position, f"{e.args[0]} is required")
+                except (TypeError, ValueError) as e:
+                    self._reject('users', position, str(e))
+        self.stats['users']['created'] += len(users)
+        return {normalize_email(user.email): user.id for user in users}
+
+    def _import_amenities(self, items):
+        items = self._objects('amenities', items)
+        ids = self._resolve('amenities', (item.get('name') for _, item in items),
+                            self._lookup('amenity_repo', 'name'))
+        batch, seen = [], set()
+        for position, item in items:
+            name = item.get('name')
+            if isinstance(name, str) and (name in ids or name in seen):
+                self._skip('amenities')
+                continue
+            seen.add(name)
+            batch.append((position, item))
+        created, errors = self.facade.create_amenities([item for _, item in batch])
+        self._report('amenities', batch, created, errors)
+        return {batch[index][1]['name']: obj_id for index, obj_id in created}
+
+    def _import_places(self, items):
+        items = self._objects('places', items)
+        owners = self._resolve(
+            'users', (normalize_email(item['owner_email']) for _, item in items
+                      if isinstance(item.get('owner_email'), str)),
+            self.facade.user_repo.get_ids_by_emails)
+        amenities = self._resolve(
+            'amenities', (name for _, item in items if isinstance(item.get('amenities'), list)
+                          for name in item['amenities'] if isinstance(name, str)),
+            self._lookup('amenity_repo', 'name'))
+        titles = self._resolve('places', (item.get('title') for _, item in items),
+                               self._lookup('place_repo', 'title'))
+        batch, seen = [], set()
+        for position, item in items:
+            title = item.get('title')
+            if isinstance(title, str) and (title in titles or title in seen):
+                self._skip('places')
+                continue
+            data = {key: value for key, value in item.items()
+                    if key not in ('owner_email', 'amenities')}
+            if 'owner_email' in item:
+                email = item['owner_email']
+                data['owner_id'] = owners.get(normalize_email(email)) if isinstance(email, str) else None
+                if data['owner_id'] is None:
+                    self._reject('places', position, f"Owner not found: {email}")
+                    continue
+            names = item.get('amenities') or []
+            if not isinstance(names, list):
+                self._reject('places', position, "amenities must be a list of names")
+                continue
+            missing = [name for name in names if not isinstance(name, str) or name not in amenities]
+            if missing:
+                self._reject('places', position, f"Amenity not found: {missing[0]}")
+                continue
+            data['amenities'] = [amenities[name] for name in names]
+            if isinstance(title, str):
+                seen.add(title)
+            batch.append((position, data))
+        created, errors = self.facade.create_places([data for _, data in batch])
+        self._report('places', batch, created, errors)
+        return {batch[index][1]['title']: obj_id for index, obj_id in created}
+
+    def _import_reviews(self, items):
+        items = self._objects('reviews', items)
+        users = self._resolve(
+            'users', (normalize_email(item['user_email']) for _, item in items
+                      if isinstance(item.get('user_email'), str)),
+            self.facade.user_repo.get_ids_by_emails)
+        places = self._resolve('places', (item.get('place_title') for _, item in items),
+                               self._lookup('place_repo', 'title'))
+        batch = []
+        for position, item in items:
+            data = {key: value for key, value in item.items()
+                    if key not in ('user_email', 'place_title')}
+            if 'user_email' in item:
+                email = item['user_email']
+                data['user_id'] = users.get(normalize_email(email)) if isinstance(email, str) else None
+                if data['user_id'] is None:
+                    self._reject('reviews', position, f"User not found: {email}")
+                    continue
+            if 'place_title' in item:
+                title = item['place_title']
+                data['place_id'] = places.get(title) if isinstance(title, str) else None
+                if data['place_id'] is None:
+                    self._reject('reviews', position, f"Place not found: {item['place_title']}")
+                    continue
+            batch.append((position, data))
+        created, errors = self.facade.create_reviews([data for _, data in batch])
+        self._report('reviews', batch, created, errors)
+        return {}
+
+    def _lookup(self, repo, attr_name):
+        repo = getattr(self.facade, repo)
+        return lambda values: repo.get_ids_by_attribute(attr_name, values)
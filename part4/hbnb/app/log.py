@@ -0,0 +1,27 @@
+"""
+Logging setup for the HBnB application.
+
+Every module logs through logging.getLogger(__name__) (or a child of the
+'hbnb' logger), and messages use %-style arguments so they are only
+formatted when the record is actually emitted.
+"""
+import logging
+
+DEFAULT_FORMAT = '%(asctime)s %(levelname)s [%(name)s] %(message)s'
+
+
+def configure_logging(app):
+    """
+    Configure the 'hbnb' logger hierarchy from the app config.
+
+    Reads LOG_LEVEL (name or number) and LOG_FORMAT. A handler is attached
+    once; calling this again (e.g. one app per test) only updates the level.
+    """
+    logger = logging.getLogger('hbnb')
+    logger.setLevel(app.config.get('LOG_LEVEL', 'INFO'))
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(app.config.get('LOG_FORMAT', DEFAULT_FORMAT)))
+        logger.addHandler(handler)
+        logger.propagate = False
+    return logger
@@ -3,5 +3,9 @@ from hbnb.app.models.user import User
 from hbnb.app.models.place import Place
 from hbnb.app.models.review import Review
 from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.seed_marker import SeedMarker
+from hbnb.app.models.import_checkpoint import ImportCheckpoint
+from hbnb.app.models.collection_version import CollectionVersion
 
-__all__ = ["BaseModel", "User", "Place", "Review", "Amenity"]
\ No newline at end of file
+__all__ = ["BaseModel", "User", "Place", "Review", "Amenity", "SeedMarker", "ImportCheckpoint",
+           "CollectionVersion"]
\ No newline at end of file
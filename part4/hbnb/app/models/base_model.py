@@ -15,14 +15,14 @@ class BaseModel(db.Model):
     - id (UUID string, primary key)
     - created_at (UTC datetime)
     - updated_at (UTC datetime)
-    - save(): updates updated_at
+    - save(): updates updated_at (the repository or unit of work commits)
     - update(data): set attributes then validate
     """
     
     __abstract__ = True  # This ensures SQLAlchemy does not create a table for BaseModel
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def __init__(self, **kwargs):
@@ -37,13 +37,13 @@ class BaseModel(db.Model):
             self.updated_at = datetime.utcnow()
 
     def save(self) -> None:
-        """Update the updated_at timestamp and commit to database"""
+        """
+        Update the updated_at timestamp.
+
+        Nothing is committed here: changes are persisted by the repository
+        write or the unit of work (HBnBFacade.transaction()) around them.
+        """
         self.updated_at = datetime.utcnow()
-        try:
-            db.session.commit()
-        except:
-            # If not in a session context, just update the timestamp
-            pass
 
     def validate(self) -> None:
         """Override in subclasses."""
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from hbnb.app import db
+
+
+class CollectionVersion(db.Model):
+    """
+    SQLAlchemy CollectionVersion Model:
+    - name (collection name: users, places, reviews or amenities, primary key)
+    - version (number of committed transactions that changed the collection)
+    - updated_at (UTC datetime of the last of them)
+    """
+
+    __tablename__ = 'collection_versions'
+
+    name = db.Column(db.String(32), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from hbnb.app import db
+
+
+class ImportCheckpoint(db.Model):
+    """
+    SQLAlchemy ImportCheckpoint Model:
+    - name (imported file name, primary key)
+    - fingerprint (size and hash of the file's first and last 64 KiB)
+    - position (number of items of the file already committed)
+    - updated_at (UTC datetime)
+    """
+
+    __tablename__ = 'import_checkpoints'
+
+    name = db.Column(db.String(255), primary_key=True)
+    fingerprint = db.Column(db.String(96), nullable=False)
+    position = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
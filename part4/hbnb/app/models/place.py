@@ -1,15 +1,26 @@
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any
 
 from hbnb.app.models.base_model import BaseModel
 from hbnb.app.models.user import User
 from hbnb.app.models.amenity import Amenity
+from hbnb.app.persistence.spatial import cell_for
+from hbnb.app import db
+
+
+# Association table for the many-to-many Place <-> Amenity relationship
+place_amenity = db.Table(
+    'place_amenity',
+    db.Column('place_id', db.String(36), db.ForeignKey('places.id'), primary_key=True),
+    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True),
+    db.Index('ix_place_amenity_amenity_id', 'amenity_id'),
+)
 
 
 class Place(BaseModel):
     """
-    Place entity:
+    SQLAlchemy Place Model:
     - title (required, max 100)
     - description (optional)
     - price (positive float)
@@ -17,11 +28,47 @@ class Place(BaseModel):
     - longitude (-180..180)
     - location (optional, location name)
     - owner (User instance)
+    - review_count, rating_sum, rating_1..rating_5, rating_avg
+      (rating aggregates maintained by the facade on review changes, with
+      UPDATE statements applying the change in the database)
     Relationships:
     - reviews: list of Review
     - amenities: list of Amenity
     """
 
+    __tablename__ = 'places'
+
+    title = db.Column(db.String(100), nullable=False, index=True)
+    description = db.Column(db.Text, default='')
+    price = db.Column(db.Float, nullable=False, index=True)
+    latitude = db.Column(db.Float, nullable=False)
+    longitude = db.Column(db.Float, nullable=False)
+    location = db.Column(db.String(255), default='')
+    # Grid cell of (latitude, longitude), see hbnb.app.persistence.spatial
+    geo_cell = db.Column(db.Integer, nullable=False, index=True)
+    owner_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
+
+    # Rating aggregates, updated in O(1) per review change
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    rating_1 = db.Column(db.Integer, nullable=False, default=0)
+    rating_2 = db.Column(db.Integer, nullable=False, default=0)
+    rating_3 = db.Column(db.Integer, nullable=False, default=0)
+    rating_4 = db.Column(db.Integer, nullable=False, default=0)
+    rating_5 = db.Column(db.Integer, nullable=False, default=0)
+    rating_avg = db.Column(db.Float, nullable=False, default=0.0, index=True)
+
+    RATING_COLUMNS = ('review_count', 'rating_sum', 'rating_1', 'rating_2', 'rating_3',
+                      'rating_4', 'rating_5', 'rating_avg')
+
+    owner = db.relationship('User')
+    reviews = db.relationship('Review', back_populates='place', cascade='all, delete-orphan')
+    amenities = db.relationship('Amenity', secondary=place_amenity)
+
+    __table_args__ = (
+        db.Index('ix_places_latitude_longitude', 'latitude', 'longitude'),
+    )
+
     def __init__(
         self,
         title: str,
@@ -44,8 +91,11 @@ class Place(BaseModel):
         self.owner = owner
         self.owner_id = owner.id  # Store owner_id directly
 
-        self.reviews: List[Any] = []      # will contain Review objects
-        self.amenities: List[Amenity] = []
+        self.review_count = 0
+        self.rating_sum = 0
+        for star in range(1, 6):
+            setattr(self, f'rating_{star}', 0)
+        self.rating_avg = 0.0
 
         self.validate()
 
@@ -55,6 +105,11 @@ class Place(BaseModel):
             self.reviews.append(review)
             self.save()
 
+    @property
+    def rating_histogram(self) -> dict[str, int]:
+        """Number of reviews per star, keyed '1'..'5'"""
+        return {str(star): getattr(self, f'rating_{star}') or 0 for star in range(1, 6)}
+
     def add_amenity(self, amenity: Amenity) -> None:
         if amenity not in self.amenities:
             self.amenities.append(amenity)
@@ -85,5 +140,8 @@ class Place(BaseModel):
             raise ValueError("longitude must be between -180 and 180")
         self.longitude = float(self.longitude)
 
+        # Keep the spatial index cell in sync with the coordinates
+        self.geo_cell = cell_for(self.latitude, self.longitude)
+
         if not isinstance(self.owner, User):
             raise ValueError("owner must be a User instance")
\ No newline at end of file
@@ -5,17 +5,33 @@ from typing import Any
 from hbnb.app.models.base_model import BaseModel
 from hbnb.app.models.user import User
 from hbnb.app.models.place import Place
+from hbnb.app import db
 
 
 class Review(BaseModel):
     """
-    Review entity:
+    SQLAlchemy Review Model:
     - text   (required)
     - rating (int 1..5)
     - user   (User instance)
     - place  (Place instance)
     """
 
+    __tablename__ = 'reviews'
+
+    text = db.Column(db.Text, nullable=False)
+    rating = db.Column(db.Integer, nullable=False)
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
+    place_id = db.Column(db.String(36), db.ForeignKey('places.id'), nullable=False, index=True)
+
+    user = db.relationship('User')
+    place = db.relationship('Place', back_populates='reviews')
+
+    # A user can review a given place only once
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'place_id', name='uq_reviews_user_place'),
+    )
+
     def __init__(
         self,
         text: str,
@@ -31,9 +47,9 @@ class Review(BaseModel):
         self.place = place
 
         self.validate()
-
-        # optional but helpful: auto-link to place
-        self.place.add_review(self)
+        # Setting self.place already appends to a loaded place.reviews (an
+        # unloaded one reads it from the database); the repository adds and
+        # commits the review, so nothing is committed from here
 
     def validate(self) -> None:
         if not isinstance(self.text, str) or not self.text.strip():
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from hbnb.app import db
+
+
+class SeedMarker(db.Model):
+    """
+    SQLAlchemy SeedMarker Model:
+    - name (seed file name, primary key)
+    - sha256 (hex digest of the file content last loaded)
+    - loaded_at (UTC datetime)
+    """
+
+    __tablename__ = 'seed_markers'
+
+    name = db.Column(db.String(255), primary_key=True)
+    sha256 = db.Column(db.String(64), nullable=False)
+    loaded_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
@@ -4,7 +4,7 @@ import re
 from typing import Any
 
 from hbnb.app.models.base_model import BaseModel
-from hbnb.app.extensions import bcrypt
+from hbnb.app.extensions import password_hasher
 from hbnb.app import db
 
 _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
@@ -46,16 +46,20 @@ class User(BaseModel):
         self.validate()
 
     def hash_password(self, password: str) -> None:
-        """Hash the password using bcrypt"""
+        """Hash the password using bcrypt, on the password hashing pool"""
         if not password:
             raise ValueError("password is required")
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password = password_hasher.hash(password)
 
     def verify_password(self, password: str) -> bool:
         """Verify a password against the hashed password"""
         if not self.password:
             return False
-        return bcrypt.check_password_hash(self.password, password)
+        return password_hasher.verify(self.password, password)
+
+    def password_needs_rehash(self) -> bool:
+        """Whether the stored hash predates the configured scheme or cost"""
+        return bool(self.password) and password_hasher.needs_rehash(self.password)
 
     def validate(self) -> None:
         if not isinstance(self.first_name, str) or not self.first_name.strip():
@@ -86,4 +90,8 @@ class User(BaseModel):
             'is_admin': self.is_admin,
             'created_at': self.created_at.isoformat() if hasattr(self.created_at, 'isoformat') else str(self.created_at),
             'updated_at': self.updated_at.isoformat() if hasattr(self.updated_at, 'isoformat') else str(self.updated_at)
-        }
\ No newline at end of file
+        }
+
+
+# Email lookups are case-insensitive (see UserRepository.get_user_by_email)
+db.Index('ix_users_email_lower', db.func.lower(User.email))
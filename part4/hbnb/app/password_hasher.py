@@ -0,0 +1,283 @@
+"""
+Password hashing on a bounded worker pool.
+
+bcrypt is deliberately slow (about 250 ms per hash at the default cost) and
+releases the GIL while it runs. Hashing on the request thread lets a login
+spike put every worker on the CPU at once, starving unrelated requests. The
+PasswordHasher runs hashes on a fixed-size thread or process pool instead:
+at most PASSWORD_HASH_WORKERS hashes run at a time, at most
+PASSWORD_HASH_MAX_PENDING are admitted (running or queued), and a caller
+that cannot get a slot within PASSWORD_HASH_QUEUE_TIMEOUT seconds gets
+PasswordHasherBusy, which the API turns into 503.
+
+The hash policy comes from the config: PASSWORD_HASH_SCHEME selects bcrypt
+(compatible with Flask-Bcrypt, using the same BCRYPT_LOG_ROUNDS,
+BCRYPT_HASH_PREFIX and BCRYPT_HANDLE_LONG_PASSWORDS settings) or argon2id
+(ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM; needs the optional
+argon2-cffi package). Stored hashes of either scheme always verify;
+needs_rehash() tells whether one was made under another scheme or cost, so
+it can be replaced on the next successful login.
+"""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import NamedTuple
+
+import bcrypt
+from flask import current_app, has_app_context
+
+try:
+    import argon2
+except ImportError:  # optional: pip install argon2-cffi
+    argon2 = None
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ('thread', 'process', 'inline')
+SCHEMES = ('bcrypt', 'argon2id')
+
+
+class HashPolicy(NamedTuple):
+    """Scheme and cost new hashes are made with"""
+    scheme: str = 'bcrypt'
+    rounds: int = 12
+    prefix: str = '2b'
+    handle_long_passwords: bool = False
+    time_cost: int = 3
+    memory_cost: int = 65536
+    parallelism: int = 4
+
+    @classmethod
+    def from_config(cls, config) -> 'HashPolicy':
+        policy = cls(
+            scheme=config.get('PASSWORD_HASH_SCHEME', 'bcrypt'),
+            rounds=int(config.get('BCRYPT_LOG_ROUNDS', 12)),
+            prefix=config.get('BCRYPT_HASH_PREFIX', '2b'),
+            handle_long_passwords=config.get('BCRYPT_HANDLE_LONG_PASSWORDS', False),
+            time_cost=int(config.get('ARGON2_TIME_COST', 3)),
+            memory_cost=int(config.get('ARGON2_MEMORY_COST', 65536)),
+            parallelism=int(config.get('ARGON2_PARALLELISM', 4)),
+        )
+        if policy.scheme not in SCHEMES:
+            raise ValueError(f"PASSWORD_HASH_SCHEME must be one of {', '.join(SCHEMES)}")
+        if policy.scheme == 'argon2id' and argon2 is None:
+            raise RuntimeError("PASSWORD_HASH_SCHEME=argon2id requires the argon2-cffi package")
+        return policy
+
+    def argon2_hasher(self):
+        return argon2.PasswordHasher(time_cost=self.time_cost, memory_cost=self.memory_cost,
+                                     parallelism=self.parallelism, type=argon2.Type.ID)
+
+    def needs_rehash(self, pw_hash: str) -> bool:
+        """Whether a stored hash was made under another scheme or cost"""
+        if self.scheme == 'argon2id':
+            return (not pw_hash.startswith('$argon2id$')
+                    or self.argon2_hasher().check_needs_rehash(pw_hash))
+        # bcrypt hashes look like $2b$12$<salt and checksum>
+        parts = pw_hash.split('$')
+        return not pw_hash.startswith('$2') or len(parts) < 4 or parts[2] != f'{self.rounds:02d}'
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when no hashing slot frees up within the queue timeout"""
+
+
+# Worker functions are module-level so a process pool can pickle them
+
+def _prepare(password, handle_long_passwords: bool) -> bytes:
+    if isinstance(password, str):
+        password = password.encode('utf-8')
+    if handle_long_passwords:
+        password = hashlib.sha256(password).hexdigest().encode('utf-8')
+    return password
+
+
+def _hash(password, policy: HashPolicy) -> str:
+    if policy.scheme == 'argon2id':
+        return policy.argon2_hasher().hash(password)
+    salt = bcrypt.gensalt(rounds=policy.rounds, prefix=policy.prefix.encode('ascii'))
+    return bcrypt.hashpw(_prepare(password, policy.handle_long_passwords), salt).decode('utf-8')
+
+
+def _verify(pw_hash: str, password, handle_long_passwords: bool) -> bool:
+    if pw_hash.startswith('$argon2'):
+        if argon2 is None:
+            raise RuntimeError("verifying argon2 hashes requires the argon2-cffi package")
+        # Cost parameters are read from the hash itself
+        try:
+            return argon2.PasswordHasher().verify(pw_hash, password)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            return False
+    pw_hash = pw_hash.encode('utf-8')
+    candidate = bcrypt.hashpw(_prepare(password, handle_long_passwords), pw_hash)
+    return hmac.compare_digest(candidate, pw_hash)
+
+
+class _HasherState:
+    """Pool, admission semaphore and counters of one app"""
+
+    def __init__(self, config):
+        self.policy = HashPolicy.from_config(config)
+        self.executor_name = config.get('PASSWORD_HASH_EXECUTOR', 'thread')
+        if self.executor_name not in EXECUTORS:
+            raise ValueError(f"PASSWORD_HASH_EXECUTOR must be one of {', '.join(EXECUTORS)}")
+        self.workers = int(config.get('PASSWORD_HASH_WORKERS')
+                           or max(1, (os.cpu_count() or 2) // 2))
+        self.max_pending = int(config.get('PASSWORD_HASH_MAX_PENDING') or self.workers * 8)
+        self.queue_timeout = float(config.get('PASSWORD_HASH_QUEUE_TIMEOUT', 5))
+
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+        self.dummy_hash = None
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def executor(self):
+        # Created on first use, so importing the app never forks or spawns
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.executor_name == 'process':
+                        self._executor = ProcessPoolExecutor(self.workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            self.workers, thread_name_prefix='hbnb-hash')
+        return self._executor
+
+    def _track(self, delta: int) -> None:
+        with self._lock:
+            self.pending += delta
+            if delta > 0:
+                self.peak_pending = max(self.peak_pending, self.pending)
+            else:
+                self.completed -= delta
+
+    def run(self, fn, *args):
+        """Run one hashing call on the pool, waiting for a free slot first"""
+        if self.executor_name == 'inline':
+            return fn(*args)
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self.rejected += 1
+            logger.warning("Password hashing queue full (%d pending)", self.pending)
+            raise PasswordHasherBusy("password hashing is saturated, retry shortly")
+        self._track(1)
+        try:
+            return self.executor.submit(fn, *args).result()
+        finally:
+            self._track(-1)
+            self._slots.release()
+
+    def run_many(self, fn, args_list):
+        """Run many hashing calls on the pool, in order; bulk paths skip admission"""
+        if self.executor_name == 'inline' or not args_list:
+            return [fn(*args) for args in args_list]
+        count = len(args_list)
+        self._track(count)
+        try:
+            chunksize = max(1, count // (self.workers * 4))
+            return list(self.executor.map(fn, *zip(*args_list), chunksize=chunksize))
+        finally:
+            self._track(-count)
+
+    def stats(self) -> dict:
+        return {
+            'scheme': self.policy.scheme,
+            'executor': self.executor_name,
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            'pending': self.pending,
+            # Hashes admitted but waiting for a worker
+            'queue_depth': max(0, self.pending - self.workers),
+            'peak_pending': self.peak_pending,
+            'completed': self.completed,
+            'rejected': self.rejected,
+        }
+
+
+class PasswordHasher:
+    """
+    Flask extension hashing and verifying passwords on a bounded pool.
+
+    Config:
+        PASSWORD_HASH_SCHEME: 'bcrypt' (default) or 'argon2id'
+        BCRYPT_LOG_ROUNDS, ARGON2_*: Cost of new hashes, see HashPolicy
+        PASSWORD_HASH_EXECUTOR: 'thread' (default), 'process' or 'inline'
+        PASSWORD_HASH_WORKERS: Hashes running at once (default: half the CPUs)
+        PASSWORD_HASH_MAX_PENDING: Hashes admitted at once, running or queued
+        PASSWORD_HASH_QUEUE_TIMEOUT: Seconds to wait for a slot before
+            PasswordHasherBusy is raised
+    """
+
+    def __init__(self, app=None):
+        self._default = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['password_hasher'] = _HasherState(app.config)
+
+    def _state(self) -> _HasherState:
+        if has_app_context():
+            state = current_app.extensions.get('password_hasher')
+            if state is not None:
+                return state
+        # Outside an app (scripts, shell): hash inline with the defaults
+        if self._default is None:
+            self._default = _HasherState({'PASSWORD_HASH_EXECUTOR': 'inline'})
+        return self._default
+
+    def hash(self, password: str) -> str:
+        """Hash a password; raises ValueError if it is empty"""
+        if not password:
+            raise ValueError("password is required")
+        state = self._state()
+        return state.run(_hash, password, state.policy)
+
+    def verify(self, pw_hash: str, password: str) -> bool:
+        """Check a password against a hash of either scheme in constant time"""
+        state = self._state()
+        return state.run(_verify, pw_hash, password, state.policy.handle_long_passwords)
+
+    def verify_dummy(self, password: str) -> bool:
+        """
+        Spend the cost of a real verify and return False.
+
+        Used for unknown emails, so response times do not tell which
+        accounts exist.
+        """
+        state = self._state()
+        if state.dummy_hash is None:
+            state.dummy_hash = state.run(_hash, os.urandom(16).hex(), state.policy)
+        self.verify(state.dummy_hash, password)
+        return False
+
+    def needs_rehash(self, pw_hash: str) -> bool:
+        """Whether a hash was made under another scheme or cost than configured"""
+        return self._state().policy.needs_rehash(pw_hash)
+
+    def hash_many(self, passwords) -> list[str]:
+        """
+        Hash many passwords across the whole pool, in order.
+
+        Meant for seeding and bulk imports: it does not wait for admission
+        slots, so run it outside login traffic.
+        """
+        passwords = list(passwords)
+        if not all(passwords):
+            raise ValueError("password is required")
+        state = self._state()
+        args = [(p, state.policy) for p in passwords]
+        return state.run_many(_hash, args)
+
+    def stats(self) -> dict:
+        return self._state().stats()
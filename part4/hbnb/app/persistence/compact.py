@@ -0,0 +1,149 @@
+"""
+Compact records for the in-memory repository.
+
+A model instance costs far more than its data: an instance __dict__,
+SQLAlchemy's InstanceState, two datetime objects and 36-character UUID
+strings. In compact mode InMemoryRepository stores each entity as a plain
+tuple of its column values instead, with
+
+    - primary and foreign key UUIDs as 16-byte strings, foreign keys
+      interned so that e.g. every review of a place shares one object
+    - DateTime columns as integer microseconds since the epoch
+    - every other column value as is
+
+and builds a model instance from the tuple whenever one is read. Only
+columns are kept: relationships (place.owner, place.amenities, ...) of
+the instances returned are not loaded, their foreign key columns are.
+For the same reason updates change the columns of the record directly,
+like SQLAlchemyRepository.update(), without the model's validation.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import DateTime, inspect
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+PLAIN, KEY, FOREIGN_KEY, TIME = range(4)
+
+
+def pack_id(value):
+    """16 bytes of a UUID string, or the value itself if it is not one"""
+    if (isinstance(value, str) and len(value) == 36
+            and value[8] == value[13] == value[18] == value[23] == '-'):
+        try:
+            # Several times faster than uuid.UUID(value).bytes
+            return bytes.fromhex(value.replace('-', ''))
+        except ValueError:
+            pass
+    return value
+
+
+def unpack_id(value):
+    if isinstance(value, bytes) and len(value) == 16:
+        h = value.hex()
+        return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
+    return value
+
+
+class RecordCodec:
+    """Converts instances of one model to compact tuples and back"""
+
+    def __init__(self, model):
+        self.model = model
+        self._class_manager = model.__mapper__.class_manager
+        self.columns = []
+        kinds = []
+        for attr in inspect(model).column_attrs:
+            column = attr.columns[0]
+            if column.primary_key:
+                kind = KEY
+            elif column.foreign_keys:
+                kind = FOREIGN_KEY
+            elif isinstance(column.type, DateTime):
+                kind = TIME
+            else:
+                kind = PLAIN
+            self.columns.append(attr.key)
+            kinds.append(kind)
+        self._kinds = tuple(kinds)
+        # Foreign keys are only set from relationships on flush, so read
+        # the related object's ID when the column is still empty
+        self._relationships = {}
+        for relationship in inspect(model).relationships:
+            if relationship.direction.name == 'MANYTOONE':
+                for column in relationship.local_columns:
+                    self._relationships[column.key] = relationship.key
+        self.positions = {name: i for i, name in enumerate(self.columns)}
+        self.id_position = self.positions['id']
+        self.created_position = self.positions.get('created_at')
+        self._interned = {}
+
+    def _encode(self, kind, value):
+        if value is None or kind == PLAIN:
+            return value
+        if kind == TIME:
+            return (value - EPOCH) // MICROSECOND
+        packed = pack_id(value)
+        if kind == FOREIGN_KEY:
+            packed = self._interned.setdefault(packed, packed)
+        return packed
+
+    @staticmethod
+    def _decode(kind, value):
+        if value is None or kind == PLAIN:
+            return value
+        if kind == TIME:
+            return EPOCH + timedelta(microseconds=value)
+        return unpack_id(value)
+
+    def _get(self, obj, name):
+        value = getattr(obj, name, None)
+        if value is None and name in self._relationships:
+            related = getattr(obj, self._relationships[name], None)
+            value = related.id if related is not None else None
+        return value
+
+    def encode(self, obj):
+        return tuple(self._encode(kind, self._get(obj, name))
+                     for name, kind in zip(self.columns, self._kinds))
+
+    def decode(self, record):
+        """A new, detached model instance holding the record's values"""
+        obj = self._class_manager.new_instance()
+        # As the ORM loads a row: values in __dict__ are the committed ones
+        obj.__dict__.update(zip(self.columns, map(self._decode, self._kinds, record)))
+        return obj
+
+    def replace(self, record, data):
+        """
+        Record with the columns in data changed and updated_at set to now,
+        as BaseModel.update() would (id and created_at are kept).
+        """
+        values = list(record)
+        data = dict(data, updated_at=datetime.utcnow())
+        for name, value in data.items():
+            position = self.positions.get(name)
+            if position is not None and name not in ('id', 'created_at'):
+                values[position] = self._encode(self._kinds[position], value)
+        return tuple(values)
+
+    def value(self, record, name):
+        """Decoded value of one attribute, building the instance only for non-columns"""
+        position = self.positions.get(name)
+        if position is None:
+            return getattr(self.decode(record), name, None)
+        return self._decode(self._kinds[position], record[position])
+
+    def encode_value(self, name, value):
+        """Stored form of a value of one column, to look it up (not interned)"""
+        kind = self._kinds[self.positions[name]]
+        if kind == FOREIGN_KEY:
+            return pack_id(value) if value is not None else None
+        return self._encode(kind, value)
+
+    def encode_time(self, value):
+        return self._encode(TIME, value)
+
+    def decode_time(self, value):
+        return self._decode(TIME, value)
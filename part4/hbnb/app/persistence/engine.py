@@ -0,0 +1,45 @@
+"""
+Per-connection setup of the database engine.
+
+SQLite keeps most settings per connection, so the SQLITE_PRAGMAS of the
+config are run by a connect-event hook on every connection the pool
+opens. journal_mode=WAL is stored in the database file itself; the
+others (synchronous, cache_size, mmap_size, busy_timeout, ...) would
+otherwise silently fall back to the defaults on each new connection.
+"""
+import logging
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+
+def _set_pragmas(pragmas):
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+    return on_connect
+
+
+def configure_engine(app, db):
+    """
+    Install the connect hook running SQLITE_PRAGMAS on the app's engine.
+
+    Nothing is done for other databases or when no PRAGMAs are configured.
+    """
+    pragmas = app.config.get('SQLITE_PRAGMAS')
+    if not pragmas:
+        return
+    with app.app_context():
+        engine = db.engine
+    if engine.dialect.name != 'sqlite':
+        return
+    for name, value in pragmas.items():
+        if not name.isidentifier() or not str(value).replace('-', '', 1).isalnum():
+            raise ValueError(f"invalid SQLite PRAGMA {name}={value!r}")
+    event.listen(engine, 'connect', _set_pragmas(dict(pragmas)))
+    logger.debug("SQLite PRAGMAs: %s", pragmas)
@@ -0,0 +1,182 @@
+"""
+Per-process read-through cache of entity rows.
+
+Sessions are scoped to a request, so ORM instances cannot be shared
+between requests. The cache keeps a snapshot of an instance's column
+values instead, and a hit rebuilds a clean persistent instance in the
+current session without a SELECT (SQLAlchemy's make_transient_to_detached
+recipe). Misses can be cached too (negative entries, with their own TTL),
+so repeated lookups of unknown keys stay off the database as well.
+
+Entries expire after a TTL and the least recently used ones are evicted
+past max_entries. Writers must invalidate the keys they change; other
+processes only see a change once their entries expire, so keep the TTL
+short when several workers share a database.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, has_app_context
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Returned by TTLCache.get() when a key is not cached
+MISS = object()
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire after a TTL"""
+
+    def __init__(self, max_entries: int, ttl: float, negative_ttl: float,
+                 clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """Get a cached value (None for a cached miss), or MISS"""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS
+            expires, value = entry
+            if expires <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            if value is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key, value) -> None:
+        """Cache a value, or None to remember that the key does not exist"""
+        ttl = self.negative_ttl if value is None else self.ttl
+        if ttl <= 0:
+            return
+        expires = self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys) -> None:
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'negative_hits': self.negative_hits,
+            'misses': self.misses,
+            'hit_ratio': round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+        }
+
+
+def snapshot(obj, exclude=()) -> dict | None:
+    """
+    Column values of a loaded instance, or None if some are not loaded.
+
+    Columns in exclude are left out; a restored instance loads them from
+    the database when they are first read.
+    """
+    state = inspect(obj)
+    values = {}
+    for attr in state.mapper.column_attrs:
+        if attr.key in exclude:
+            continue
+        if attr.key not in state.dict:
+            return None
+        values[attr.key] = state.dict[attr.key]
+    return values
+
+
+def restore(model, values: dict):
+    """
+    Get the instance for a snapshot in the current session, without a query.
+
+    An instance already in the session's identity map wins, so pending
+    changes made earlier in the request are never overwritten.
+    """
+    from hbnb.app import db
+    session = db.session
+    key = session.identity_key(model, values['id'])
+    existing = session.identity_map.get(key)
+    if existing is not None:
+        return existing
+    obj = model.__mapper__.class_manager.new_instance()
+    for name, value in values.items():
+        set_committed_value(obj, name, value)
+    make_transient_to_detached(obj)
+    session.add(obj)
+    return obj
+
+
+class IdentityCache:
+    """
+    Flask extension holding the per-process entity cache.
+
+    Config:
+        USER_CACHE_TTL: Seconds a cached user stays valid, 0 disables the cache
+        USER_CACHE_NEGATIVE_TTL: Seconds a lookup miss is remembered, 0 disables
+        USER_CACHE_MAX_ENTRIES: Entry count bound of the LRU
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        ttl = float(app.config.get('USER_CACHE_TTL', 0))
+        cache = None
+        if ttl > 0:
+            cache = TTLCache(
+                max_entries=int(app.config.get('USER_CACHE_MAX_ENTRIES', 4096)),
+                ttl=ttl,
+                negative_ttl=float(app.config.get('USER_CACHE_NEGATIVE_TTL', 0)),
+            )
+        app.extensions['identity_cache'] = cache
+
+    @property
+    def cache(self) -> TTLCache | None:
+        """The configured cache, None when disabled or outside an app"""
+        if not has_app_context():
+            return None
+        return current_app.extensions.get('identity_cache')
+
+    def stats(self) -> dict:
+        cache = self.cache
+        if cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **cache.stats()}
@@ -1,4 +1,16 @@
+import heapq
+import os
+import threading
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from itertools import islice
+from operator import itemgetter
+from typing import NamedTuple
+
+from hbnb.app.persistence.compact import RecordCodec, pack_id, unpack_id
+from hbnb.app.persistence.snapshot import MutationLog, Snapshot, write_snapshot
+from hbnb.app.persistence.unit_of_work import commit
 
 
 class Repository(ABC):
@@ -6,14 +18,26 @@ class Repository(ABC):
     def add(self, obj):
         pass
 
+    @abstractmethod
+    def add_all(self, objs):
+        pass
+
     @abstractmethod
     def get(self, obj_id):
         pass
 
+    @abstractmethod
+    def get_many(self, obj_ids):
+        pass
+
     @abstractmethod
     def get_all(self):
         pass
 
+    @abstractmethod
+    def get_page(self, limit, after=None):
+        pass
+
     @abstractmethod
     def update(self, obj_id, data):
         pass
@@ -27,41 +51,573 @@ class Repository(ABC):
         pass
 
 
+class Index(NamedTuple):
+    """
+    Secondary index of an InMemoryRepository on one attribute.
+
+    A hash index answers equality lookups in O(1); an ordered one keeps
+    (value, id) pairs sorted for O(log n) equality and range lookups.
+    Unique indexes reject a second object with the same value.
+    """
+    attr: str
+    unique: bool = False
+    ordered: bool = False
+
+
 class InMemoryRepository(Repository):
-    def __init__(self):
-        self._storage = {}
+    """
+    Thread-safe in-memory repository with optional secondary indexes.
+
+    Objects are spread over `stripes` shards, each guarded by one lock that
+    also guards the hash index entries whose (attribute, value) falls in
+    it, so writes to different objects and values rarely wait for each
+    other. Ordered indexes and the (created_at, id) order of pagination are
+    sorted lists under one extra lock. A write locks the stripes of the
+    object and of its old and new indexed values, in ascending order, then
+    that lock if needed; reads by ID take no lock.
+
+        repo = InMemoryRepository([Index('email', unique=True),
+                                   Index('price', ordered=True)])
+
+    Indexed attributes must be hashable; ordered ones must compare with
+    each other (None values are left out of ordered indexes).
+
+    With compact=True (which needs the model class) entities are stored
+    as compact tuples of their column values (see
+    hbnb.app.persistence.compact) and every read builds a new instance
+    without relationships; change them through update(), not in place,
+    and validate the data beforehand as update() cannot.
+
+    Given a path as well, the entities outlive the process: snapshot()
+    writes them all to that file, every `snapshot_every` writes, and each
+    write since is appended to path + '.log' (synced to disk if fsync).
+    A new repository maps the snapshot and replays the log rather than
+    loading anything, so it starts as fast with a million entities as
+    with none; snapshot records are decoded as they are read, and shadowed
+    by the in-memory copies of the ones changed since. Writes wait while
+    a snapshot is written. See hbnb.app.persistence.snapshot.
+
+        repo = InMemoryRepository([Index('place_id')], model=Review,
+                                  compact=True, path='reviews.snapshot')
+    """
+
+    def __init__(self, indexes=(), stripes=16, model=None, compact=False,
+                 path=None, snapshot_every=100000, fsync=False):
+        if compact and model is None:
+            raise ValueError("compact storage needs the model class")
+        if path is not None and not compact:
+            raise ValueError("snapshots need compact storage")
+        self.model = model
+        self._codec = RecordCodec(model) if compact else None
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        # Shards of {key: stored}, keys and stored items being the IDs and
+        # objects, or the packed IDs and records in compact mode
+        self._shards = [{} for _ in range(stripes)]
+        self._indexes = {index.attr: index for index in indexes}
+        # attr -> {value: {key: None}}, keys in insertion order
+        self._hash = {index.attr: {} for index in indexes if not index.ordered}
+        # attr -> sorted [(value, key)]
+        self._sorted = {index.attr: [] for index in indexes if index.ordered}
+        self._sorted_lock = threading.Lock()
+        # (created_at, key) pairs kept sorted for keyset pagination
+        self._order = []
+        self.path = path
+        self.snapshot_every = snapshot_every
+        # Snapshot holding the entities not in the shards, and log of the
+        # writes since it was taken
+        self._base = None
+        self._log = None
+        self._writes = 0
+        if path is not None:
+            self._open(path, fsync)
+
+    def _open(self, path, fsync):
+        rebuild = False
+        if os.path.exists(path):
+            base = Snapshot(path)
+            if base.columns != self._codec.columns:
+                base.close()
+                raise ValueError(f"{path} does not hold {self.model.__name__} records")
+            self._base = base
+            rebuild = (base.hash_indexes != set(self._hash)
+                       or base.ordered_indexes != set(self._sorted))
+        for op, value in MutationLog.replay(path + '.log'):
+            if op == 'put':
+                self._put(value[self._codec.id_position], value, check=False)
+            else:
+                self._delete_key(value)
+        self._log = MutationLog(path + '.log', fsync)
+        if rebuild:
+            # Indexes changed since the snapshot was written
+            self.snapshot()
+
+    # ----- stored item conversions
+
+    def _key(self, obj_id):
+        return pack_id(obj_id) if self._codec is not None else obj_id
+
+    def _store(self, obj):
+        """(key, stored item) of an object"""
+        if self._codec is None:
+            return obj.id, obj
+        record = self._codec.encode(obj)
+        return record[self._codec.id_position], record
+
+    def _load(self, stored):
+        if stored is None or self._codec is None:
+            return stored
+        return self._codec.decode(stored)
+
+    def _values(self, stored):
+        """Indexed attribute values of a stored item, or {} for None"""
+        if stored is None:
+            return {}
+        if self._codec is None:
+            return {attr: getattr(stored, attr, None) for attr in self._indexes}
+        return {attr: self._codec.value(stored, attr) for attr in self._indexes}
+
+    def _order_key(self, stored):
+        if self._codec is None:
+            return stored.created_at, stored.id
+        codec = self._codec
+        return stored[codec.created_position], stored[codec.id_position]
+
+    # ----- locking and indexes
+
+    def _stripe(self, key):
+        return hash(key) % len(self._locks)
+
+    def _shard(self, key):
+        return self._shards[self._stripe(key)]
+
+    @contextmanager
+    def _locked(self, key, *value_maps, ordered=False, every_stripe=False):
+        """
+        Hold the locks of key and of the hash index entries of value_maps,
+        or of every stripe when the values are not known beforehand
+        """
+        stripes = set(range(len(self._locks))) if every_stripe else {self._stripe(key)}
+        for values in value_maps:
+            stripes.update(self._stripe((attr, value)) for attr, value in values.items()
+                           if attr in self._hash)
+        locks = [self._locks[stripe] for stripe in sorted(stripes)]
+        if ordered:
+            locks.append(self._sorted_lock)
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _check_unique(self, key, values):
+        for attr, value in values.items():
+            if not self._indexes[attr].unique:
+                continue
+            if attr in self._hash:
+                taken = any(other != key for other in self._hash[attr].get(value, ()))
+            elif value is None:
+                continue
+            else:
+                taken = any(other != key for other in self._sorted_keys(attr, value))
+            if not taken and self._base is not None:
+                taken = any(record[self._codec.id_position] != key
+                            for record in self._base_matches(attr, value))
+            if taken:
+                raise ValueError(f"{attr} {value!r} already exists")
+
+    def _sorted_keys(self, attr, value):
+        """Keys with this value in an ordered index (under _sorted_lock)"""
+        entries = self._sorted[attr]
+        index = bisect_left(entries, (value,))
+        while index < len(entries) and entries[index][0] == value:
+            yield entries[index][1]
+            index += 1
+
+    def _index(self, key, values):
+        for attr, value in values.items():
+            if attr in self._hash:
+                self._hash[attr].setdefault(value, {})[key] = None
+            elif value is not None:
+                insort(self._sorted[attr], (value, key))
+
+    def _unindex(self, key, values):
+        for attr, value in values.items():
+            if attr in self._hash:
+                keys = self._hash[attr].get(value)
+                if keys is not None:
+                    keys.pop(key, None)
+                    if not keys:
+                        del self._hash[attr][value]
+            elif value is not None:
+                self._remove_sorted(self._sorted[attr], (value, key))
+
+    @staticmethod
+    def _remove_sorted(entries, item):
+        index = bisect_left(entries, item)
+        if index < len(entries) and entries[index] == item:
+            del entries[index]
+
+    # ----- snapshot and log
+
+    def _current(self, key):
+        """
+        (stored item or None, origin) of key, origin being the snapshot
+        and the number of the record if it comes from one
+        """
+        stored = self._shard(key).get(key)
+        base = self._base
+        if stored is not None or base is None:
+            return stored, (base, None)
+        number = base.find(key)
+        if number is None or number in base.shadowed:
+            return None, (base, None)
+        return base.record(number), (base, number)
+
+    def _is_current(self, key, stored, origin):
+        """Whether _current(key) would still return this (under key's lock)"""
+        base, number = origin
+        if base is not self._base:
+            return False
+        if number is None:
+            return self._shard(key).get(key) is stored
+        return number not in base.shadowed and key not in self._shard(key)
+
+    def _discard(self, key, stored, origin, values):
+        """Remove the current item of key (under its locks)"""
+        base, number = origin
+        if number is not None:
+            base.shadowed.add(number)
+            return
+        del self._shard(key)[key]
+        self._unindex(key, values)
+        self._remove_sorted(self._order, self._order_key(stored))
+
+    def _base_matches(self, attr, value):
+        """Snapshot records (not shadowed) whose indexed attribute equals value"""
+        base = self._base
+        if base is None:
+            return
+        encoded = self._codec.encode_value(attr, value)
+        if attr in self._hash:
+            numbers = base.postings(attr, encoded)
+        elif value is None:
+            return
+        else:
+            numbers = base.range(attr, self._codec.positions[attr], encoded, encoded)
+        for number in numbers:
+            record = base.live(number)
+            if record is not None:
+                yield record
+
+    def _logged(self, op, value):
+        if self._log is not None:
+            self._log.append(op, value)
+
+    def _written(self):
+        if self._log is not None:
+            self._writes += 1
+            if self.snapshot_every and self._writes >= self.snapshot_every:
+                self.snapshot()
+
+    def snapshot(self):
+        """
+        Write every entity to the snapshot file, read from it from then on,
+        and empty the memory and the log. Writes wait meanwhile.
+        """
+        if self.path is None:
+            raise ValueError("repository has no snapshot path")
+        locks = [*self._locks, self._sorted_lock]
+        for lock in locks:
+            lock.acquire()
+        try:
+            records = [stored for _, stored in self._merged(list(self._order))]
+            write_snapshot(self.path, self._codec.columns, records,
+                           list(self._hash), list(self._sorted))
+            # Map the new snapshot before emptying the shards: reads by ID
+            # find each entity in one or the other meanwhile
+            self._base = Snapshot(self.path)
+            for shard in self._shards:
+                shard.clear()
+            for entries in (*self._hash.values(), *self._sorted.values()):
+                entries.clear()
+            self._order.clear()
+            self._log.truncate()
+            self._writes = 0
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def close(self):
+        """Close the log and the snapshot (the repository is unusable afterwards)"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if self._base is not None:
+            self._base.close()
+            self._base = None
+
+    # ----- Repository interface
 
     def add(self, obj):
-        self._storage[obj.id] = obj
+        """
+        Add an object, replacing the one with the same ID.
+
+        Raises:
+            ValueError: if a unique index already holds one of its values
+        """
+        self._put(*self._store(obj))
+        self._written()
+
+    def _put(self, key, stored, check=True):
+        values = self._values(stored)
+        shard = self._shard(key)
+        while True:
+            old, origin = self._current(key)
+            old_values = self._values(old)
+            with self._locked(key, old_values, values, ordered=True):
+                if not self._is_current(key, old, origin):
+                    continue  # replaced meanwhile: lock its values instead
+                if check:
+                    self._check_unique(key, values)
+                if old is not None:
+                    self._discard(key, old, origin, old_values)
+                shard[key] = stored
+                self._index(key, values)
+                insort(self._order, self._order_key(stored))
+                self._logged('put', stored)
+                return
+
+    def add_all(self, objs):
+        for obj in objs:
+            self.add(obj)
 
     def get(self, obj_id):
-        return self._storage.get(obj_id)
+        return self._get_key(self._key(obj_id))
+
+    def _get_key(self, key):
+        return self._load(self._current(key)[0])
+
+    def get_many(self, obj_ids):
+        found = {}
+        for obj_id in obj_ids:
+            obj = self.get(obj_id)
+            if obj is not None:
+                found[obj_id] = obj
+        return found
+
+    def _get_keys(self, keys):
+        objs = (self._get_key(key) for key in keys)
+        return [obj for obj in objs if obj is not None]
+
+    def _ordered(self, after=None, limit=None):
+        """(order key, stored item) pairs after the key, oldest first"""
+        with self._sorted_lock:
+            start = bisect_right(self._order, after) if after else 0
+            end = start + limit if limit is not None else len(self._order)
+            entries = self._order[start:end]
+        return self._merged(entries, after)
+
+    def _merged(self, entries, after=None):
+        """Items of these _order entries merged with the snapshot's after the key"""
+        items = ((entry, self._shard(entry[1]).get(entry[1])) for entry in entries)
+        items = (item for item in items if item[1] is not None)
+        base = self._base
+        if base is None:
+            return items
+
+        def snapshot_items():
+            for number in range(base.after(after) if after else 0, base.count):
+                record = base.live(number)
+                if record is not None:
+                    yield self._order_key(record), record
+
+        return heapq.merge(items, snapshot_items(), key=itemgetter(0))
 
     def get_all(self):
-        return list(self._storage.values())
+        """All objects, oldest first"""
+        return [self._load(stored) for _, stored in self._ordered()]
+
+    def get_page(self, limit, after=None):
+        if after and self._codec is not None:
+            after = (self._codec.encode_time(after[0]), pack_id(after[1]))
+        items = list(islice(self._ordered(after, limit + 1), limit + 1))
+        next_key = items[limit - 1][0] if len(items) > limit else None
+        if next_key and self._codec is not None:
+            next_key = (self._codec.decode_time(next_key[0]), unpack_id(next_key[1]))
+        return [self._load(stored) for _, stored in items[:limit]], next_key
 
     def update(self, obj_id, data):
-        obj = self.get(obj_id)
-        if obj:
+        """
+        Update an object through its update() method (in compact mode, by
+        changing the record's columns) and reindex it.
+
+        Raises:
+            ValueError: if a unique index already holds one of the new
+                values, or the object rejects the data
+        """
+        key = self._key(obj_id)
+        shard = self._shard(key)
+        while True:
+            stored, origin = self._current(key)
+            if stored is None:
+                return
+            from_snapshot = origin[1] is not None
+            old_values = self._values(stored)
+            new_values = {attr: data.get(attr, value) for attr, value in old_values.items()}
+            # Reindexing rewrites the ordered index lists (and update() may
+            # change values not in data, e.g. updated_at): lock them too.
+            # An object's update() may also normalize or derive hash indexed
+            # values, so their entries are only known once it has run
+            ordered = from_snapshot or bool(self._sorted)
+            in_place = self._codec is None
+            with self._locked(key, old_values, new_values, ordered=ordered,
+                              every_stripe=in_place and bool(self._hash)):
+                if not self._is_current(key, stored, origin):
+                    continue
+                if in_place:
+                    self._update_in_place(key, stored, data, old_values)
+                    return
+                self._check_unique(key, new_values)
+                new = shard[key] = self._codec.replace(stored, data)
+                if from_snapshot:
+                    self._discard(key, stored, origin, old_values)
+                    insort(self._order, self._order_key(new))
+                else:
+                    self._unindex(key, old_values)
+                self._index(key, self._values(new))
+                self._logged('put', new)
+                break
+        self._written()
+
+    def _update_in_place(self, key, obj, data, old_values):
+        """update() an object under the locks of update(), then reindex it"""
+        saved = {attr: getattr(obj, attr) for attr in (*data, *old_values, 'updated_at')
+                 if hasattr(obj, attr)}
+        try:
             obj.update(data)
+        except BaseException:
+            # Also when update() fails after setting some attributes
+            self._unindex(key, old_values)
+            self._index(key, self._values(obj))
+            raise
+        values = self._values(obj)
+        try:
+            self._check_unique(key, values)
+        except ValueError:
+            # Taken by another object: undo the update
+            for attr, value in saved.items():
+                setattr(obj, attr, value)
+            raise
+        self._unindex(key, old_values)
+        self._index(key, values)
 
     def delete(self, obj_id):
-        if obj_id in self._storage:
-            del self._storage[obj_id]
+        if self._delete_key(self._key(obj_id)):
+            self._written()
+
+    def _delete_key(self, key):
+        while True:
+            stored, origin = self._current(key)
+            if stored is None:
+                return False
+            values = self._values(stored)
+            with self._locked(key, values, ordered=True):
+                if not self._is_current(key, stored, origin):
+                    continue
+                self._discard(key, stored, origin, values)
+                self._logged('del', key)
+                return True
 
     def get_by_attribute(self, attr_name, attr_value):
-        return next(
-            (
-                obj
-                for obj in self._storage.values()
-                if getattr(obj, attr_name) == attr_value
-            ),
-            None,
-        )
+        """
+        First object (oldest for unindexed attributes) whose attribute
+        equals the value: O(1) on a hash index, O(log n) on an ordered
+        one, a scan otherwise.
+        """
+        if attr_name in self._indexes:
+            record = next(self._base_matches(attr_name, attr_value), None)
+            if record is not None:
+                return self._load(record)
+        if attr_name in self._hash:
+            with self._locks[self._stripe((attr_name, attr_value))]:
+                keys = self._hash[attr_name].get(attr_value)
+                key = next(iter(keys)) if keys else None
+        elif attr_name in self._sorted:
+            with self._sorted_lock:
+                key = next(self._sorted_keys(attr_name, attr_value), None)
+        else:
+            return next((obj for obj in self.get_all()
+                         if getattr(obj, attr_name) == attr_value), None)
+        return self._get_key(key) if key is not None else None
+
+    def get_all_by_attribute(self, attr_name, values):
+        """Every object whose attribute is one of the values, using its index if any"""
+        values = list(dict.fromkeys(values))
+        if attr_name in self._hash:
+            keys = []
+            for value in values:
+                with self._locks[self._stripe((attr_name, value))]:
+                    keys.extend(self._hash[attr_name].get(value, ()))
+        elif attr_name in self._sorted:
+            with self._sorted_lock:
+                keys = [key for value in values for key in self._sorted_keys(attr_name, value)]
+        else:
+            wanted = set(values)
+            return [obj for obj in self.get_all() if getattr(obj, attr_name) in wanted]
+        found = [self._load(record) for value in values
+                 for record in self._base_matches(attr_name, value)]
+        return found + self._get_keys(dict.fromkeys(keys))
+
+    def get_range(self, attr_name, low=None, high=None):
+        """
+        Objects whose ordered-index attribute is within [low, high] (either
+        bound may be None), in ascending order of the attribute.
+
+        Raises:
+            KeyError: if the attribute has no ordered index
+        """
+        entries = self._sorted[attr_name]
+        with self._sorted_lock:
+            start = bisect_left(entries, (low,)) if low is not None else 0
+            end = len(entries)
+            if high is not None:
+                end = bisect_left(entries, (high,))
+                while end < len(entries) and entries[end][0] == high:
+                    end += 1
+            entries = entries[start:end]
+        base = self._base
+        if base is None:
+            return self._get_keys(key for _, key in entries)
+        codec = self._codec
+        items = ((entry, self._shard(entry[1]).get(entry[1])) for entry in entries)
+        items = (item for item in items if item[1] is not None)
+        numbers = base.range(
+            attr_name, codec.positions[attr_name],
+            codec.encode_value(attr_name, low) if low is not None else None,
+            codec.encode_value(attr_name, high) if high is not None else None)
+        records = (base.live(number) for number in numbers)
+        snapshot_items = (((codec.value(record, attr_name), record[codec.id_position]), record)
+                          for record in records if record is not None)
+        return [self._load(stored) for _, stored
+                in heapq.merge(items, snapshot_items, key=itemgetter(0))]
+
+    def __len__(self):
+        base = self._base
+        return sum(len(shard) for shard in self._shards) + (len(base) if base else 0)
 
 
 class SQLAlchemyRepository(Repository):
-    """SQLAlchemy-based repository for database persistence"""
+    """
+    SQLAlchemy-based repository for database persistence.
+
+    Writes commit immediately, except inside a unit of work (see
+    hbnb.app.persistence.unit_of_work), which commits them all at once.
+    """
+
+    # Values bound per IN (...) query, below SQLite's host parameter limit
+    IN_CHUNK_SIZE = 500
     
     def __init__(self, model):
         """
@@ -81,7 +637,18 @@ class SQLAlchemyRepository(Repository):
         """
         from hbnb.app import db
         db.session.add(obj)
-        db.session.commit()
+        commit()
+
+    def add_all(self, objs):
+        """
+        Add several objects to the database in a single transaction.
+
+        Args:
+            objs: Object instances to add; none are stored if one fails
+        """
+        from hbnb.app import db
+        db.session.add_all(objs)
+        commit()
     
     def get(self, obj_id):
         """
@@ -103,6 +670,118 @@ class SQLAlchemyRepository(Repository):
             List of all objects
         """
         return self.model.query.all()
+
+    def get_all_by_attribute(self, attr_name, values):
+        """
+        Retrieve every object whose attribute is one of the values, with
+        one IN query per IN_CHUNK_SIZE values.
+
+        Args:
+            attr_name: Name of the attribute to filter by
+            values: Values to match; duplicates are ignored
+
+        Returns:
+            List of matching objects, in no particular order
+        """
+        column = getattr(self.model, attr_name)
+        values = list(dict.fromkeys(values))
+        objs = []
+        for start in range(0, len(values), self.IN_CHUNK_SIZE):
+            chunk = values[start:start + self.IN_CHUNK_SIZE]
+            objs.extend(self.model.query.filter(column.in_(chunk)).all())
+        return objs
+
+    def get_ids_by_attribute(self, attr_name, values):
+        """
+        Map attribute values to object IDs without loading the objects,
+        with one IN query per IN_CHUNK_SIZE values.
+
+        Args:
+            attr_name: Name of the attribute to filter by
+            values: Values to match; duplicates are ignored
+
+        Returns:
+            Dict of value to ID (of the first object found, if several
+            share it), without the values that were not found
+        """
+        column = getattr(self.model, attr_name)
+        return self._ids_by(column, list(dict.fromkeys(values)))
+
+    def _ids_by(self, key, values):
+        """{key value: id} of the rows whose key expression is in values"""
+        from hbnb.app import db
+        found = {}
+        for start in range(0, len(values), self.IN_CHUNK_SIZE):
+            chunk = values[start:start + self.IN_CHUNK_SIZE]
+            rows = db.session.query(key, self.model.id).filter(key.in_(chunk))
+            for value, obj_id in rows:
+                found.setdefault(value, obj_id)
+        return found
+
+    def get_many(self, obj_ids):
+        """
+        Retrieve several objects by ID with a single IN query (one per
+        IN_CHUNK_SIZE IDs).
+
+        Args:
+            obj_ids: The unique identifiers of the objects
+
+        Returns:
+            Dict of ID to object, without the IDs that were not found
+        """
+        return {obj.id: obj for obj in self.get_all_by_attribute('id', obj_ids)}
+
+    def get_page(self, limit, after=None):
+        """
+        Retrieve one page of objects ordered by (created_at, id).
+
+        Args:
+            limit: Maximum number of objects to return
+            after: (created_at, id) key of the last object of the previous page
+
+        Returns:
+            Tuple of (objects, key of the last object or None if no more pages)
+        """
+        return self._paginate(self.model.query, limit, after)
+
+    def _paginate(self, query, limit, after=None, sort_by='created_at', descending=False):
+        """
+        Apply keyset pagination on (sort_by, id) to a query.
+
+        The after key must hold a value of the sort column's type, otherwise
+        ValueError is raised (e.g. a cursor reused with a different sort).
+        """
+        from sqlalchemy import and_, or_
+        column = getattr(self.model, sort_by)
+        id_column = self.model.id
+        if after:
+            value, obj_id = after
+            expected = column.type.python_type
+            if expected is float and isinstance(value, int):
+                value = float(value)
+            if not isinstance(value, expected):
+                raise ValueError("cursor does not match the requested sort order")
+            if descending:
+                query = query.filter(or_(
+                    column < value,
+                    and_(column == value, id_column < obj_id),
+                ))
+            else:
+                query = query.filter(or_(
+                    column > value,
+                    and_(column == value, id_column > obj_id),
+                ))
+        if descending:
+            query = query.order_by(column.desc(), id_column.desc())
+        else:
+            query = query.order_by(column, id_column)
+        if limit is None:
+            return query.all(), None
+        rows = query.limit(limit + 1).all()
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            return rows[:limit], (getattr(last, sort_by), last.id)
+        return rows, None
     
     def update(self, obj_id, data):
         """
@@ -112,12 +791,11 @@ class SQLAlchemyRepository(Repository):
             obj_id: The unique identifier of the object
             data: Dictionary of attributes to update
         """
-        from hbnb.app import db
         obj = self.get(obj_id)
         if obj:
             for key, value in data.items():
                 setattr(obj, key, value)
-            db.session.commit()
+            commit()
     
     def delete(self, obj_id):
         """
@@ -130,7 +808,7 @@ class SQLAlchemyRepository(Repository):
         obj = self.get(obj_id)
         if obj:
             db.session.delete(obj)
-            db.session.commit()
+            commit()
     
     def get_by_attribute(self, attr_name, attr_value):
         """
@@ -0,0 +1,304 @@
+"""
+Snapshot files and mutation logs of compact in-memory repositories.
+
+A snapshot is read through mmap and never loaded as a whole: opening one
+costs the same for a thousand entities or a million, and a record is
+only decoded when it is read. Its sections are
+
+    records     every record marshalled, oldest (created_at, id) first
+    offsets     uint64 start of each record, plus the end of the last
+    keys        open-addressing table of (16-byte key digest, record
+                number + 1) slots
+    per hash index: an open-addressing table of (value digest, first
+                posting, posting count) slots, and the postings, record
+                numbers grouped by value in record order
+    per ordered index: record numbers sorted by (value, key)
+
+after an 8-byte magic and the marshalled metadata (schema, counts and
+section offsets). Writes made since the snapshot go to a log of
+length-prefixed marshalled ('put', record) and ('del', key) entries,
+replayed on the next start; a torn last entry is dropped.
+"""
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+MAGIC = b'HBNBSNP1'
+META_LENGTH = struct.Struct('<I')
+KEY_SLOT = struct.Struct('<16sI')
+VALUE_SLOT = struct.Struct('<16sII')
+LOG_ENTRY = struct.Struct('<I')
+EMPTY = bytes(16)
+
+
+def digest(value) -> bytes:
+    """
+    16-byte digest of a packed key or encoded column value, equal for
+    values equal as dict keys (marshal output can differ for equal strings)
+    """
+    if isinstance(value, bytes) and len(value) == 16 and value != EMPTY:
+        return value
+    if isinstance(value, str):
+        data = b's' + value.encode('utf-8', 'surrogatepass')
+    elif isinstance(value, bytes):
+        data = b'b' + value
+    elif isinstance(value, (int, float)):
+        if isinstance(value, bool) or (isinstance(value, float) and value.is_integer()):
+            value = int(value)
+        data = b'n' + repr(value).encode()
+    else:
+        data = marshal.dumps(value)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _table_size(count):
+    size = 8
+    while size < count * 2:
+        size *= 2
+    return size
+
+
+def _probe(size, slot, key):
+    """Offsets of the slots to try for a key, in a table of size slots"""
+    index = int.from_bytes(key[:8], 'little') & (size - 1)
+    while True:
+        yield index * slot.size
+        index = (index + 1) & (size - 1)
+
+
+def write_snapshot(path, columns, records, hash_indexes=(), ordered_indexes=()):
+    """
+    Write records (encoded tuples, sorted by (created_at, key)) to path
+    atomically, with the tables of the indexes on the named columns.
+
+    Args:
+        columns: Column names of the records; 'id' is the key
+        hash_indexes: Names of the hash-indexed columns
+        ordered_indexes: Names of the columns with an ordered index
+    """
+    positions = {name: i for i, name in enumerate(columns)}
+    id_position = positions['id']
+    count = len(records)
+
+    blobs = [marshal.dumps(record) for record in records]
+    offsets = array('Q', [0]) * (count + 1)
+    position = 0
+    for i, blob in enumerate(blobs):
+        offsets[i] = position
+        position += len(blob)
+    offsets[count] = position
+
+    key_size = _table_size(count)
+    keys = bytearray(key_size * KEY_SLOT.size)
+    for i, record in enumerate(records):
+        key = digest(record[id_position])
+        for offset in _probe(key_size, KEY_SLOT, key):
+            if keys[offset:offset + 16] == EMPTY:
+                KEY_SLOT.pack_into(keys, offset, key, i + 1)
+                break
+
+    sections = [b''.join(blobs), offsets.tobytes(), bytes(keys)]
+    meta = {'columns': list(columns), 'count': count, 'key_slots': key_size,
+            'hash': {}, 'ordered': {}}
+
+    for name in hash_indexes:
+        groups = {}
+        for i, record in enumerate(records):
+            groups.setdefault(digest(record[positions[name]]), []).append(i)
+        size = _table_size(len(groups))
+        table = bytearray(size * VALUE_SLOT.size)
+        postings = array('I')
+        for value, members in groups.items():
+            for offset in _probe(size, VALUE_SLOT, value):
+                if table[offset:offset + 16] == EMPTY:
+                    VALUE_SLOT.pack_into(table, offset, value, len(postings), len(members))
+                    break
+            postings.extend(members)
+        meta['hash'][name] = (len(sections), size)
+        sections += [bytes(table), postings.tobytes()]
+
+    for name in ordered_indexes:
+        position = positions[name]
+        members = [i for i, record in enumerate(records) if record[position] is not None]
+        members.sort(key=lambda i: (records[i][position], records[i][id_position]))
+        meta['ordered'][name] = len(sections)
+        sections.append(array('I', members).tobytes())
+
+    # Sections start 8-byte aligned, offsets counted from the first one
+    bounds, start = [], 0
+    for section in sections:
+        start += -start % 8
+        bounds.append((start, start + len(section)))
+        start += len(section)
+    meta['sections'] = bounds
+    meta_blob = marshal.dumps(meta)
+    header = MAGIC + META_LENGTH.pack(len(meta_blob)) + meta_blob
+    header += bytes(-len(header) % 8)
+
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(header)
+        for (begin, _), section in zip(bounds, sections):
+            f.write(bytes(len(header) + begin - f.tell()))
+            f.write(section)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class Snapshot:
+    """
+    Read-only view of a snapshot file.
+
+    `shadowed` holds the numbers of the records replaced or deleted since
+    the snapshot was written; the repository skips them.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a repository snapshot")
+        start = len(MAGIC) + META_LENGTH.size
+        (meta_length,) = META_LENGTH.unpack_from(self._map, len(MAGIC))
+        meta = marshal.loads(self._map[start:start + meta_length])
+        data = start + meta_length + -(start + meta_length) % 8
+        self.columns = meta['columns']
+        self.count = meta['count']
+        self.id_position = self.columns.index('id')
+        self.created_position = self.columns.index('created_at')
+        self.shadowed = set()
+
+        view = memoryview(self._map)
+        sections = [view[data + begin:data + end] for begin, end in meta['sections']]
+        self._views = [view, *sections]
+
+        def cast(i, fmt='I'):
+            self._views.append(sections[i].cast(fmt))
+            return self._views[-1]
+
+        self._records = sections[0]
+        self._offsets = cast(1, 'Q')
+        self._keys, self._key_slots = sections[2], meta['key_slots']
+        self._hash = {name: (sections[i], size, cast(i + 1))
+                      for name, (i, size) in meta['hash'].items()}
+        self._ordered = {name: cast(i) for name, i in meta['ordered'].items()}
+
+    @property
+    def hash_indexes(self):
+        return set(self._hash)
+
+    @property
+    def ordered_indexes(self):
+        return set(self._ordered)
+
+    def __len__(self):
+        return self.count - len(self.shadowed)
+
+    def record(self, number):
+        return marshal.loads(self._records[self._offsets[number]:self._offsets[number + 1]])
+
+    def live(self, number):
+        """The record, or None if it was replaced or deleted since"""
+        return None if number in self.shadowed else self.record(number)
+
+    def find(self, key):
+        """Record number of a packed key, or None"""
+        key = digest(key)
+        for offset in _probe(self._key_slots, KEY_SLOT, key):
+            slot_key, number = KEY_SLOT.unpack_from(self._keys, offset)
+            if number == 0:
+                return None
+            if slot_key == key:
+                return number - 1
+
+    def postings(self, name, value):
+        """Numbers of the records whose column has this encoded value, oldest first"""
+        table, size, postings = self._hash[name]
+        value = digest(value)
+        for offset in _probe(size, VALUE_SLOT, value):
+            slot_value, first, count = VALUE_SLOT.unpack_from(table, offset)
+            if count == 0:
+                return ()
+            if slot_value == value:
+                return postings[first:first + count]
+
+    def range(self, name, position, low=None, high=None):
+        """Numbers of the records whose encoded column is within [low, high], ascending"""
+        members = self._ordered[name]
+
+        def value(i):
+            return self.record(i)[position]
+
+        start = bisect_left(members, low, key=value) if low is not None else 0
+        end = bisect_right(members, high, key=value) if high is not None else len(members)
+        return members[start:end]
+
+    def order_key(self, number):
+        record = self.record(number)
+        return record[self.created_position], record[self.id_position]
+
+    def after(self, key):
+        """Number of the first record whose (created_at, key) is above key"""
+        return bisect_right(range(self.count), key, key=self.order_key)
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # postings or ranges still referenced: unmapped once freed
+
+
+class MutationLog:
+    """Append-only log of the puts and deletes made since the snapshot"""
+
+    def __init__(self, path, fsync=False):
+        self.path = path
+        self.fsync = fsync
+        self._file = open(path, 'ab')
+
+    @staticmethod
+    def replay(path):
+        """
+        Yield the (op, value) entries of a log, dropping a torn last entry
+        (the file is cut back to the last whole one).
+        """
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as f:
+            data = f.read()
+        position = 0
+        while position + LOG_ENTRY.size <= len(data):
+            (length,) = LOG_ENTRY.unpack_from(data, position)
+            end = position + LOG_ENTRY.size + length
+            if end > len(data):
+                break
+            yield marshal.loads(data[position + LOG_ENTRY.size:end])
+            position = end
+        if position != len(data):
+            with open(path, 'r+b') as f:
+                f.truncate(position)
+
+    def append(self, op, value):
+        blob = marshal.dumps((op, value))
+        self._file.write(LOG_ENTRY.pack(len(blob)) + blob)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def truncate(self):
+        self._file.truncate(0)
+        self._file.seek(0)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
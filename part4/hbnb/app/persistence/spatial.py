@@ -0,0 +1,82 @@
+"""
+Grid bucket spatial index helpers.
+
+The globe is divided into fixed CELL_DEGREES x CELL_DEGREES cells numbered
+row by row from (-90, -180). Each place stores the number of its cell in an
+indexed column, so a radius query only has to read the cells overlapping
+the search circle instead of scanning every place.
+"""
+from __future__ import annotations
+
+import math
+
+CELL_DEGREES = 0.1
+CELL_COLUMNS = int(round(360 / CELL_DEGREES))
+CELL_ROWS = int(round(180 / CELL_DEGREES))
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+MAX_RADIUS_KM = math.pi * EARTH_RADIUS_KM  # half the circumference
+
+
+def _row(latitude: float) -> int:
+    return min(int((latitude + 90) / CELL_DEGREES), CELL_ROWS - 1)
+
+
+def _column(longitude: float) -> int:
+    return min(int((longitude + 180) / CELL_DEGREES), CELL_COLUMNS - 1)
+
+
+def cell_for(latitude: float, longitude: float) -> int:
+    """Return the grid cell number containing a coordinate"""
+    return _row(latitude) * CELL_COLUMNS + _column(longitude)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two coordinates in kilometers"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = (math.sin(dphi / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def cell_ranges(latitude: float, longitude: float, radius_km: float) -> list[tuple[int, int]]:
+    """
+    Return inclusive (first, last) cell number ranges covering every point
+    within radius_km of the coordinate. One or two ranges per grid row,
+    two when the circle crosses the antimeridian.
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    lat_min = max(-90.0, latitude - dlat)
+    lat_max = min(90.0, latitude + dlat)
+
+    # Longitude span grows with latitude; use the widest row of the circle
+    widest = max(abs(lat_min), abs(lat_max))
+    cos_lat = math.cos(math.radians(widest))
+    if lat_min <= -90 or lat_max >= 90 or cos_lat <= 0:
+        dlon = 180.0
+    else:
+        dlon = min(180.0, dlat / cos_lat)
+
+    if dlon >= 180:
+        column_spans = [(0, CELL_COLUMNS - 1)]
+    else:
+        first = _column(((longitude - dlon + 180) % 360) - 180)
+        last = _column(((longitude + dlon + 180) % 360) - 180)
+        if first <= last:
+            column_spans = [(first, last)]
+        else:
+            column_spans = [(first, CELL_COLUMNS - 1), (0, last)]
+
+    ranges = []
+    for row in range(_row(lat_min), _row(lat_max) + 1):
+        base = row * CELL_COLUMNS
+        for first, last in column_spans:
+            if ranges and ranges[-1][1] + 1 == base + first:
+                # Adjacent to the previous range (e.g. full rows): merge
+                ranges[-1] = (ranges[-1][0], base + last)
+            else:
+                ranges.append((base + first, base + last))
+    return ranges
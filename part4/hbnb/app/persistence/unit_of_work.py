@@ -0,0 +1,75 @@
+"""
+Unit of work over the SQLAlchemy session.
+
+Outside a unit of work every SQLAlchemyRepository write commits on its
+own. Inside one, writes are only staged in the session (autoflush still
+sends them before any query that needs them) and the whole block is
+flushed and committed once when it exits, or rolled back if it raises:
+
+    with unit_of_work():
+        user_repo.update(...)
+        place_repo.add(...)
+
+Blocks nest: an inner block joins the outermost one, which alone commits.
+Work that must only happen once the data is committed, such as dropping
+cached copies of it, is registered with after_commit().
+"""
+from contextlib import contextmanager
+
+_KEY = 'hbnb.unit_of_work'
+
+
+def _session():
+    from hbnb.app import db
+    return db.session
+
+
+def in_unit_of_work():
+    """True inside a unit_of_work() block of the current session"""
+    return _KEY in _session().info
+
+
+def after_commit(callback):
+    """Run callback once the current unit of work commits, or now outside one"""
+    callbacks = _session().info.get(_KEY)
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+def commit():
+    """
+    Commit the session, unless a unit of work will.
+
+    On failure the session is rolled back, so it stays usable for the rest
+    of the request, and the error is raised again.
+    """
+    session = _session()
+    if _KEY in session.info:
+        return
+    try:
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+
+@contextmanager
+def unit_of_work():
+    """Commit every write of the block at once, see the module docstring"""
+    session = _session()
+    if _KEY in session.info:
+        yield
+        return
+    callbacks = session.info[_KEY] = []
+    try:
+        yield
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.info.pop(_KEY, None)
+    for callback in callbacks:
+        callback()
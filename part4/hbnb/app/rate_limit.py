@@ -0,0 +1,340 @@
+"""
+Token-bucket rate limiting of expensive endpoints (login).
+
+Every key (e.g. the client IP, or the email being tried) has a bucket of
+`burst` tokens refilled at `per_minute` tokens per minute; a request takes
+one token from each of its buckets and is refused while one is empty. A
+bucket can also be checked without taking a token and charged later, e.g.
+only once a login has failed. Keys are hashed before they are stored, so
+emails never reach the store.
+
+Stores:
+    memory  -- in-process dict, per worker
+    sqlite  -- one SQLite file shared by every worker of a host
+    shm     -- fixed-size hash table in a memory-mapped file (on /dev/shm
+               by default) shared by every worker of a host; the least
+               valuable slot is recycled when a probe sequence is full
+    none    -- rate limiting disabled
+"""
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from flask import current_app, has_app_context
+
+logger = logging.getLogger(__name__)
+
+
+class Limit(NamedTuple):
+    """Bucket size and refill rate"""
+    burst: int
+    per_minute: float
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60.0
+
+
+def _take(tokens: float, updated: float, now: float, limit: Limit, cost: int = 1):
+    """
+    Refill a bucket up to now and take cost tokens (0 only checks that one
+    is left).
+
+    Returns:
+        (tokens left, seconds until a token is available or 0 if taken,
+        time at which the bucket is full again)
+    """
+    tokens = min(limit.burst, tokens + max(0.0, now - updated) * limit.rate)
+    if tokens >= 1:
+        tokens -= cost
+        retry_after = 0.0
+    else:
+        retry_after = (1 - tokens) / limit.rate
+    return tokens, retry_after, now + (limit.burst - tokens) / limit.rate
+
+
+class MemoryStore:
+    """In-process buckets, dropping full ones first past max_entries"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: bytes, limit: Limit, now: float, cost: int = 1) -> float:
+        with self._lock:
+            if not cost and key not in self._buckets:
+                return 0.0
+            tokens, updated = self._buckets.pop(key, (limit.burst, now))[:2]
+            tokens, retry_after, full_at = _take(tokens, updated, now, limit, cost)
+            self._buckets[key] = (tokens, now, full_at)
+            if len(self._buckets) > self.max_entries:
+                self._prune(now)
+            return retry_after
+
+    def _prune(self, now: float) -> None:
+        for key in [k for k, (_, _, full_at) in self._buckets.items() if full_at <= now]:
+            del self._buckets[key]
+        # Still full of active buckets: drop the least recently used
+        while len(self._buckets) > self.max_entries:
+            self._buckets.popitem(last=False)
+
+    def reset(self, key: bytes) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class SQLiteStore:
+    """Buckets in a SQLite table shared by every worker of a host"""
+
+    PRUNE_EVERY = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._takes = 0
+        conn = sqlite3.connect(path, timeout=5)
+        with conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS buckets ('
+                         'key BLOB PRIMARY KEY, tokens REAL, updated REAL, full_at REAL)')
+        conn.close()
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread, never inherited by a forked worker
+        if getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return self._local.conn
+
+    def take(self, key: bytes, limit: Limit, now: float, cost: int = 1) -> float:
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT tokens, updated FROM buckets WHERE key = ?',
+                               (key,)).fetchone()
+            if not cost and not row:
+                conn.execute('COMMIT')
+                return 0.0
+            tokens, updated = row if row else (limit.burst, now)
+            tokens, retry_after, full_at = _take(tokens, updated, now, limit, cost)
+            conn.execute('INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)',
+                         (key, tokens, now, full_at))
+            self._takes += 1
+            if self._takes % self.PRUNE_EVERY == 0:
+                conn.execute('DELETE FROM buckets WHERE full_at <= ?', (now,))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return retry_after
+
+    def reset(self, key: bytes) -> None:
+        self._conn().execute('DELETE FROM buckets WHERE key = ?', (key,))
+
+    def __len__(self) -> int:
+        return self._conn().execute('SELECT COUNT(*) FROM buckets').fetchone()[0]
+
+
+class SharedMemoryStore:
+    """
+    Open-addressing hash table of buckets in a memory-mapped file.
+
+    Each slot holds a 16-byte key digest, the token count, the last update
+    and the time the bucket is full again. A key lives in one of PROBES
+    consecutive slots; a new key takes an empty or refilled slot there, or
+    else the one closest to being full. Updates run under a flock so every
+    worker sees consistent buckets.
+    """
+
+    SLOT = struct.Struct('16sddd')
+    PROBES = 8
+
+    def __init__(self, path: str, slots: int):
+        self.path = path
+        self.slots = slots
+        self._pid = None
+        # flock does not exclude threads sharing the descriptor
+        self._lock = threading.Lock()
+        self._open()
+
+    def _open(self) -> None:
+        # A forked worker shares its parent's descriptor, and with it the
+        # flock: each process opens the file itself
+        if self._pid == os.getpid():
+            return
+        size = self.SLOT.size * self.slots
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_size != size:
+                # New file, or resized table: start over with empty slots
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        self._fd, self._map, self._pid = fd, mmap.mmap(fd, size), os.getpid()
+
+    def _find(self, key: bytes) -> tuple[int, tuple | None]:
+        """Offset of key's slot and its bucket, or of the slot to reuse and None"""
+        start = int.from_bytes(key[:8], 'little') % self.slots
+        victim, victim_full_at = None, None
+        for i in range(self.PROBES):
+            offset = ((start + i) % self.slots) * self.SLOT.size
+            slot_key, tokens, updated, full_at = self.SLOT.unpack_from(self._map, offset)
+            if slot_key == key:
+                return offset, (tokens, updated)
+            if victim_full_at is None or full_at < victim_full_at:
+                victim, victim_full_at = offset, full_at
+        return victim, None
+
+    def take(self, key: bytes, limit: Limit, now: float, cost: int = 1) -> float:
+        with self._lock:
+            self._open()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                offset, bucket = self._find(key)
+                if not cost and bucket is None:
+                    return 0.0
+                tokens, updated = bucket or (limit.burst, now)
+                tokens, retry_after, full_at = _take(tokens, updated, now, limit, cost)
+                self.SLOT.pack_into(self._map, offset, key, tokens, now, full_at)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return retry_after
+
+    def reset(self, key: bytes) -> None:
+        with self._lock:
+            self._open()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                offset, bucket = self._find(key)
+                if bucket is not None:
+                    self.SLOT.pack_into(self._map, offset, b'', 0.0, 0.0, 0.0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def __len__(self) -> int:
+        empty = bytes(16)
+        return sum(1 for i in range(self.slots)
+                   if self._map[i * self.SLOT.size:i * self.SLOT.size + 16] != empty)
+
+
+STORES = ('memory', 'sqlite', 'shm', 'none')
+
+
+class RateLimiter:
+    """
+    Flask extension holding the configured bucket store.
+
+    Config:
+        RATE_LIMITS: {scope: (burst, per_minute)} of the limited bucket scopes
+        RATE_LIMIT_STORE: 'memory' (default), 'sqlite', 'shm' or 'none'
+        RATE_LIMIT_PATH: File of the sqlite and shm stores (default: in
+            /dev/shm, or the temp directory)
+        RATE_LIMIT_MAX_ENTRIES: Buckets kept by the memory store, slots of
+            the shm store
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        name = app.config.get('RATE_LIMIT_STORE', 'memory') or 'none'
+        if name not in STORES:
+            raise ValueError(f"RATE_LIMIT_STORE must be one of {', '.join(STORES)}")
+        max_entries = int(app.config.get('RATE_LIMIT_MAX_ENTRIES', 65536))
+        shm = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+        if name == 'memory':
+            store = MemoryStore(max_entries)
+        elif name == 'sqlite':
+            store = SQLiteStore(app.config.get('RATE_LIMIT_PATH')
+                                or os.path.join(shm, 'hbnb-rate-limit.sqlite'))
+        elif name == 'shm':
+            store = SharedMemoryStore(app.config.get('RATE_LIMIT_PATH')
+                                      or os.path.join(shm, 'hbnb-rate-limit.shm'), max_entries)
+        else:
+            store = None
+        limits = {scope: Limit(*limit)
+                  for scope, limit in app.config.get('RATE_LIMITS', {}).items()}
+        app.extensions['rate_limiter'] = {
+            'store_name': name,
+            'store': store,
+            'limits': limits,
+            'rejected': 0,
+        }
+        logger.debug("Rate limit store: %s", name)
+
+    @staticmethod
+    def _state():
+        if not has_app_context():
+            return None
+        return current_app.extensions.get('rate_limiter')
+
+    @staticmethod
+    def _key(scope: str, value: str) -> bytes:
+        return hashlib.blake2b(f'{scope}\0{value}'.encode(), digest_size=16).digest()
+
+    def _take(self, state, buckets, cost: int) -> float:
+        now = time.time()
+        limits = state['limits']
+        # Scopes missing from RATE_LIMITS are not limited
+        return max((state['store'].take(self._key(scope, value), limits[scope], now, cost)
+                    for scope, value in buckets if scope in limits), default=0.0)
+
+    def hit(self, *buckets: tuple[str, str], check=()) -> float:
+        """
+        Take a token from each (scope, value) bucket, e.g. ('login_ip', ip).
+
+        Args:
+            check: Buckets that must not be empty either, but are not
+                charged here (see charge())
+
+        Returns:
+            0 if the request may proceed, else the seconds to wait
+        """
+        state = self._state()
+        if not state or state['store'] is None:
+            return 0.0
+        retry_after = max(self._take(state, buckets, 1), self._take(state, check, 0))
+        if retry_after:
+            state['rejected'] += 1
+        return retry_after
+
+    def charge(self, *buckets: tuple[str, str]) -> None:
+        """Take a token from each bucket after the fact, e.g. on a failed login"""
+        state = self._state()
+        if state and state['store'] is not None:
+            self._take(state, buckets, 1)
+
+    def reset(self, scope: str, value: str) -> None:
+        """Refill a bucket, e.g. an email's after a successful login"""
+        state = self._state()
+        if state and state['store'] is not None:
+            state['store'].reset(self._key(scope, value))
+
+    def stats(self) -> dict:
+        state = self._state()
+        store = state['store']
+        return {
+            'store': state['store_name'],
+            'buckets': len(store) if store is not None else 0,
+            'rejected': state['rejected'],
+        }
@@ -0,0 +1,79 @@
+"""
+Seed data loading (`flask hbnb seed`).
+
+The content hash of each seed file loaded is kept in the seed_markers
+table, so loading an unchanged file again is skipped after one lookup.
+The file is imported with hbnb.app.importer: existing users, amenities,
+places and reviews are kept, so a changed file only adds what is new.
+"""
+import hashlib
+import logging
+import os
+from datetime import datetime
+
+from hbnb.app import db
+from hbnb.app.importer import Importer
+from hbnb.app.models.seed_marker import SeedMarker
+from hbnb.app.persistence.unit_of_work import commit
+
+logger = logging.getLogger('hbnb.seed')
+
+DEFAULT_SEED_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'seed_data.json',
+)
+
+
+def file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_seed_data(seed_file=None, force=False):
+    """
+    Load a seed file (seed_data.json by default) into the database.
+
+    Args:
+        seed_file: Path of the JSON or NDJSON seed file
+        force: Load it even if this content was loaded already
+
+    Returns:
+        Dict of the users, amenities, places and reviews read, or None
+        if the file is missing, invalid or unchanged
+    """
+    seed_file = seed_file or DEFAULT_SEED_FILE
+    if not os.path.exists(seed_file):
+        logger.warning("Seed data file not found. Skipping data loading.")
+        return None
+
+    name = os.path.basename(seed_file)
+    digest = file_sha256(seed_file)
+    marker = db.session.get(SeedMarker, name)
+    if marker is not None and marker.sha256 == digest and not force:
+        logger.info("Seed data %s unchanged since %s, skipping", name, marker.loaded_at)
+        return None
+
+    logger.info("Loading seed data from %s", seed_file)
+    try:
+        # A forced load goes through the whole file, not from a checkpoint
+        stats = Importer().run(seed_file, resume=not force)
+    except ValueError:
+        # Also raised by json for invalid files
+        logger.exception("Error loading seed data from %s", seed_file)
+        return None
+
+    counts = {section: section_stats['read'] for section, section_stats in stats.items()}
+    logger.info("Seed data loaded: %(users)d users, %(amenities)d amenities, "
+                "%(places)d places, %(reviews)d reviews", counts)
+
+    marker = db.session.get(SeedMarker, name)
+    if marker is None:
+        marker = SeedMarker(name=name)
+        db.session.add(marker)
+    marker.sha256 = digest
+    marker.loaded_at = datetime.utcnow()
+    commit()
+    return counts
@@ -1,11 +1,25 @@
-from hbnb.app.persistence.repository import InMemoryRepository
+from hbnb.app.persistence.repository import SQLAlchemyRepository
+from hbnb.app.persistence.unit_of_work import after_commit, unit_of_work
 from hbnb.app.services.repositories.user_repository import UserRepository
+from hbnb.app.services.repositories.place_repository import PlaceRepository
+from hbnb.app.services.repositories.review_repository import ReviewRepository
+from hbnb.app.services.versions import CollectionVersions
+from hbnb.app.extensions import password_hasher, response_cache
+from hbnb.app.password_hasher import PasswordHasherBusy
 from hbnb.app.models.user import User
 from hbnb.app.models.amenity import Amenity
 from hbnb.app.models.place import Place
 from hbnb.app.models.review import Review
 
 
+class BulkItemError(Exception):
+    """Rejection of one item of a bulk creation, with its HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
 class HBnBFacade:
     """
     Facade pattern implementation for the HBnB application.
@@ -24,13 +38,43 @@ class HBnBFacade:
         if not HBnBFacade._repositories_initialized:
             # Use UserRepository with SQLAlchemy (Task 6)
             self.user_repo = UserRepository()
-            
-            # Keep InMemory for other entities (will be migrated in future tasks)
-            self.place_repo = InMemoryRepository()
-            self.review_repo = InMemoryRepository()
-            self.amenity_repo = InMemoryRepository()
+
+            # Places, reviews and amenities are persisted in the database too
+            self.place_repo = PlaceRepository()
+            self.review_repo = ReviewRepository()
+            self.amenity_repo = SQLAlchemyRepository(Amenity)
+
+            # Change counters of each collection (in the database), for conditional GETs
+            self.versions = CollectionVersions()
             HBnBFacade._repositories_initialized = True
 
+    def get_collection_versions(self, *names):
+        """Get the (version token, last change) pair of each named collection"""
+        return self.versions.get_many(names)
+
+    def transaction(self):
+        """
+        Unit of work: the writes of every facade call inside the block are
+        committed together when it exits, or not at all if it raises.
+
+            with facade.transaction():
+                facade.update_user(...)
+                facade.create_place(...)
+
+        Each write method runs in one already, so a single call commits once.
+        """
+        return unit_of_work()
+
+    def _changed(self, *tags):
+        """
+        Record a change to collections ('places') and single entities
+        ('place:<id>', or 'place:*' for all of them): bump the collection
+        versions in the current transaction, and invalidate the cached
+        responses built from the tags once it commits.
+        """
+        self.versions.bump(*(tag for tag in tags if ':' not in tag))
+        after_commit(lambda: response_cache.invalidate(*tags))
+
     # ===== User Management Methods =====
 
     def create_user(self, user_data):
@@ -40,9 +84,31 @@ class HBnBFacade:
         user = User(**user_data)
         if password:
             user.hash_password(password)
-        self.user_repo.add(user)
+        with self.transaction():
+            self.user_repo.add(user)
+            self._changed('users')
         return user
 
+    def create_users(self, users_data):
+        """
+        Create many users in one transaction, hashing all their passwords
+        in parallel on the password hashing pool (seeding, bulk imports).
+        """
+        users_data = [dict(user_data) for user_data in users_data]
+        passwords = [user_data.pop('password', None) for user_data in users_data]
+        if not all(passwords):
+            raise ValueError("password is required")
+        users = [User(**user_data) for user_data in users_data]
+
+        hashes = password_hasher.hash_many(passwords)
+        for user, pw_hash in zip(users, hashes):
+            user.password = pw_hash
+
+        with self.transaction():
+            self.user_repo.add_all(users)
+            self._changed('users')
+        return users
+
     def get_user(self, user_id):
         """Get a user by ID"""
         return self.user_repo.get(user_id)
@@ -51,34 +117,69 @@ class HBnBFacade:
         """Get all users"""
         return self.user_repo.get_all()
 
-    def get_user_by_email(self, email):
-        """Get a user by email"""
-        return self.user_repo.get_user_by_email(email)
+    def get_users_page(self, limit, after=None):
+        """Get one page of users ordered by creation date"""
+        return self.user_repo.get_page(limit, after)
+
+    def get_user_by_email(self, email, cached=True):
+        """Get a user by email (cached=False reads the database)"""
+        return self.user_repo.get_user_by_email(email, cached=cached)
+
+    def authenticate_user(self, email, password):
+        """
+        Get the user with these credentials, or None.
+
+        A hash made under an older scheme or cost is replaced with one
+        under the configured policy, so cost changes roll out as users
+        log in instead of through a mass migration.
+        """
+        # Read from the database: another worker may have changed the
+        # password or deleted the user since it was cached
+        user = self.user_repo.get_user_by_email(email, cached=False)
+        if user is None:
+            # Same cost as a wrong password, so timing hides unknown emails
+            password_hasher.verify_dummy(password)
+            return None
+        if not user.verify_password(password):
+            return None
+        if user.password_needs_rehash():
+            try:
+                new_hash = password_hasher.hash(password)
+            except PasswordHasherBusy:
+                # Never fail a valid login over it; retried next time
+                return user
+            with self.transaction():
+                self.user_repo.update(user.id, {'password': new_hash})
+                self._changed('users')
+        return user
 
     def update_user(self, user_id, user_data):
         """Update a user's information"""
-        user = self.user_repo.get(user_id)
-        if not user:
-            return None
-
-        # Update user attributes
-        if 'first_name' in user_data:
-            user.first_name = user_data['first_name']
-        if 'last_name' in user_data:
-            user.last_name = user_data['last_name']
-        if 'email' in user_data:
-            user.email = user_data['email']
-        if 'password' in user_data:
-            user.hash_password(user_data['password'])
-        if 'is_admin' in user_data:
-            user.is_admin = user_data['is_admin']
-
-        # Validate the updated user
-        user.validate()
-        user.save()
-
-        # Update in repository
-        self.user_repo.update(user_id, user_data)
+        with self.transaction():
+            user = self.user_repo.get(user_id)
+            if not user:
+                return None
+            old_email = user.email
+
+            # Update user attributes
+            if 'first_name' in user_data:
+                user.first_name = user_data['first_name']
+            if 'last_name' in user_data:
+                user.last_name = user_data['last_name']
+            if 'email' in user_data:
+                user.email = user_data['email']
+            if 'password' in user_data:
+                user.hash_password(user_data['password'])
+            if 'is_admin' in user_data:
+                user.is_admin = user_data['is_admin']
+
+            # Validate the updated user; the attributes are set on the
+            # session's instance, so the raw payload (with its plaintext
+            # password) must not be written back through the repository
+            user.validate()
+            user.save()
+            self.user_repo.invalidate(user_id, old_email, user.email)
+            self._changed('users')
         return user
 
     def delete_user(self, user_id):
@@ -86,24 +187,35 @@ class HBnBFacade:
         user = self.user_repo.get(user_id)
         if not user:
             raise ValueError("User not found")
-        self.user_repo.delete(user_id)
+        with self.transaction():
+            self.user_repo.delete(user_id)
+            self._changed('users')
 
     # ===== Place Management Methods =====
 
-    def create_place(self, place_data):
-        """Create a new place"""
+    def _resolve_amenities(self, amenity_ids):
+        """Load amenities by ID in one query, skipping unknown and repeated IDs"""
+        found = self.amenity_repo.get_many(amenity_ids)
+        return [found[amenity_id] for amenity_id in dict.fromkeys(amenity_ids)
+                if amenity_id in found]
+
+    def create_place(self, place_data, amenities=None):
+        """
+        Create a new place.
+
+        Args:
+            place_data: Place attributes, with owner_id and amenity IDs
+            amenities: Amenity instances the caller already resolved from
+                place_data['amenities']; looked up here when omitted
+        """
         # Get owner
         owner = self.user_repo.get(place_data['owner_id'])
         if not owner:
             raise ValueError("Owner not found")
 
         # Get amenities if provided
-        amenities = []
-        if 'amenities' in place_data and place_data['amenities']:
-            for amenity_id in place_data['amenities']:
-                amenity = self.amenity_repo.get(amenity_id)
-                if amenity:
-                    amenities.append(amenity)
+        if amenities is None:
+            amenities = self._resolve_amenities(place_data.get('amenities') or [])
 
         # Create place with owner
         place = Place(
@@ -115,11 +227,11 @@ class HBnBFacade:
             owner=owner
         )
 
-        # Add amenities
-        for amenity in amenities:
-            place.add_amenity(amenity)
+        place.amenities = list(amenities)
 
-        self.place_repo.add(place)
+        with self.transaction():
+            self.place_repo.add(place)
+            self._changed('places')
         return place
 
     def get_place(self, place_id):
@@ -130,83 +242,307 @@ class HBnBFacade:
         """Get all places"""
         return self.place_repo.get_all()
 
-    def update_place(self, place_id, place_data):
-        """Update a place's information"""
-        place = self.place_repo.get(place_id)
-        if not place:
-            return None
-
-        # Update basic attributes
-        if 'title' in place_data:
-            place.title = place_data['title']
-        if 'description' in place_data:
-            place.description = place_data['description']
-        if 'price' in place_data:
-            place.price = place_data['price']
-        if 'latitude' in place_data:
-            place.latitude = place_data['latitude']
-        if 'longitude' in place_data:
-            place.longitude = place_data['longitude']
-
-        # Update owner if provided
-        if 'owner_id' in place_data:
-            owner = self.user_repo.get(place_data['owner_id'])
-            if not owner:
-                raise ValueError("Owner not found")
-            place.owner = owner
-
-        # Update amenities if provided
-        if 'amenities' in place_data:
-            place.amenities = []
-            for amenity_id in place_data['amenities']:
-                amenity = self.amenity_repo.get(amenity_id)
-                if amenity:
-                    place.add_amenity(amenity)
-
-        # Validate and save
-        place.validate()
-        place.save()
-
-        # Update in repository
-        self.place_repo.update(place_id, place_data)
+    def get_place_with_relations(self, place_id, embed=PlaceRepository.RELATIONS, columns=None):
+        """Get a place by ID with the requested relationships preloaded"""
+        return self.place_repo.get_with_relations(place_id, embed, columns)
+
+    def get_all_places_with_relations(self, embed=PlaceRepository.RELATIONS, columns=None):
+        """Get all places with the requested relationships preloaded"""
+        return self.place_repo.list_with_relations(embed, columns)
+
+    def search_places(self, filters=None, sort='created_at', limit=None, after=None,
+                      embed=PlaceRepository.RELATIONS, columns=None):
+        """Search places by price, bounding box and amenities, one page at a time"""
+        return self.place_repo.search(filters, sort, limit, after, embed, columns)
+
+    def get_places_nearby(self, latitude, longitude, radius_km, limit):
+        """Get (place, distance_km) pairs within a radius, nearest first"""
+        return self.place_repo.nearby(latitude, longitude, radius_km, limit)
+
+    def get_nearest_places(self, latitude, longitude, k):
+        """Get the k nearest (place, distance_km) pairs"""
+        return self.place_repo.nearest(latitude, longitude, k)
+
+    def repair_rating_aggregates(self):
+        """Recompute all places' rating aggregates from their reviews"""
+        with self.transaction():
+            updated = self.place_repo.recompute_rating_aggregates()
+            self._changed('places', 'place:*')
+        return updated
+
+    def update_place(self, place_id, place_data, amenities=None):
+        """
+        Update a place's information.
+
+        Args:
+            place_id: The ID of the place
+            place_data: Attributes to change, optionally owner_id and
+                amenity IDs
+            amenities: Amenity instances the caller already resolved from
+                place_data['amenities']; looked up here when omitted
+        """
+        with self.transaction():
+            place = self.place_repo.get(place_id)
+            if not place:
+                return None
+
+            # Update basic attributes
+            if 'title' in place_data:
+                place.title = place_data['title']
+            if 'description' in place_data:
+                place.description = place_data['description']
+            if 'price' in place_data:
+                place.price = place_data['price']
+            if 'latitude' in place_data:
+                place.latitude = place_data['latitude']
+            if 'longitude' in place_data:
+                place.longitude = place_data['longitude']
+
+            # Update owner if provided
+            if 'owner_id' in place_data:
+                owner = self.user_repo.get(place_data['owner_id'])
+                if not owner:
+                    raise ValueError("Owner not found")
+                place.owner = owner
+
+            # Update amenities if provided
+            if 'amenities' in place_data:
+                if amenities is None:
+                    amenities = self._resolve_amenities(place_data['amenities'])
+                place.amenities = list(amenities)
+
+            # Validate and save (amenities/owner are already set as objects
+            # above, so the raw payload must not be written back through the
+            # repository)
+            place.validate()
+            place.save()
+            self._changed('places', f'place:{place_id}')
         return place
 
+    def delete_place(self, place_id):
+        """Delete a place along with its reviews"""
+        with self.transaction():
+            self.place_repo.delete(place_id)
+            self._changed('places', 'reviews', f'place:{place_id}')
+
+    # ===== Bulk Creation Methods =====
+
+    @staticmethod
+    def _ids(built):
+        """(index, id) pairs of built instances, read before the commit expires them"""
+        return [(index, obj.id) for index, obj in built]
+
+    @staticmethod
+    def _build_all(items, build):
+        """
+        Build a model instance from each item, collecting per-item errors.
+
+        Returns:
+            (built, errors) where built holds (index, instance) pairs and
+            errors (index, status, message) triples
+        """
+        built, errors = [], []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append((index, 400, "item must be an object"))
+                continue
+            try:
+                built.append((index, build(item)))
+            except BulkItemError as e:
+                errors.append((index, e.status, str(e)))
+            except KeyError as e:
+                errors.append((index, 400, f"{e.args[0]} is required"))
+            except (TypeError, ValueError) as e:
+                errors.append((index, 400, str(e)))
+        return built, errors
+
+    @staticmethod
+    def _id_of(item, name):
+        """item[name], checked to be an ID string"""
+        value = item[name]
+        if not isinstance(value, str):
+            raise ValueError(f"{name} must be a string")
+        return value
+
+    def create_places(self, places_data):
+        """
+        Create many places in one transaction.
+
+        Owners and amenities of every item are resolved with batched
+        queries; invalid items are reported and skipped.
+
+        Returns:
+            (created, errors): (index, place ID) pairs and (index, status,
+            message) triples, indexes into places_data
+        """
+        # Only well-formed keys are looked up; build() rejects the others
+        items = [item for item in places_data if isinstance(item, dict)]
+        owners = self.user_repo.get_many(
+            item.get('owner_id') for item in items if isinstance(item.get('owner_id'), str))
+        amenities = self.amenity_repo.get_many(
+            amenity_id for item in items if isinstance(item.get('amenities'), list)
+            for amenity_id in item['amenities'] if isinstance(amenity_id, str))
+
+        def build(item):
+            owner = owners.get(self._id_of(item, 'owner_id'))
+            if owner is None:
+                raise BulkItemError(404, "Owner not found")
+            amenity_ids = item.get('amenities') or []
+            if (not isinstance(amenity_ids, list)
+                    or not all(isinstance(amenity_id, str) for amenity_id in amenity_ids)):
+                raise ValueError("amenities must be a list of IDs")
+            place_amenities = []
+            for amenity_id in amenity_ids:
+                if amenity_id not in amenities:
+                    raise BulkItemError(404, f"Amenity with ID {amenity_id} not found")
+                place_amenities.append(amenities[amenity_id])
+            place = Place(
+                title=item['title'],
+                description=item.get('description', ''),
+                price=item['price'],
+                latitude=item['latitude'],
+                longitude=item['longitude'],
+                location=item.get('location', ''),
+                owner=owner
+            )
+            place.amenities = list(dict.fromkeys(place_amenities))
+            return place
+
+        built, errors = self._build_all(places_data, build)
+        created = self._ids(built)
+        if built:
+            with self.transaction():
+                self.place_repo.add_all([place for _, place in built])
+                self._changed('places')
+        return created, errors
+
+    def create_amenities(self, amenities_data):
+        """
+        Create many amenities in one transaction; names already taken, in
+        the database or earlier in the batch, are rejected with 409.
+
+        Returns:
+            (created, errors), see create_places()
+        """
+        taken = {amenity.name for amenity in self.amenity_repo.get_all_by_attribute(
+            'name', (item.get('name') for item in amenities_data if isinstance(item, dict)))}
+
+        def build(item):
+            if item['name'] in taken:
+                raise BulkItemError(409, "Amenity with this name already exists")
+            amenity = Amenity(name=item['name'])
+            taken.add(amenity.name)
+            return amenity
+
+        built, errors = self._build_all(amenities_data, build)
+        created = self._ids(built)
+        if built:
+            with self.transaction():
+                self.amenity_repo.add_all([amenity for _, amenity in built])
+                self._changed('amenities')
+        return created, errors
+
+    def create_reviews(self, reviews_data):
+        """
+        Create many reviews in one transaction and update the rating
+        aggregates of their places.
+
+        Users, places and existing (user, place) reviews are looked up
+        with batched queries. Reviews of one's own place and second
+        reviews of a place are rejected with 403.
+
+        Returns:
+            (created, errors), see create_places()
+        """
+        # Only well-formed keys are looked up; build() rejects the others
+        items = [item for item in reviews_data if isinstance(item, dict)
+                 and isinstance(item.get('user_id'), str)
+                 and isinstance(item.get('place_id'), str)]
+        users = self.user_repo.get_many(item['user_id'] for item in items)
+        places = self.place_repo.get_many(item['place_id'] for item in items)
+        reviewed = self.review_repo.reviewed_pairs(
+            (item['user_id'], item['place_id']) for item in items)
+
+        def build(item):
+            # Check before constructing: a Review joins its place's reviews
+            # (and the session) before it validates itself
+            text, rating = item['text'], item['rating']
+            if not isinstance(text, str) or not text.strip():
+                raise ValueError("text is required")
+            if not isinstance(rating, int) or isinstance(rating, bool) or not 1 <= rating <= 5:
+                raise ValueError("rating must be an integer between 1 and 5")
+            user = users.get(self._id_of(item, 'user_id'))
+            if user is None:
+                raise BulkItemError(404, "User not found")
+            place = places.get(self._id_of(item, 'place_id'))
+            if place is None:
+                raise BulkItemError(404, "Place not found")
+            if place.owner_id == user.id:
+                raise BulkItemError(403, "You cannot review your own place")
+            if (user.id, place.id) in reviewed:
+                raise BulkItemError(403, "You have already reviewed this place")
+            review = Review(text=text, rating=rating, user=user, place=place)
+            reviewed.add((user.id, place.id))
+            return review
+
+        built, errors = self._build_all(reviews_data, build)
+        created = self._ids(built)
+        if built:
+            ratings = {}
+            for _, review in built:
+                stars = ratings.setdefault(review.place.id, {})
+                stars[review.rating] = stars.get(review.rating, 0) + 1
+            with self.transaction():
+                self.review_repo.add_all([review for _, review in built])
+                self.place_repo.adjust_rating_aggregates(ratings)
+                self._changed('reviews', 'places', *(f'place:{pid}' for pid in ratings))
+        return created, errors
+
     # ===== Amenity Management Methods =====
 
     def create_amenity(self, amenity_data):
         """Create a new amenity"""
         amenity = Amenity(**amenity_data)
-        self.amenity_repo.add(amenity)
+        with self.transaction():
+            self.amenity_repo.add(amenity)
+            self._changed('amenities')
         return amenity
 
     def get_amenity(self, amenity_id):
         """Get an amenity by ID"""
         return self.amenity_repo.get(amenity_id)
 
+    def get_amenities(self, amenity_ids):
+        """Get amenities by ID in one query, as a dict of ID to amenity"""
+        return self.amenity_repo.get_many(amenity_ids)
+
     def get_all_amenities(self):
         """Get all amenities"""
         return self.amenity_repo.get_all()
 
+    def get_amenities_page(self, limit, after=None):
+        """Get one page of amenities ordered by creation date"""
+        return self.amenity_repo.get_page(limit, after)
+
     def get_amenity_by_name(self, name):
         """Get an amenity by name"""
         return self.amenity_repo.get_by_attribute('name', name)
 
     def update_amenity(self, amenity_id, amenity_data):
         """Update an amenity's information"""
-        amenity = self.amenity_repo.get(amenity_id)
-        if not amenity:
-            return None
-
-        # Update amenity attributes
-        if 'name' in amenity_data:
-            amenity.name = amenity_data['name']
-
-        # Validate the updated amenity
-        amenity.validate()
-        amenity.save()
-
-        # Update in repository
-        self.amenity_repo.update(amenity_id, amenity_data)
+        with self.transaction():
+            amenity = self.amenity_repo.get(amenity_id)
+            if not amenity:
+                return None
+
+            # Update amenity attributes
+            if 'name' in amenity_data:
+                amenity.name = amenity_data['name']
+
+            # Validate the updated amenity
+            amenity.validate()
+            amenity.save()
+            self._changed('amenities')
         return amenity
 
     # ===== Review Management Methods =====
@@ -231,7 +567,11 @@ class HBnBFacade:
             place=place
         )
 
-        self.review_repo.add(review)
+        # The review and its place's rating aggregates commit together
+        with self.transaction():
+            self.review_repo.add(review)
+            self.place_repo.adjust_rating_aggregates({place.id: {review.rating: 1}})
+            self._changed('reviews', 'places', f'place:{place.id}')
         return review
 
     def get_review(self, review_id):
@@ -242,6 +582,10 @@ class HBnBFacade:
         """Get all reviews"""
         return self.review_repo.get_all()
 
+    def get_reviews_page(self, limit, after=None):
+        """Get one page of reviews ordered by creation date"""
+        return self.review_repo.get_page(limit, after)
+
     def get_reviews_by_place(self, place_id):
         """Get all reviews for a specific place"""
         place = self.place_repo.get(place_id)
@@ -249,52 +593,67 @@ class HBnBFacade:
             return []
         return place.reviews
 
+    def has_user_reviewed(self, user_id, place_id):
+        """Check whether a user already reviewed a place"""
+        return self.review_repo.has_user_reviewed(user_id, place_id)
+
     def update_review(self, review_id, review_data):
         """Update a review's information"""
-        review = self.review_repo.get(review_id)
-        if not review:
-            return None
-
-        # Update basic attributes
-        if 'text' in review_data:
-            review.text = review_data['text']
-        if 'rating' in review_data:
-            review.rating = review_data['rating']
-
-        # Update user if provided
-        if 'user_id' in review_data:
-            user = self.user_repo.get(review_data['user_id'])
-            if not user:
-                raise ValueError("User not found")
-            review.user = user
-
-        # Update place if provided
-        if 'place_id' in review_data:
-            place = self.place_repo.get(review_data['place_id'])
-            if not place:
-                raise ValueError("Place not found")
-            # Remove from old place's reviews
-            if review in review.place.reviews:
-                review.place.reviews.remove(review)
-            review.place = place
-            # Add to new place's reviews
-            place.add_review(review)
-
-        # Validate and save
-        review.validate()
-        review.save()
-
-        # Update in repository
-        self.review_repo.update(review_id, review_data)
+        with self.transaction():
+            review = self.review_repo.get(review_id)
+            if not review:
+                return None
+
+            old_place, old_rating = review.place, review.rating
+
+            # Update basic attributes
+            if 'text' in review_data:
+                review.text = review_data['text']
+            if 'rating' in review_data:
+                review.rating = review_data['rating']
+
+            # Update user if provided
+            if 'user_id' in review_data:
+                user = self.user_repo.get(review_data['user_id'])
+                if not user:
+                    raise ValueError("User not found")
+                review.user = user
+
+            # Update place if provided
+            if 'place_id' in review_data:
+                place = self.place_repo.get(review_data['place_id'])
+                if not place:
+                    raise ValueError("Place not found")
+                # Remove from old place's reviews
+                if review in review.place.reviews:
+                    review.place.reviews.remove(review)
+                review.place = place
+                # Add to new place's reviews
+                place.add_review(review)
+
+            # Validate, then move the rating between aggregates if it changed
+            review.validate()
+            review.save()
+            if review.place is not old_place or review.rating != old_rating:
+                changes = {old_place.id: {old_rating: -1}}
+                stars = changes.setdefault(review.place.id, {})
+                stars[review.rating] = stars.get(review.rating, 0) + 1
+                self.place_repo.adjust_rating_aggregates(changes)
+            self._changed('reviews', 'places', f'place:{old_place.id}',
+                          f'place:{review.place.id}')
         return review
 
     def delete_review(self, review_id):
         """Delete a review"""
-        review = self.review_repo.get(review_id)
-        if review:
+        with self.transaction():
+            review = self.review_repo.get(review_id)
+            if not review:
+                return False
+            place_id, rating = review.place_id, review.rating
             # Remove from place's reviews list
             if review in review.place.reviews:
                 review.place.reviews.remove(review)
             self.review_repo.delete(review_id)
-            return True
-        return False
+            self.place_repo.adjust_rating_aggregates({place_id: {rating: -1}})
+            self._changed('reviews', 'places', f'place:{place_id}')
+        return True
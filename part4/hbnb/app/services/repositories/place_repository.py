@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from sqlalchemy import Float, case, cast, func, or_, select, update
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from sqlalchemy.orm.util import identity_key
+
+from hbnb.app.persistence.repository import SQLAlchemyRepository
+from hbnb.app.persistence.unit_of_work import commit
+from hbnb.app.persistence.spatial import MAX_RADIUS_KM, cell_ranges, haversine_km
+from hbnb.app.models.place import Place, place_amenity
+from hbnb.app.models.review import Review
+
+
+class PlaceRepository(SQLAlchemyRepository):
+    """
+    PlaceRepository extends SQLAlchemyRepository with Place-specific methods.
+    """
+
+    # Sort names accepted by the place listing and the column each one uses
+    SORTABLE_FIELDS = {
+        'created_at': 'created_at',
+        'price': 'price',
+        'title': 'title',
+        'rating': 'rating_avg',
+    }
+
+    # Above this many cell ranges a radius query scans the whole latitude band
+    MAX_CELL_RANGES = 64
+    # First search radius tried by nearest(), grown 4x until k places are found
+    NEAREST_START_RADIUS_KM = 10.0
+
+    def __init__(self):
+        super().__init__(Place)
+
+    # Relationships _with_relations() can preload, by embed name
+    RELATIONS = ('owner', 'amenities', 'reviews')
+
+    def _with_relations(self, embed=RELATIONS, columns=None):
+        """
+        Build a Place query that eagerly loads the requested relationships
+        (owner, amenities, reviews with their authors), so serializing places
+        costs a fixed number of queries instead of one per relationship per
+        place. Relationships left out of embed are not loaded at all.
+
+        Args:
+            embed: Names of the relationships to preload
+            columns: Place column names to load, None for all of them
+        """
+        options = []
+        if columns is not None:
+            # The id is always loaded, so an empty column list is valid
+            options.append(load_only(Place.id, *(getattr(Place, name) for name in columns)))
+        if 'owner' in embed:
+            options.append(joinedload(Place.owner))
+        if 'amenities' in embed:
+            options.append(selectinload(Place.amenities))
+        if 'reviews' in embed:
+            options.append(selectinload(Place.reviews).joinedload(Review.user))
+        return self.model.query.options(*options)
+
+    def list_with_relations(self, embed=RELATIONS, columns=None) -> list[Place]:
+        """
+        Get all places with their relationships preloaded.
+
+        Args:
+            embed: Names of the relationships to preload
+            columns: Place column names to load, None for all of them
+
+        Returns:
+            List of Place objects
+        """
+        return self._with_relations(embed, columns).all()
+
+    def get_with_relations(self, place_id: str, embed=RELATIONS,
+                           columns=None) -> Place | None:
+        """
+        Get a single place with its relationships preloaded.
+
+        Args:
+            place_id: The unique identifier of the place
+            embed: Names of the relationships to preload
+            columns: Place column names to load, None for all of them
+
+        Returns:
+            Place object if found, None otherwise
+        """
+        return self._with_relations(embed, columns).filter(Place.id == place_id).first()
+
+    def search(self, filters: dict | None = None, sort: str = 'created_at',
+               limit: int | None = None, after=None, embed=RELATIONS, columns=None):
+        """
+        Search places with filters evaluated by the database, relationships
+        preloaded and keyset pagination on the sort column.
+
+        Args:
+            filters: Optional dict with any of
+                - min_price / max_price: price bounds (inclusive)
+                - bbox: (lat1, lon1, lat2, lon2) south-west and north-east
+                  corners; lon1 > lon2 means the box crosses the antimeridian
+                - amenities: list of amenity IDs the place must all have
+            sort: Column to sort on, prefixed with '-' for descending order
+            limit: Maximum number of places to return (None for all)
+            after: (sort value, id) key of the last place of the previous page
+            embed: Names of the relationships to preload
+            columns: Place column names to load, None for all of them
+
+        Returns:
+            Tuple of (places, key of the last place or None if no more pages)
+        """
+        filters = filters or {}
+        descending = sort.startswith('-')
+        sort_by = self.SORTABLE_FIELDS[sort.lstrip('-')]
+        if columns is not None and sort_by not in columns:
+            # The next page key is read from the last place
+            columns = (*columns, sort_by)
+        query = self._with_relations(embed, columns)
+
+        if filters.get('min_price') is not None:
+            query = query.filter(Place.price >= filters['min_price'])
+        if filters.get('max_price') is not None:
+            query = query.filter(Place.price <= filters['max_price'])
+
+        if filters.get('bbox'):
+            lat1, lon1, lat2, lon2 = filters['bbox']
+            query = query.filter(Place.latitude.between(min(lat1, lat2), max(lat1, lat2)))
+            if lon1 <= lon2:
+                query = query.filter(Place.longitude.between(lon1, lon2))
+            else:
+                query = query.filter(or_(Place.longitude >= lon1, Place.longitude <= lon2))
+
+        amenity_ids = set(filters.get('amenities') or [])
+        if amenity_ids:
+            matching = (
+                select(place_amenity.c.place_id)
+                .where(place_amenity.c.amenity_id.in_(amenity_ids))
+                .group_by(place_amenity.c.place_id)
+                .having(func.count(place_amenity.c.amenity_id) == len(amenity_ids))
+            )
+            query = query.filter(Place.id.in_(matching))
+
+        return self._paginate(query, limit, after, sort_by, descending)
+
+    def adjust_rating_aggregates(self, changes) -> None:
+        """
+        Apply review rating changes to the aggregates of their places.
+
+        Each place gets one UPDATE computing the new values from the stored
+        ones (review_count = review_count + 1, ...), so concurrent writers
+        reviewing the same place never overwrite each other's counts.
+
+        Args:
+            changes: {place_id: {rating: delta}}, delta being +1 for each
+                review added with that rating and -1 for each one removed
+        """
+        from hbnb.app import db
+
+        session = db.session
+        for place_id, stars in changes.items():
+            stars = {rating: delta for rating, delta in stars.items() if delta}
+            if not stars:
+                continue
+            count = sum(stars.values())
+            total = sum(rating * delta for rating, delta in stars.items())
+            new_count = Place.review_count + count
+            values = {
+                'review_count': new_count,
+                'rating_sum': Place.rating_sum + total,
+                # SET expressions read the stored values, not the new ones
+                'rating_avg': case(
+                    (new_count > 0, cast(Place.rating_sum + total, Float) / new_count),
+                    else_=0.0),
+            }
+            for rating, delta in stars.items():
+                column = getattr(Place, f'rating_{rating}')
+                values[column.key] = column + delta
+            session.execute(update(Place).where(Place.id == place_id).values(**values)
+                            .execution_options(synchronize_session=False))
+            # A place loaded in this session reads its new aggregates on next access
+            place = session.identity_map.get(identity_key(Place, place_id))
+            if place is not None:
+                session.expire(place, Place.RATING_COLUMNS)
+
+    def recompute_rating_aggregates(self) -> int:
+        """
+        Recompute every place's rating aggregates from its reviews in a single
+        UPDATE statement, repairing any drift.
+
+        Returns:
+            Number of places updated
+        """
+        from hbnb.app import db
+
+        def reviews_of_place(column):
+            return select(column).where(Review.place_id == Place.id).scalar_subquery()
+
+        values = {
+            'review_count': reviews_of_place(func.count(Review.id)),
+            'rating_sum': reviews_of_place(func.coalesce(func.sum(Review.rating), 0)),
+            'rating_avg': reviews_of_place(func.coalesce(func.avg(Review.rating), 0.0)),
+        }
+        for star in range(1, 6):
+            values[f'rating_{star}'] = (
+                select(func.count(Review.id))
+                .where(Review.place_id == Place.id, Review.rating == star)
+                .scalar_subquery()
+            )
+        result = db.session.execute(update(Place).values(**values))
+        commit()
+        return result.rowcount
+
+    def _hits_within(self, latitude: float, longitude: float, radius_km: float):
+        """
+        Return (distance_km, place_id) pairs within radius_km, nearest first.
+
+        Only the id and coordinates of places in the grid cells covering the
+        circle are read; the exact distance check is done on those candidates.
+        """
+        ranges = cell_ranges(latitude, longitude, radius_km)
+        if len(ranges) > self.MAX_CELL_RANGES:
+            ranges = [(ranges[0][0], ranges[-1][1])]
+        rows = (
+            self.model.query
+            .with_entities(Place.id, Place.latitude, Place.longitude)
+            .filter(or_(*(Place.geo_cell.between(first, last) for first, last in ranges)))
+            .all()
+        )
+        hits = []
+        for place_id, place_lat, place_lon in rows:
+            distance = haversine_km(latitude, longitude, place_lat, place_lon)
+            if distance <= radius_km:
+                hits.append((distance, place_id))
+        hits.sort()
+        return hits
+
+    def _load_ranked(self, hits):
+        """Load the places of (distance_km, place_id) pairs, keeping their order"""
+        if not hits:
+            return []
+        ids = [place_id for _, place_id in hits]
+        places = {place.id: place for place in self._with_relations().filter(Place.id.in_(ids))}
+        return [(places[place_id], distance) for distance, place_id in hits if place_id in places]
+
+    def nearby(self, latitude: float, longitude: float, radius_km: float, limit: int):
+        """
+        Get the places within radius_km of a coordinate, nearest first.
+
+        Args:
+            latitude: Latitude of the search center
+            longitude: Longitude of the search center
+            radius_km: Search radius in kilometers
+            limit: Maximum number of places to return
+
+        Returns:
+            List of (Place, distance_km) tuples
+        """
+        return self._load_ranked(self._hits_within(latitude, longitude, radius_km)[:limit])
+
+    def nearest(self, latitude: float, longitude: float, k: int):
+        """
+        Get the k places nearest to a coordinate.
+
+        The search radius starts small and grows until at least k places fall
+        inside it, so only the cells around the coordinate are read.
+
+        Returns:
+            List of (Place, distance_km) tuples, nearest first
+        """
+        radius_km = self.NEAREST_START_RADIUS_KM
+        while True:
+            hits = self._hits_within(latitude, longitude, radius_km)
+            if len(hits) >= k or radius_km >= MAX_RADIUS_KM:
+                break
+            radius_km = min(radius_km * 4, MAX_RADIUS_KM)
+        return self._load_ranked(hits[:k])
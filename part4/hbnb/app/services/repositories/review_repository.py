@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from sqlalchemy import exists, tuple_
+
+from hbnb.app.persistence.repository import SQLAlchemyRepository
+from hbnb.app.models.review import Review
+
+
+class ReviewRepository(SQLAlchemyRepository):
+    """
+    ReviewRepository extends SQLAlchemyRepository with Review-specific methods.
+    """
+
+    def __init__(self):
+        super().__init__(Review)
+
+    def has_user_reviewed(self, user_id: str, place_id: str) -> bool:
+        """
+        Check whether a user already reviewed a place, using the unique
+        (user_id, place_id) index instead of loading the place's reviews.
+
+        Args:
+            user_id: The ID of the reviewing user
+            place_id: The ID of the reviewed place
+
+        Returns:
+            True if a review exists, False otherwise
+        """
+        from hbnb.app import db
+        return db.session.query(
+            exists().where(Review.user_id == user_id, Review.place_id == place_id)
+        ).scalar()
+
+    def reviewed_pairs(self, pairs) -> set[tuple[str, str]]:
+        """
+        Find which (user_id, place_id) pairs already have a review, in
+        batched row-value IN queries on the unique index.
+
+        Args:
+            pairs: (user_id, place_id) pairs to check
+
+        Returns:
+            Set of the pairs that are already reviewed
+        """
+        from hbnb.app import db
+        pairs = list(dict.fromkeys(pairs))
+        key = tuple_(Review.user_id, Review.place_id)
+        found = set()
+        # Two bound values per pair
+        step = self.IN_CHUNK_SIZE // 2
+        for start in range(0, len(pairs), step):
+            rows = db.session.query(Review.user_id, Review.place_id).filter(
+                key.in_(pairs[start:start + step]))
+            found.update((user_id, place_id) for user_id, place_id in rows)
+        return found
@@ -1,25 +1,154 @@
 from __future__ import annotations
 
+from sqlalchemy import func
+
 from hbnb.app.persistence.repository import SQLAlchemyRepository
+from hbnb.app.persistence.identity_cache import MISS, restore, snapshot
+from hbnb.app.persistence.unit_of_work import after_commit, in_unit_of_work
+from hbnb.app.extensions import identity_cache
 from hbnb.app.models.user import User
 
 
+def normalize_email(email: str) -> str:
+    """Case-insensitive form of an email address used for lookups"""
+    return email.strip().lower()
+
+
 class UserRepository(SQLAlchemyRepository):
     """
     UserRepository extends SQLAlchemyRepository with User-specific methods.
+
+    get() and get_user_by_email() read through the optional per-process
+    identity cache (see hbnb.app.persistence.identity_cache), keyed by id
+    and by normalized email. Password hashes are never cached: a cached
+    user reads its password from the database.
     """
 
+    # Columns left out of cached entries
+    UNCACHED = ('password',)
+
     def __init__(self):
         super().__init__(User)
 
-    def get_user_by_email(self, email: str) -> User | None:
+    @staticmethod
+    def _id_key(user_id):
+        return ('users', 'id', user_id)
+
+    @staticmethod
+    def _email_key(email):
+        return ('users', 'email', normalize_email(email))
+
+    def _remember(self, cache, user, *keys) -> None:
+        """Cache a user (or its absence) under keys, plus its id and email"""
+        if in_unit_of_work():
+            # The row may hold changes that are not committed yet
+            return
+        if user is None:
+            for key in keys:
+                cache.set(key, None)
+            return
+        values = snapshot(user, exclude=self.UNCACHED)
+        if values is None:
+            return
+        for key in {*keys, self._id_key(user.id), self._email_key(user.email)}:
+            cache.set(key, values)
+
+    def get(self, obj_id):
         """
-        Get a user by email address.
-        
+        Retrieve a user by ID.
+
+        Args:
+            obj_id: The unique identifier of the user
+
+        Returns:
+            User object or None if not found
+        """
+        cache = identity_cache.cache
+        if cache is None or obj_id is None:
+            return super().get(obj_id)
+        key = self._id_key(obj_id)
+        cached = cache.get(key)
+        if cached is not MISS:
+            return restore(self.model, cached) if cached is not None else None
+        user = super().get(obj_id)
+        self._remember(cache, user, key)
+        return user
+
+    def get_user_by_email(self, email: str, cached: bool = True) -> User | None:
+        """
+        Get a user by email address, ignoring case and surrounding spaces.
+
         Args:
             email: The email address to search for
-            
+            cached: False to query the database even on a cache hit (logins,
+                which must see password changes and deletions made by
+                other workers at once)
+
         Returns:
             User object if found, None otherwise
         """
-        return self.model.query.filter_by(email=email).first()
+        cache = identity_cache.cache
+        key = self._email_key(email)
+        if cache is not None and cached:
+            cached = cache.get(key)
+            if cached is not MISS:
+                return restore(self.model, cached) if cached is not None else None
+        user = self.model.query.filter(func.lower(User.email) == key[2]).first()
+        if cache is not None:
+            self._remember(cache, user, key)
+        return user
+
+    def get_ids_by_emails(self, emails) -> dict[str, str]:
+        """
+        Map email addresses to user IDs, ignoring case and surrounding
+        spaces, with batched IN queries (bulk imports).
+
+        Args:
+            emails: Email addresses to look up
+
+        Returns:
+            Dict of normalized email to user ID, without the ones not found
+        """
+        emails = list(dict.fromkeys(normalize_email(email) for email in emails))
+        return self._ids_by(func.lower(User.email), emails)
+
+    def invalidate(self, user_id, *emails) -> None:
+        """
+        Drop cached entries of a user, by id and every given email (pass
+        both the old and the new address when the email changes).
+
+        Inside a unit of work they are dropped again after the commit, as
+        another request may cache the old row until then.
+        """
+        cache = identity_cache.cache
+        if cache is not None:
+            keys = [self._id_key(user_id),
+                    *(self._email_key(email) for email in emails if email)]
+            cache.delete(*keys)
+            if in_unit_of_work():
+                after_commit(lambda: cache.delete(*keys))
+
+    def add(self, obj):
+        """Add a user, forgetting any cached miss for its id or email"""
+        super().add(obj)
+        self.invalidate(obj.id, obj.email)
+
+    def add_all(self, objs):
+        """Add users in one transaction, forgetting cached misses for them"""
+        super().add_all(objs)
+        for obj in objs:
+            self.invalidate(obj.id, obj.email)
+
+    def update(self, obj_id, data):
+        """Update a user and drop its cached entries"""
+        user = super().get(obj_id)
+        email = user.email if user is not None else None
+        super().update(obj_id, data)
+        self.invalidate(obj_id, email, data.get('email'))
+
+    def delete(self, obj_id):
+        """Delete a user and drop its cached entries"""
+        user = super().get(obj_id)
+        email = user.email if user is not None else None
+        super().delete(obj_id)
+        self.invalidate(obj_id, email)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from hbnb.app import db
+from hbnb.app.models.collection_version import CollectionVersion
+
+# Last change reported for a collection never changed through the facade
+EPOCH = datetime(1970, 1, 1)
+
+_UPSERTS = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}
+
+
+class CollectionVersions:
+    """
+    Change counters for the entity collections (users, places, reviews,
+    amenities), bumped by the facade on every create, update and delete.
+
+    Collection responses use them as validators: a list can only have
+    changed if the version of a collection it is built from has moved.
+    Counters are rows of the collection_versions table, bumped in the
+    transaction of the change itself, so every worker process sees the
+    same versions and a rolled back write moves none. The token includes
+    the time of the last change, so tokens of a database that was since
+    recreated do not match again.
+    """
+
+    def bump(self, *names: str) -> None:
+        """Record a change to each of the named collections, in the current transaction"""
+        session = db.session
+        upsert = _UPSERTS.get(session.get_bind().dialect.name)
+        now = datetime.utcnow()
+        table = CollectionVersion.__table__
+        for name in dict.fromkeys(names):
+            if upsert is not None:
+                session.execute(
+                    upsert(table).values(name=name, version=1, updated_at=now)
+                    .on_conflict_do_update(index_elements=[table.c.name],
+                                           set_={'version': table.c.version + 1,
+                                                 'updated_at': now}))
+                continue
+            result = session.execute(
+                update(table).where(table.c.name == name)
+                .values(version=table.c.version + 1, updated_at=now))
+            if result.rowcount == 0:
+                session.add(CollectionVersion(name=name, version=1, updated_at=now))
+
+    def get(self, name: str) -> tuple[str, datetime]:
+        """
+        Get the current version of a collection.
+
+        Returns:
+            Tuple of (version token, time of the last change). Collections
+            never changed report 1970-01-01.
+        """
+        return self.get_many([name])[0]
+
+    def get_many(self, names) -> list[tuple[str, datetime]]:
+        """Get the current version of each named collection, with one query"""
+        names = list(names)
+        if not names:
+            return []
+        rows = {name: (version, updated_at) for name, version, updated_at in db.session.execute(
+            select(CollectionVersion.name, CollectionVersion.version,
+                   CollectionVersion.updated_at).where(CollectionVersion.name.in_(names)))}
+        versions = []
+        for name in names:
+            version, modified = rows.get(name, (0, EPOCH))
+            versions.append((f'{name}.{version}.{modified.isoformat()}', modified))
+        return versions
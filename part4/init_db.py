@@ -22,8 +22,15 @@ if __name__ == '__main__':
         # Create all tables
         db.create_all()
         print("✓ Database tables created successfully!")
-        print(f"✓ Database file: {os.path.join(os.getcwd(), 'development.db')}")
+        print(f"✓ Database: {db.engine.url.render_as_string(hide_password=True)}")
         
         # List all tables created
         print("\nTables created:")
         print("  - users (id, first_name, last_name, email, password, is_admin, created_at, updated_at)")
+        print("  - places (id, title, description, price, latitude, longitude, location, owner_id, created_at, updated_at)")
+        print("  - reviews (id, text, rating, user_id, place_id, created_at, updated_at)")
+        print("  - amenities (id, name, created_at, updated_at)")
+        print("  - place_amenity (place_id, amenity_id)")
+        print("  - seed_markers (name, sha256, loaded_at)")
+        print("  - collection_versions (name, version, updated_at)")
+        print("\nLoad the seed data with: flask --app run hbnb seed")
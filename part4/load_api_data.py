@@ -81,17 +81,17 @@ print("\nCreating amenities...")
 amenities = ['WiFi', 'Swimming Pool', 'Free Parking', 'Gym']
 amenity_ids = []
 
-for amenity_name in amenities:
-    amenity_data = {'name': amenity_name}
-    response = requests.post(f'{API_URL}/amenities/', json=amenity_data, headers=headers)
-    if response.status_code == 201:
-        amenity_id = response.json()['id']
-        amenity_ids.append(amenity_id)
+response = requests.post(f'{API_URL}/amenities/bulk',
+                         json=[{'name': name} for name in amenities], headers=headers)
+all_amenities = None
+for amenity_name, item in zip(amenities, response.json().get('items', [])):
+    if item['status'] == 201:
+        amenity_ids.append(item['id'])
         print(f"✓ Amenity created: {amenity_name}")
     else:
         # Amenity might exist, get all
-        response = requests.get(f'{API_URL}/amenities/')
-        all_amenities = response.json()
+        if all_amenities is None:
+            all_amenities = requests.get(f'{API_URL}/amenities/').json()
         existing = next((a for a in all_amenities if a['name'] == amenity_name), None)
         if existing:
             amenity_ids.append(existing['id'])
@@ -130,15 +130,14 @@ places_data = [
 ]
 
 place_ids = []
-for place_data in places_data:
-    response = requests.post(f'{API_URL}/places/', json=place_data, headers=headers)
-    if response.status_code == 201:
-        place_id = response.json()['id']
-        place_ids.append(place_id)
+response = requests.post(f'{API_URL}/places/bulk', json=places_data, headers=headers)
+for place_data, item in zip(places_data, response.json().get('items', [])):
+    if item['status'] == 201:
+        place_ids.append(item['id'])
         print(f"✓ Place created: {place_data['title']}")
     else:
         print(f"✗ Failed to create place: {place_data['title']}")
-        print(f"  Error: {response.text}")
+        print(f"  Error: {item['error']}")
 
 # Add reviews
 if place_ids and user_id:
@@ -156,12 +155,12 @@ if place_ids and user_id:
         }
     ]
     
-    for review_data in reviews_data:
-        response = requests.post(f'{API_URL}/reviews/', json=review_data, headers=headers)
-        if response.status_code == 201:
+    response = requests.post(f'{API_URL}/reviews/bulk', json=reviews_data, headers=headers)
+    for item in response.json().get('items', []):
+        if item['status'] == 201:
             print(f"✓ Review added")
         else:
-            print(f"✗ Failed to add review: {response.text}")
+            print(f"✗ Failed to add review: {item['error']}")
 
 print("\n" + "="*50)
 print("✓ Sample data loaded successfully!")
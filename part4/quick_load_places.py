@@ -89,16 +89,19 @@ places_data = [
     }
 ]
 
+# One request and one transaction for every place
 place_ids = []
-for place_data in places_data:
-    response = requests.post(f'{API_URL}/places/', json=place_data, headers=headers)
-    if response.status_code == 201:
-        place_id = response.json()['id']
-        place_ids.append(place_id)
-        print(f"✓ Place created: {place_data['title']} (${place_data['price']}/night)")
-    else:
-        print(f"✗ Failed to create: {place_data['title']}")
-        print(f"  Error: {response.status_code} - {response.text[:200]}")
+response = requests.post(f'{API_URL}/places/bulk', json=places_data, headers=headers)
+if 'items' in response.json():
+    for place_data, item in zip(places_data, response.json()['items']):
+        if item['status'] == 201:
+            place_ids.append(item['id'])
+            print(f"✓ Place created: {place_data['title']} (${place_data['price']}/night)")
+        else:
+            print(f"✗ Failed to create: {place_data['title']}")
+            print(f"  Error: {item['status']} - {item['error']}")
+else:
+    print(f"✗ Failed to create places: {response.status_code} - {response.text[:200]}")
 
 print("\n" + "="*60)
 print(f"✓ Successfully created {len(place_ids)} places!")
@@ -9,16 +9,9 @@ from hbnb.app import create_app
 config_name = os.getenv('FLASK_ENV', 'development')
 config_class = f'config.{config_name.capitalize()}Config' if config_name != 'development' else 'config.DevelopmentConfig'
 
+# Seed data is loaded by `flask --app run hbnb seed`, not on every start
 app = create_app(config_class)
 
-# Load seed data on first run
-with app.app_context():
-    try:
-        from load_seed_data import load_seed_data
-        load_seed_data()
-    except Exception as e:
-        print(f"⚠️  Could not load seed data: {e}")
-
 if __name__ == '__main__':
     app.run(
         host='0.0.0.0',
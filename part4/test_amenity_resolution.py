@@ -0,0 +1,93 @@
+"""
+Tests for batched amenity resolution when places are created and updated.
+Run with: pytest test_amenity_resolution.py -v
+"""
+import pytest
+
+from conftest import count_queries
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.persistence.repository import InMemoryRepository, SQLAlchemyRepository
+
+
+def amenity_selects(statements):
+    return [s for s in statements if 'FROM amenities' in s and 'place_amenity' not in s]
+
+
+@pytest.fixture
+def amenity_ids(create_amenity):
+    return [create_amenity(name)['id'] for name in ('Wifi', 'Pool', 'Sauna')]
+
+
+@pytest.fixture
+def place_body(accounts):
+    def body(**fields):
+        return {'title': 'Batch', 'price': 10, 'latitude': 1.0, 'longitude': 2.0,
+                'owner_id': accounts['host'][0], **fields}
+    return body
+
+
+def amenities_of(client, place_id):
+    return sorted(a['id'] for a in client.get(f'/api/v1/places/{place_id}').get_json()['amenities'])
+
+
+class TestPlaceEndpoints:
+    """Amenities are loaded with one query per request"""
+
+    def test_create(self, app, client, accounts, amenity_ids, place_body):
+        headers = accounts['host'][1]
+        with count_queries(app) as statements:
+            response = client.post('/api/v1/places/', headers=headers,
+                                   json=place_body(amenities=amenity_ids + amenity_ids[:1]))
+        assert response.status_code == 201
+        assert len(amenity_selects(statements)) == 1
+        assert amenities_of(client, response.get_json()['id']) == sorted(amenity_ids)
+
+    def test_update(self, app, client, accounts, amenity_ids, place_body):
+        headers = accounts['host'][1]
+        place_id = client.post('/api/v1/places/', headers=headers,
+                               json=place_body(amenities=amenity_ids)).get_json()['id']
+        with count_queries(app) as statements:
+            response = client.put(f'/api/v1/places/{place_id}', headers=headers,
+                                  json=place_body(amenities=amenity_ids[1:]))
+        assert response.status_code == 200
+        assert len(amenity_selects(statements)) == 1
+        assert amenities_of(client, place_id) == sorted(amenity_ids[1:])
+
+    def test_update_without_amenities_keeps_them(self, client, accounts, amenity_ids, place_body):
+        headers = accounts['host'][1]
+        place_id = client.post('/api/v1/places/', headers=headers,
+                               json=place_body(amenities=amenity_ids)).get_json()['id']
+        response = client.put(f'/api/v1/places/{place_id}', headers=headers,
+                              json=place_body(title='Renamed'))
+        assert response.status_code == 200
+        assert amenities_of(client, place_id) == sorted(amenity_ids)
+
+    def test_unknown_amenity(self, client, accounts, amenity_ids, place_body):
+        headers = accounts['host'][1]
+        response = client.post('/api/v1/places/', headers=headers,
+                               json=place_body(amenities=amenity_ids + ['missing']))
+        assert response.status_code == 404
+        place_id = client.post('/api/v1/places/', headers=headers,
+                               json=place_body()).get_json()['id']
+        response = client.put(f'/api/v1/places/{place_id}', headers=headers,
+                              json=place_body(amenities=['missing']))
+        assert response.status_code == 404
+
+
+class TestGetMany:
+    """Repository.get_many returns {id: object} for the ids found"""
+
+    def test_in_memory(self):
+        repo = InMemoryRepository()
+        wifi = Amenity(name='Wifi')
+        repo.add(wifi)
+        assert repo.get_many([wifi.id, 'missing', wifi.id]) == {wifi.id: wifi}
+        assert repo.get_many([]) == {}
+
+    def test_sqlalchemy(self, app, amenity_ids):
+        repo = SQLAlchemyRepository(Amenity)
+        with count_queries(app) as statements, app.app_context():
+            found = repo.get_many(amenity_ids[:2] + ['missing'])
+            assert sorted(found) == sorted(amenity_ids[:2])
+            assert all(found[obj_id].id == obj_id for obj_id in found)
+        assert len(amenity_selects(statements)) == 1
@@ -0,0 +1,122 @@
+"""
+Tests for the bulk creation endpoints of amenities, places and reviews.
+Run with: pytest test_bulk.py -v
+"""
+import pytest
+
+
+def statuses(body):
+    return [item['status'] for item in body['items']]
+
+
+def place(owner_id, **fields):
+    return {'title': 'Bulk', 'price': 10, 'latitude': 1.0, 'longitude': 2.0,
+            'owner_id': owner_id, **fields}
+
+
+class TestAmenities:
+    """POST /api/v1/amenities/bulk"""
+
+    def test_all_created(self, client, accounts):
+        response = client.post('/api/v1/amenities/bulk', headers=accounts['admin'][1],
+                               json=[{'name': 'Wifi'}, {'name': 'Pool'}])
+        assert response.status_code == 201
+        body = response.get_json()
+        assert body['created'] == 2 and body['failed'] == 0
+        names = {a['name'] for a in client.get('/api/v1/amenities/').get_json()}
+        assert names == {'Wifi', 'Pool'}
+
+    def test_mixed(self, client, accounts, create_amenity):
+        create_amenity('Sauna')
+        items = [{'name': 'Wifi'}, {'name': 'Pool'}, {'name': 'Wifi'}, {'name': ''}, 'x',
+                 {'name': 'Sauna'}]
+        response = client.post('/api/v1/amenities/bulk', headers=accounts['admin'][1], json=items)
+        assert response.status_code == 207
+        body = response.get_json()
+        assert statuses(body) == [201, 201, 409, 400, 400, 409]
+        assert [item['index'] for item in body['items']] == list(range(6))
+
+    def test_admin_only(self, client, accounts):
+        response = client.post('/api/v1/amenities/bulk', headers=accounts['guest'][1],
+                               json=[{'name': 'Wifi'}])
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize('body', [[], {'a': 1}, 'items'])
+    def test_invalid_body(self, client, accounts, body):
+        response = client.post('/api/v1/amenities/bulk', headers=accounts['admin'][1], json=body)
+        assert response.status_code == 400
+
+    def test_item_limit(self, app, client, accounts):
+        app.config['BULK_MAX_ITEMS'] = 2
+        response = client.post('/api/v1/amenities/bulk', headers=accounts['admin'][1],
+                               json=[{'name': f'A{i}'} for i in range(3)])
+        assert response.status_code == 400
+
+
+class TestPlaces:
+    """POST /api/v1/places/bulk"""
+
+    def test_mixed(self, client, accounts, create_amenity):
+        host_id, headers = accounts['host']
+        wifi = create_amenity('Wifi')['id']
+        items = [place(host_id, amenities=[wifi]), place(accounts['admin'][0]),
+                 place(host_id, price=-1), place(host_id, amenities=['missing']),
+                 {'title': 'x'}, place(host_id, title='Second')]
+        response = client.post('/api/v1/places/bulk', headers=headers, json={'items': items})
+        assert response.status_code == 207
+        body = response.get_json()
+        assert statuses(body) == [201, 401, 400, 404, 400, 201]
+
+        created = client.get(f"/api/v1/places/{body['items'][0]['id']}").get_json()
+        assert [a['id'] for a in created['amenities']] == [wifi]
+        assert len(client.get('/api/v1/places/').get_json()) == 2
+
+    @pytest.mark.parametrize('fields', [
+        {'amenities': 5}, {'amenities': [['x']]}, {'owner_id': ['x']}, {'owner_id': 7}])
+    def test_malformed_keys(self, client, accounts, fields):
+        """Malformed items are rejected on their own, the others still created"""
+        host_id = accounts['host'][0]
+        response = client.post('/api/v1/places/bulk', headers=accounts['admin'][1],
+                               json=[{**place(host_id), **fields}, place(host_id, title='Valid')])
+        assert response.status_code == 207
+        assert statuses(response.get_json()) == [400, 201]
+
+    def test_admin_creates_for_others(self, client, accounts):
+        response = client.post('/api/v1/places/bulk', headers=accounts['admin'][1],
+                               json=[place(accounts['host'][0])])
+        assert response.status_code == 201
+
+
+class TestReviews:
+    """POST /api/v1/reviews/bulk"""
+
+    def test_mixed(self, client, accounts, create_place):
+        a, b = create_place(title='A')['id'], create_place(title='B')['id']
+        items = [{'text': 'Nice', 'rating': 5, 'place_id': a},
+                 {'text': 'Again', 'rating': 4, 'place_id': a},
+                 {'text': 'Ok', 'rating': 3, 'place_id': b},
+                 {'text': 'Bad', 'rating': 9, 'place_id': b},
+                 {'text': 'x', 'rating': 2, 'place_id': 'missing'}]
+        response = client.post('/api/v1/reviews/bulk', headers=accounts['guest'][1], json=items)
+        assert response.status_code == 207
+        assert statuses(response.get_json()) == [201, 403, 201, 400, 404]
+
+        created = client.get(f'/api/v1/places/{a}').get_json()
+        assert created['review_count'] == 1 and created['rating_average'] == 5.0
+
+    @pytest.mark.parametrize('fields', [{'user_id': ['x']}, {'place_id': ['x']},
+                                        {'place_id': 3}])
+    def test_malformed_keys(self, client, accounts, create_place, fields):
+        place_id = create_place()['id']
+        items = [{'text': 'Odd', 'rating': 4, 'place_id': place_id, **fields},
+                 {'text': 'Fine', 'rating': 4, 'place_id': place_id}]
+        response = client.post('/api/v1/reviews/bulk', headers=accounts['admin'][1], json=items)
+        assert response.status_code == 207
+        assert statuses(response.get_json()) == [400, 201]
+
+    def test_own_place(self, client, accounts, create_place):
+        place_id = create_place()['id']
+        response = client.post('/api/v1/reviews/bulk', headers=accounts['host'][1],
+                               json=[{'text': 'Mine', 'rating': 5, 'place_id': place_id}])
+        assert response.status_code == 403
+        assert response.get_json()['items'][0]['error'] == 'You cannot review your own place'
@@ -0,0 +1,117 @@
+"""
+Tests for the compact storage mode of InMemoryRepository: records of
+column values, materialized into model objects on access.
+Run with: pytest test_compact_repository.py -v
+"""
+import pytest
+
+from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
+from hbnb.app.models.user import User
+from hbnb.app.persistence.repository import Index, InMemoryRepository
+
+
+@pytest.fixture
+def data(app):
+    with app.app_context():
+        owner = User(first_name='O', last_name='W', email='owner@example.com', password='x' * 8)
+        users = [User(first_name='U', last_name='S', email=f'u{i}@example.com', password='x' * 8)
+                 for i in range(5)]
+        places = [Place(title=f'P{i}', description='d', price=10.0 + i, latitude=1.0,
+                        longitude=2.0, owner=owner) for i in range(3)]
+        reviews = [Review(text=f't{i}', rating=1 + i % 5, user=users[i % 5], place=places[i % 3])
+                   for i in range(30)]
+        repo = InMemoryRepository([Index('place_id'), Index('rating', ordered=True)],
+                                  model=Review, compact=True)
+        repo.add_all(reviews)
+        yield repo, owner, places, reviews
+
+
+def record(repo, obj_id):
+    key = repo._key(obj_id)
+    return repo._shard(key)[key]
+
+
+class TestStorage:
+    """Objects are stored as compact records"""
+
+    def test_materialized_on_access(self, data):
+        repo, _, _, reviews = data
+        review = repo.get(reviews[7].id)
+        assert review is not reviews[7] and type(review) is Review
+        for column in ('id', 'text', 'rating', 'created_at', 'updated_at'):
+            assert getattr(review, column) == getattr(reviews[7], column)
+        assert review.user_id == reviews[7].user.id
+        assert review.place_id == reviews[7].place.id
+
+    def test_binary_ids(self, data):
+        repo, _, _, reviews = data
+        assert isinstance(record(repo, reviews[0].id)[repo._codec.id_position], bytes)
+
+    def test_interned_foreign_keys(self, data):
+        repo, _, _, reviews = data
+        position = repo._codec.positions['place_id']
+        assert record(repo, reviews[0].id)[position] is record(repo, reviews[3].id)[position]
+
+    def test_requires_model(self):
+        with pytest.raises(ValueError):
+            InMemoryRepository(compact=True)
+
+
+class TestQueries:
+    """Indexes and pages work on compact records"""
+
+    def test_indexes(self, data):
+        repo, _, places, reviews = data
+        found = repo.get_all_by_attribute('place_id', [places[0].id])
+        assert {r.id for r in found} == {r.id for r in reviews[0::3]}
+        assert repo.get_by_attribute('place_id', places[1].id).id == reviews[1].id
+        assert [r.rating for r in repo.get_range('rating', 2, 3)] == sorted(
+            r.rating for r in reviews if 2 <= r.rating <= 3)
+
+    def test_pages(self, data):
+        repo, _, _, _ = data
+        seen, cursor = [], None
+        while True:
+            items, cursor = repo.get_page(7, cursor)
+            seen += [r.id for r in items]
+            if not cursor:
+                break
+        assert len(seen) == len(set(seen)) == 30
+
+    def test_unique_index(self, app, data):
+        _, owner, places, _ = data
+        with app.app_context():
+            repo = InMemoryRepository([Index('title', unique=True)], model=Place, compact=True)
+            repo.add_all(places)
+            place = repo.get_by_attribute('title', 'P2')
+            assert place.price == 12.0 and place.owner_id == owner.id
+            with pytest.raises(ValueError):
+                repo.add(Place(title='P2', description='', price=1.0, latitude=0.0,
+                               longitude=0.0, owner=owner))
+
+
+class TestWrites:
+    """Updates and deletes rewrite the records"""
+
+    def test_update(self, data):
+        repo, _, _, reviews = data
+        review_id = reviews[0].id
+        repo.update(review_id, {'text': 'changed', 'rating': 5})
+        review = repo.get(review_id)
+        assert review.text == 'changed' and review.rating == 5
+        assert review_id in {r.id for r in repo.get_range('rating', 5, 5)}
+
+    def test_protected_columns(self, data):
+        repo, _, _, reviews = data
+        before = repo.get(reviews[0].id)
+        repo.update(reviews[0].id, {'id': 'other', 'created_at': None, 'unknown': 1})
+        after = repo.get(reviews[0].id)
+        assert after.id == before.id and after.created_at == before.created_at
+        assert after.updated_at >= before.updated_at
+
+    def test_delete(self, data):
+        repo, _, _, reviews = data
+        repo.delete(reviews[1].id)
+        assert repo.get(reviews[1].id) is None
+        assert len(repo) == 29
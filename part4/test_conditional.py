@@ -0,0 +1,101 @@
+"""
+Tests for conditional GETs: ETag / Last-Modified validators and 304
+responses, with collection versions shared through the database.
+Run with: pytest test_conditional.py -v
+"""
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from werkzeug.http import http_date
+
+from hbnb.app import db
+
+
+@pytest.fixture
+def place_id(create_place, create_review):
+    place_id = create_place()['id']
+    create_review(place_id)
+    return place_id
+
+
+class TestCollections:
+    """Validators of the collection endpoints"""
+
+    @pytest.mark.parametrize('url', [
+        '/api/v1/places/', '/api/v1/amenities/', '/api/v1/reviews/', '/api/v1/users/',
+        '/api/v1/places/?fields=id,title&limit=2'])
+    def test_not_modified(self, client, place_id, url):
+        response = client.get(url)
+        etag, modified = response.headers['ETag'], response.headers['Last-Modified']
+        assert response.headers['Cache-Control'] == 'no-cache'
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
+        assert client.get(url, headers={'If-Modified-Since': modified}).status_code == 304
+        # If-None-Match takes precedence over If-Modified-Since
+        assert client.get(url, headers={'If-None-Match': '"other"',
+                                        'If-Modified-Since': modified}).status_code == 200
+
+    def test_variants_differ(self, client, place_id):
+        assert (client.get('/api/v1/places/').headers['ETag']
+                != client.get('/api/v1/places/?fields=id').headers['ETag'])
+
+    def test_write_changes_etag(self, client, accounts, place_id):
+        etag = client.get('/api/v1/amenities/').headers['ETag']
+        response = client.post('/api/v1/amenities/', headers=accounts['admin'][1],
+                               json={'name': 'Pool'})
+        assert response.status_code == 201
+        assert client.get('/api/v1/amenities/', headers={'If-None-Match': etag}).status_code == 200
+
+    def test_write_by_another_process(self, client, database, place_id):
+        """Versions are read from the database, not from this process's memory"""
+        etag = client.get('/api/v1/reviews/').headers['ETag']
+        with sqlite3.connect(database) as connection:
+            connection.execute(
+                "UPDATE collection_versions SET version = version + 1, "
+                "updated_at = '2031-01-01 00:00:00' WHERE name = 'reviews'")
+        connection.close()
+        response = client.get('/api/v1/reviews/', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert '2031' in response.headers['Last-Modified']
+
+    def test_rolled_back_write_keeps_version(self, app, client, facade, place_id):
+        etag = client.get('/api/v1/amenities/').headers['ETag']
+        with app.app_context():
+            with pytest.raises(RuntimeError):
+                with facade.transaction():
+                    facade.create_amenity({'name': 'Sauna'})
+                    raise RuntimeError('abort')
+            db.session.remove()
+        assert client.get('/api/v1/amenities/', headers={'If-None-Match': etag}).status_code == 304
+
+
+class TestItems:
+    """Validators of single entities"""
+
+    def test_place_detail(self, client, accounts, place_id):
+        url = f'/api/v1/places/{place_id}'
+        etag = client.get(url).headers['ETag']
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+        review = client.get(f'/api/v1/reviews/places/{place_id}/reviews').get_json()[0]
+        response = client.put(f"/api/v1/reviews/{review['id']}", headers=accounts['guest'][1],
+                              json={'text': 'Edited', 'rating': 2, 'place_id': place_id})
+        assert response.status_code == 200
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 200
+
+    def test_amenity(self, client, create_amenity):
+        url = f"/api/v1/amenities/{create_amenity('Wifi')['id']}"
+        etag = client.get(url).headers['ETag']
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+        assert client.get(url, headers={'If-None-Match': '*'}).status_code == 304
+        old = http_date(datetime.now(timezone.utc) - timedelta(days=3))
+        assert client.get(url, headers={'If-Modified-Since': old}).status_code == 200
+
+    def test_missing_entity(self, client, place_id):
+        response = client.get('/api/v1/places/missing', headers={'If-None-Match': '*'})
+        assert response.status_code == 404
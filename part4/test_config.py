@@ -0,0 +1,81 @@
+"""
+Tests for the database settings of the configurations: SQLite PRAGMAs
+applied on every connection, pool sizing and PostgreSQL URIs.
+Run with: pytest test_config.py -v
+"""
+import pytest
+
+from config import ProductionConfig, database_uri, engine_options
+from conftest import make_app
+from hbnb.app import db
+
+
+def pragma(app, name):
+    with app.app_context():
+        return db.session.execute(db.text(f'PRAGMA {name}')).scalar()
+
+
+@pytest.fixture
+def production_app(tmp_path):
+    return make_app(tmp_path / 'production.db', SQLITE_PRAGMAS=ProductionConfig.SQLITE_PRAGMAS,
+                    SQLALCHEMY_ENGINE_OPTIONS={'pool_size': 3, 'max_overflow': 2})
+
+
+class TestSQLitePragmas:
+    """SQLITE_PRAGMAS run on each connection of the pool"""
+
+    def test_production_pragmas(self, production_app):
+        assert pragma(production_app, 'journal_mode') == 'wal'
+        assert pragma(production_app, 'synchronous') == 1  # NORMAL
+        assert pragma(production_app, 'busy_timeout') == ProductionConfig.SQLITE_PRAGMAS['busy_timeout']
+        assert pragma(production_app, 'cache_size') == ProductionConfig.SQLITE_PRAGMAS['cache_size']
+        assert pragma(production_app, 'temp_store') == 2  # MEMORY
+
+    def test_every_connection(self, production_app):
+        with production_app.app_context():
+            engine = db.engine
+            connections = [engine.connect() for _ in range(3)]
+        try:
+            for connection in connections:
+                assert connection.exec_driver_sql('PRAGMA synchronous').scalar() == 1
+        finally:
+            for connection in connections:
+                connection.close()
+
+    def test_pool_size(self, production_app):
+        with production_app.app_context():
+            assert db.engine.pool.size() == 3
+
+    def test_default_journal(self, app):
+        assert pragma(app, 'journal_mode') == 'delete'
+
+    @pytest.mark.parametrize('pragmas', [
+        {'journal_mode; DROP TABLE users': 'WAL'}, {'synchronous': 'NORMAL; --'}])
+    def test_invalid_pragma(self, tmp_path, pragmas):
+        with pytest.raises(ValueError):
+            make_app(tmp_path / 'invalid.db', SQLITE_PRAGMAS=pragmas)
+
+
+class TestEngineOptions:
+    """Pool options derived from the database URI"""
+
+    def test_memory_sqlite_not_pooled(self):
+        assert engine_options('sqlite://') == {}
+        assert engine_options('sqlite:///:memory:') == {}
+
+    def test_sqlite_file(self, monkeypatch):
+        monkeypatch.setenv('DB_POOL_SIZE', '4')
+        options = engine_options('sqlite:///hbnb.db')
+        assert options['pool_size'] == 4
+        assert 'pool_pre_ping' not in options
+
+    def test_postgresql(self):
+        options = engine_options('postgresql://hbnb@db/hbnb')
+        assert options['pool_pre_ping'] is True
+        assert options['pool_recycle'] > 0
+
+    def test_database_url(self, monkeypatch):
+        monkeypatch.setenv('DATABASE_URL', 'postgres://hbnb@db/hbnb')
+        assert database_uri('sqlite:///default.db') == 'postgresql://hbnb@db/hbnb'
+        monkeypatch.delenv('DATABASE_URL')
+        assert database_uri('sqlite:///default.db') == 'sqlite:///default.db'
@@ -0,0 +1,196 @@
+"""
+Tests for the streaming, resumable importer of seed-format data.
+Run with: pytest test_importer.py -v
+"""
+import io
+import json
+
+import pytest
+
+from hbnb.app import db
+from hbnb.app import importer as importer_module
+from hbnb.app.importer import Importer, read_items
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.import_checkpoint import ImportCheckpoint
+from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
+from hbnb.app.models.user import User
+
+USERS = 8
+
+
+def write_ndjson(path, items):
+    with open(path, 'w') as f:
+        for item in items:
+            f.write(json.dumps(item) + '\n')
+    return str(path)
+
+
+def count(model, *criteria):
+    return db.session.scalar(db.select(db.func.count(model.id)).where(*criteria))
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    """NDJSON with valid and invalid users, amenities, places and reviews"""
+    user = {'type': 'user', 'first_name': 'U', 'last_name': 'Test', 'password': 'password'}
+    place = {'type': 'place', 'description': 'd', 'price': 10.0, 'latitude': 1.0,
+             'longitude': 2.0, 'owner_email': 'host@import.io'}
+    items = [dict(user, email='Host@import.io')]
+    items += [dict(user, email=f'u{i}@import.io') for i in range(USERS)]
+    items += [dict(user, email='U0@IMPORT.io'), dict(user, email='not-an-email')]
+    items += [{'type': 'amenity', 'name': 'Sauna'}, {'type': 'amenity', 'name': 'WiFi'},
+              {'type': 'amenity', 'name': 'Sauna'}]
+    items += [dict(place, title=f'Imp {i}', amenities=['Sauna', 'WiFi']) for i in range(3)]
+    items += [dict(place, title='Orphan', owner_email='ghost@import.io'),
+              dict(place, title='Unknown amenity', amenities=['Nope'])]
+    items += [{'type': 'review', 'text': f'r{i}', 'rating': 1 + i % 5,
+               'user_email': f'u{i % USERS}@import.io', 'place_title': f'Imp {i // USERS}'}
+              for i in range(3 * USERS)]
+    items += [{'type': 'review', 'text': 'own', 'rating': 3, 'user_email': 'host@import.io',
+               'place_title': 'Imp 0'}]
+    items += [{'type': 'spaceship'}, [1, 2]]
+    return write_ndjson(tmp_path / 'data.ndjson', items)
+
+
+class TestReading:
+    """Items are streamed from JSON and NDJSON files"""
+
+    DOC = {'users': [{'email': 'a@b.io', 'n': 12345, 'x': [1.5, True, None, 'q"}]']}] * 2,
+           'meta': {'v': 1}, 'reviews': [], 'places': [{'price': 1234567}]}
+
+    @pytest.mark.parametrize('block_size', [1, 2, 7, 1 << 16])
+    def test_json_stream(self, monkeypatch, block_size):
+        stream = importer_module._JsonStream
+        monkeypatch.setattr(importer_module, '_JsonStream', lambda f: stream(f, block_size))
+        items = list(importer_module._json_items(io.StringIO(json.dumps(self.DOC, indent=1))))
+        assert items == ([('users', user) for user in self.DOC['users']]
+                         + [('places', place) for place in self.DOC['places']])
+
+    def test_kinds(self, tmp_path):
+        path = write_ndjson(tmp_path / 'items.ndjson', [
+            {'type': 'amenity', 'name': 'A'}, {'name': 'B'}, {'type': 'spaceship'}])
+        assert list(read_items(path, kind='amenities')) == [
+            ('amenities', {'name': 'A'}), ('amenities', {'name': 'B'}), (None, {})]
+
+
+class TestImport:
+    """Valid items are created, the others rejected or skipped"""
+
+    def test_counts(self, app, dataset):
+        with app.app_context():
+            stats = Importer(chunk_size=5).run(dataset)
+            assert stats['users'] == {'read': USERS + 3, 'created': USERS + 1,
+                                      'skipped': 1, 'rejected': 1}
+            assert stats['amenities']['created'] == 2
+            assert stats['places']['created'] == 3 and stats['places']['rejected'] == 2
+            assert stats['reviews']['created'] == 3 * USERS and stats['reviews']['rejected'] == 1
+
+            place = db.session.scalars(db.select(Place).where(Place.title == 'Imp 0')).one()
+            assert place.review_count == USERS
+            assert sorted(a.name for a in place.amenities) == ['Sauna', 'WiFi']
+            assert count(Place, Place.title == 'Orphan') == 0
+
+    def test_again_skips_everything(self, app, dataset):
+        with app.app_context():
+            Importer(chunk_size=5).run(dataset)
+            stats = Importer(chunk_size=5).run(dataset, resume=False)
+            assert all(section['created'] == 0 for section in stats.values())
+            assert stats['reviews']['skipped'] == 3 * USERS
+            assert stats['users']['skipped'] == USERS + 2
+
+    def test_missing_password_rejected(self, app, tmp_path):
+        path = write_ndjson(tmp_path / 'users.ndjson', [
+            {'type': 'user', 'first_name': 'A', 'last_name': 'B', 'email': 'nopw@example.com'},
+            {'type': 'user', 'first_name': 'C', 'last_name': 'D', 'email': 'pw@example.com',
+             'password': 'secret'}])
+        with app.app_context():
+            stats = Importer().run(path)
+            assert stats['users']['created'] == 1 and stats['users']['rejected'] == 1
+            assert count(User, User.email == 'pw@example.com') == 1
+
+    def test_malformed_items_rejected(self, app, tmp_path):
+        place = {'type': 'place', 'description': 'd', 'price': 10.0, 'latitude': 1.0,
+                 'longitude': 2.0, 'owner_email': 'host@import.io'}
+        path = write_ndjson(tmp_path / 'odd.ndjson', [
+            {'type': 'user', 'first_name': 'H', 'last_name': 'O', 'email': 'host@import.io',
+             'password': 'password'},
+            dict(place, title='Bad amenities', amenities=5),
+            dict(place, title=['not', 'a', 'title']),
+            {'type': 'place', 'title': 'Raw owner', 'price': 10.0, 'latitude': 1.0,
+             'longitude': 2.0, 'owner_id': ['x']},
+            dict(place, title='Good'),
+            {'type': 'review', 'text': 'x', 'rating': 4, 'user_email': 'host@import.io',
+             'place_title': ['Good']}])
+        with app.app_context():
+            stats = Importer().run(path)
+            assert stats['places'] == {'read': 4, 'created': 1, 'skipped': 0, 'rejected': 3}
+            assert stats['reviews']['rejected'] == 1
+
+    def test_rows_refused_by_database(self, app, tmp_path):
+        """A chunk hitting a constraint is retried item by item"""
+        class RawImporter(Importer):
+            def _import_amenities(self, items):
+                for _, item in items:
+                    db.session.add(Amenity(name=item['name']))
+                self.stats['amenities']['created'] += len(items)
+                return {}
+
+        path = write_ndjson(tmp_path / 'amenities.ndjson', [
+            {'type': 'amenity', 'name': name} for name in ('A1', 'A2', 'A1', 'A3')])
+        with app.app_context():
+            importer = RawImporter()
+            stats = importer.run(path)
+            assert stats['amenities'] == {'read': 4, 'created': 3, 'skipped': 0, 'rejected': 1}
+            assert importer.position == 4
+            assert count(Amenity) == 3
+            assert RawImporter().run(path)['amenities']['read'] == 0
+
+
+class TestResume:
+    """An interrupted import continues from its checkpoint"""
+
+    def test_resume(self, app, dataset):
+        class Interrupted(Exception):
+            pass
+
+        positions = []
+
+        def interrupt(importer):
+            positions.append(importer.position)
+            if len(positions) == 4:
+                raise Interrupted()
+
+        with app.app_context():
+            with pytest.raises(Interrupted):
+                Importer(chunk_size=5, progress=interrupt).run(dataset)
+            assert db.session.get(ImportCheckpoint, 'data.ndjson').position == positions[-1]
+
+            importer = Importer(chunk_size=5)
+            importer.run(dataset)
+            assert importer.resumed_at == positions[-1]
+            assert count(User, User.email.like('%@import.io')) == USERS + 1
+            assert count(Review) == 3 * USERS
+
+            stats = Importer().run(dataset)
+            assert sum(section['read'] for section in stats.values()) == 0
+
+
+class TestCommands:
+    """flask hbnb import and import-users"""
+
+    def test_import(self, app, tmp_path):
+        path = tmp_path / 'amenities.json'
+        path.write_text(json.dumps([{'name': f'A{i}'} for i in range(7)]))
+        output = app.test_cli_runner().invoke(args=[
+            'hbnb', 'import', str(path), '--type', 'amenities', '--chunk-size', '3']).output
+        assert 'amenities: 7 created' in output
+
+    def test_import_users(self, app, accounts, tmp_path):
+        path = tmp_path / 'users.json'
+        path.write_text(json.dumps({'users': [
+            {'first_name': 'I', 'last_name': 'U', 'email': 'new@example.com', 'password': 'secret'},
+            {'first_name': 'I', 'last_name': 'U', 'email': 'guest@example.com', 'password': 'secret'},
+        ], 'places': [{'title': 'x'}]}))
+        output = app.test_cli_runner().invoke(args=['hbnb', 'import-users', str(path)]).output
+        assert 'Imported 1 users (1 already existed)' in output
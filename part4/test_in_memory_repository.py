@@ -0,0 +1,189 @@
+"""
+Tests for the indexed, lock-striped InMemoryRepository.
+Run with: pytest test_in_memory_repository.py -v
+"""
+import random
+import sys
+import threading
+
+import pytest
+
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.user import User
+from hbnb.app.persistence.repository import Index, InMemoryRepository
+
+
+@pytest.fixture
+def fast_switching():
+    """Switch threads as often as possible, to expose races"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.fixture
+def amenities(app):
+    with app.app_context():
+        repo = InMemoryRepository([Index('name', unique=True), Index('created_at', ordered=True)])
+        objs = [Amenity(name=f'A{i}') for i in range(20)]
+        repo.add_all(objs)
+        yield repo, objs
+
+
+class Tag(Amenity):
+    """Amenity whose update() normalizes the name, as models may do"""
+
+    def update(self, data):
+        super().update({**data, 'name': data.get('name', self.name).strip().lower()})
+
+
+def run_threads(*targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestIndexes:
+    """Hash, unique and ordered indexes follow every write"""
+
+    def test_lookup(self, amenities):
+        repo, objs = amenities
+        assert repo.get_by_attribute('name', 'A12') is objs[12]
+        assert repo.get_by_attribute('name', 'missing') is None
+        assert {o.name for o in repo.get_all_by_attribute('name', ['A5', 'A6', 'zz'])} == {'A5', 'A6'}
+
+    def test_unique(self, amenities):
+        repo, objs = amenities
+        with pytest.raises(ValueError):
+            repo.add(Amenity(name='A1'))
+        with pytest.raises(ValueError):
+            repo.update(objs[2].id, {'name': 'A1'})
+        assert objs[2].name == 'A2'
+        assert len(repo) == 20
+
+    def test_update_reindexes(self, amenities):
+        repo, objs = amenities
+        repo.update(objs[1].id, {'name': 'B1'})
+        assert repo.get_by_attribute('name', 'A1') is None
+        assert repo.get_by_attribute('name', 'B1') is objs[1]
+
+    def test_failed_validation_reindexes_values_set(self, amenities):
+        repo, objs = amenities
+        with pytest.raises(ValueError):
+            repo.update(objs[3].id, {'name': ''})
+        assert repo.get_by_attribute('name', objs[3].name) is objs[3]
+
+    def test_unique_after_update(self, app):
+        with app.app_context():
+            repo = InMemoryRepository([Index('name', unique=True)])
+            wifi, pool = Tag(name='wifi'), Tag(name='pool')
+            repo.add_all([wifi, pool])
+            updated_at = pool.updated_at
+            with pytest.raises(ValueError):
+                repo.update(pool.id, {'name': ' WiFi'})
+            assert (pool.name, pool.updated_at) == ('pool', updated_at)
+            assert repo.get_by_attribute('name', 'pool') is pool
+            repo.update(pool.id, {'name': ' Pool '})
+            assert repo.get_by_attribute('name', 'pool') is pool
+
+    def test_delete(self, amenities):
+        repo, objs = amenities
+        repo.delete(objs[4].id)
+        assert repo.get_by_attribute('name', 'A4') is None
+        assert len(repo) == 19
+
+    def test_range_and_page(self, amenities):
+        repo, objs = amenities
+        found = repo.get_range('created_at', objs[10].created_at, objs[12].created_at)
+        assert found[0] is objs[10]
+        items, next_cursor = repo.get_page(10)
+        assert len(items) == 10 and next_cursor
+
+    def test_non_unique_and_unindexed(self, app):
+        with app.app_context():
+            repo = InMemoryRepository([Index('last_name')])
+            users = [User(first_name='F', last_name=f'L{i % 3}', email=f'u{i}@example.com',
+                          password='x' * 8) for i in range(9)]
+            repo.add_all(users)
+            assert repo.get_by_attribute('last_name', 'L1') is users[1]
+            assert len(repo.get_all_by_attribute('last_name', ['L1'])) == 3
+            assert repo.get_by_attribute('email', 'u5@example.com') is users[5]
+
+
+class TestConcurrency:
+    """Concurrent writers keep the indexes consistent"""
+
+    def test_unique_index(self, app, fast_switching):
+        repo = InMemoryRepository([Index('name', unique=True)], stripes=8)
+        errors = []
+
+        def worker(seed):
+            rnd = random.Random(seed)
+            mine = []
+            for _ in range(200):
+                op = rnd.random()
+                try:
+                    if op < .5 or not mine:
+                        obj = Amenity(name=f'N{rnd.randint(0, 100)}')
+                        repo.add(obj)
+                        mine.append(obj)
+                    elif op < .8:
+                        repo.update(rnd.choice(mine).id, {'name': f'N{rnd.randint(0, 100)}'})
+                    else:
+                        repo.delete(mine.pop(rnd.randrange(len(mine))).id)
+                except ValueError:
+                    pass
+                except Exception as e:
+                    errors.append(e)
+
+        with app.app_context():
+            run_threads(*(lambda seed=seed: worker(seed) for seed in range(6)))
+        assert not errors
+        objs = repo.get_all()
+        names = [o.name for o in objs]
+        assert len(names) == len(set(names)) == len(repo)
+        for obj in objs:
+            assert repo.get_by_attribute('name', obj.name) is obj
+
+    def test_unique_after_update(self, app, fast_switching):
+        """Values normalized by update() are checked under their own locks"""
+        with app.app_context():
+            repo = InMemoryRepository([Index('name', unique=True)], stripes=8)
+            tags = [Tag(name=f't{i}') for i in range(8)]
+            repo.add_all(tags)
+
+            def rename(tag):
+                for n in range(200):
+                    try:
+                        repo.update(tag.id, {'name': f' N{n % 20}'})
+                    except ValueError:
+                        pass
+
+            run_threads(*(lambda tag=tag: rename(tag) for tag in tags))
+        names = [tag.name for tag in repo.get_all()]
+        assert len(names) == len(set(names))
+        for tag in tags:
+            assert repo.get_by_attribute('name', tag.name) is tag
+
+    def test_ordered_index(self, app, fast_switching):
+        """Updates and add/delete churn never corrupt an ordered index"""
+        with app.app_context():
+            repo = InMemoryRepository([Index('name'), Index('created_at', ordered=True)])
+            keep = [Amenity(name=f'K{i}') for i in range(50)]
+            repo.add_all(keep)
+
+            def updater():
+                for n in range(1000):
+                    repo.update(keep[n % 50].id, {'name': f'K{n % 50}-{n}'})
+
+            def churn():
+                for n in range(1000):
+                    obj = Amenity(name=f'C{n}')
+                    repo.add(obj)
+                    repo.delete(obj.id)
+
+            run_threads(updater, updater, churn)
+        assert repo._sorted['created_at'] == sorted((o.created_at, o.id) for o in keep)
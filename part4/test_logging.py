@@ -0,0 +1,53 @@
+"""
+Tests for the logging setup and the review submission path that used to
+print every place on each request.
+Run with: pytest test_logging.py -v
+"""
+import logging
+
+import pytest
+
+from conftest import make_app
+
+
+@pytest.fixture
+def hbnb_records(caplog):
+    """Records of the 'hbnb' loggers, which do not propagate to the root"""
+    logger = logging.getLogger('hbnb')
+    logger.addHandler(caplog.handler)
+    yield caplog
+    logger.removeHandler(caplog.handler)
+
+
+class TestLogging:
+    """LOG_LEVEL configures the 'hbnb' logger hierarchy"""
+
+    def test_level_from_config(self, tmp_path):
+        make_app(tmp_path / 'debug.db', LOG_LEVEL='DEBUG')
+        assert logging.getLogger('hbnb').level == logging.DEBUG
+        make_app(tmp_path / 'warning.db', LOG_LEVEL='WARNING')
+        assert logging.getLogger('hbnb').level == logging.WARNING
+        assert not logging.getLogger('hbnb.app.api.v1.reviews').isEnabledFor(logging.DEBUG)
+
+    def test_single_handler(self, tmp_path):
+        make_app(tmp_path / 'one.db')
+        make_app(tmp_path / 'two.db')
+        assert len([h for h in logging.getLogger('hbnb').handlers
+                    if type(h) is logging.StreamHandler]) == 1
+
+
+class TestReviewSubmission:
+    """Posting a review no longer loads every place"""
+
+    def test_places_not_listed(self, facade, create_place, create_review, monkeypatch,
+                               hbnb_records):
+        place_id = create_place()['id']
+
+        def get_all_places(*args, **kwargs):
+            raise AssertionError('review submission listed every place')
+
+        monkeypatch.setattr(facade, 'get_all_places', get_all_places)
+        logging.getLogger('hbnb').setLevel(logging.DEBUG)
+        create_review(place_id)
+        messages = [r.getMessage() for r in hbnb_records.records]
+        assert any('Review submission' in m and place_id in m for m in messages)
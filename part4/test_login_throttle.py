@@ -0,0 +1,148 @@
+"""
+Tests for login rate limiting: token buckets per client IP, per
+(email, IP) pair and per email, and the stores sharing them.
+Run with: pytest test_login_throttle.py -v
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import make_app
+from hbnb.app.rate_limit import (
+    Limit, MemoryStore, RateLimiter, SharedMemoryStore, SQLiteStore)
+
+EMAIL = 'guest@example.com'
+
+# Keys as the limiter stores them: 16-byte digests
+A, B = RateLimiter._key('test', 'a'), RateLimiter._key('test', 'b')
+
+
+@pytest.fixture
+def throttled_app(tmp_path):
+    return make_app(tmp_path / 'throttle.db', RATE_LIMIT_STORE='memory',
+                    RATE_LIMITS={'login_ip': (6, 1), 'login_client': (3, 1),
+                                 'login_email': (5, 1)})
+
+
+@pytest.fixture
+def client(throttled_app, facade):
+    with throttled_app.app_context():
+        facade.create_users([{'first_name': 'Guest', 'last_name': 'Test', 'email': EMAIL,
+                              'password': 'guest-password'}])
+    return throttled_app.test_client()
+
+
+def login(client, password, ip='10.0.0.1', email=EMAIL):
+    return client.post('/api/v1/users/login', json={'email': email, 'password': password},
+                       environ_base={'REMOTE_ADDR': ip})
+
+
+class TestLogin:
+    """Buckets charged by the login endpoint"""
+
+    def test_client_bucket(self, client):
+        for _ in range(3):
+            assert login(client, 'wrong').status_code == 401
+        response = login(client, 'wrong')
+        assert response.status_code == 429
+        assert int(response.headers['Retry-After']) >= 1
+
+    def test_attacker_does_not_lock_out_owner(self, client):
+        # Refused attempts are not charged to the account's own bucket
+        for _ in range(20):
+            login(client, 'wrong', ip='10.0.0.66')
+        assert login(client, 'wrong', ip='10.0.0.66').status_code == 429
+        assert login(client, 'guest-password', ip='10.0.0.7').status_code == 200
+
+    def test_email_bucket_across_clients(self, client):
+        # Credential stuffing: one attempt per IP still empties the account's bucket
+        for i in range(5):
+            assert login(client, 'wrong', ip=f'10.0.1.{i}').status_code == 401
+        response = login(client, 'wrong', ip='10.0.1.99')
+        assert response.status_code == 429
+        assert int(response.headers['Retry-After']) >= 1
+
+    def test_success_refills_email_buckets(self, client):
+        for i in range(2):
+            login(client, 'wrong')
+            login(client, 'wrong', ip=f'10.0.1.{i}')
+        assert login(client, 'guest-password').status_code == 200
+        for _ in range(3):
+            assert login(client, 'wrong').status_code == 401
+        for i in range(2):
+            assert login(client, 'wrong', ip=f'10.0.2.{i}').status_code == 401
+
+    def test_ip_bucket(self, client):
+        for i in range(6):
+            login(client, 'wrong', email=f'user{i}@example.com')
+        assert login(client, 'guest-password').status_code == 429
+        assert login(client, 'guest-password', ip='10.0.0.2').status_code == 200
+
+    def test_unlisted_scope_not_limited(self, tmp_path, facade):
+        app = make_app(tmp_path / 'throttle.db', RATE_LIMIT_STORE='memory',
+                       RATE_LIMITS={'login_ip': (6, 1)})
+        client = app.test_client()
+        for _ in range(6):
+            assert login(client, 'wrong').status_code == 401
+        assert login(client, 'wrong').status_code == 429
+
+    def test_disabled_in_tests(self, app):
+        client = app.test_client()
+        for _ in range(30):
+            assert login(client, 'wrong').status_code == 401
+
+
+@pytest.mark.parametrize('workers, store', [('1', 'memory'), ('4', 'shm')])
+def test_default_store_follows_worker_count(workers, store):
+    # Per-worker buckets would multiply every limit by the worker count
+    env = {**os.environ, 'WEB_CONCURRENCY': workers}
+    env.pop('RATE_LIMIT_STORE', None)
+    result = subprocess.run(
+        [sys.executable, '-c', 'import config; print(config.Config.RATE_LIMIT_STORE)'],
+        cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+        capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == store
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'shm'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryStore(16)
+    if request.param == 'sqlite':
+        return SQLiteStore(str(tmp_path / 'buckets.sqlite'))
+    return SharedMemoryStore(str(tmp_path / 'buckets.shm'), 16)
+
+
+class TestStores:
+    """Every store implements the same token bucket"""
+
+    LIMIT = Limit(burst=2, per_minute=60)
+
+    def test_burst_then_refill(self, store):
+        assert store.take(A, self.LIMIT, 100.0) == 0
+        assert store.take(A, self.LIMIT, 100.0) == 0
+        assert store.take(A, self.LIMIT, 100.0) == pytest.approx(1.0)
+        assert store.take(A, self.LIMIT, 101.0) == 0
+
+    def test_keys_are_independent(self, store):
+        for _ in range(2):
+            store.take(A, self.LIMIT, 100.0)
+        assert store.take(A, self.LIMIT, 100.0) > 0
+        assert store.take(B, self.LIMIT, 100.0) == 0
+
+    def test_check_does_not_take(self, store):
+        assert store.take(A, self.LIMIT, 100.0, cost=0) == 0
+        assert len(store) == 0
+        store.take(A, self.LIMIT, 100.0)
+        for _ in range(3):
+            assert store.take(A, self.LIMIT, 100.0, cost=0) == 0
+        store.take(A, self.LIMIT, 100.0)
+        assert store.take(A, self.LIMIT, 100.0, cost=0) == pytest.approx(1.0)
+
+    def test_reset(self, store):
+        for _ in range(3):
+            store.take(A, self.LIMIT, 100.0)
+        store.reset(A)
+        assert store.take(A, self.LIMIT, 100.0) == 0
@@ -0,0 +1,76 @@
+"""
+Tests for keyset pagination of the collection endpoints.
+Run with: pytest test_pagination.py -v
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from hbnb.app.persistence.repository import InMemoryRepository
+
+
+def walk(client, url):
+    """IDs of every page, following the Link headers"""
+    ids = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200, response.get_json()
+        page = response.get_json()
+        assert len(page) <= 2
+        ids += [item['id'] for item in page]
+        link = response.headers.get('Link')
+        url = link[1:link.index('>')].replace('http://localhost', '') if link else None
+    return ids
+
+
+@pytest.fixture
+def catalog(accounts, create_place, create_amenity, create_review):
+    for i in range(5):
+        create_amenity(f'Amenity {i}')
+        place = create_place(title=f'Place {i}', price=10 * (5 - i))
+        create_review(place['id'])
+
+
+class TestPagination:
+    """?limit=N&cursor=... on every collection"""
+
+    @pytest.mark.parametrize('collection', ['places', 'reviews', 'users', 'amenities'])
+    def test_pages_cover_the_collection_once(self, client, catalog, collection):
+        full = client.get(f'/api/v1/{collection}/').get_json()
+        ids = walk(client, f'/api/v1/{collection}/?limit=2')
+        assert len(ids) == len(set(ids))
+        assert sorted(ids) == sorted(item['id'] for item in full)
+
+    def test_sorted_pages(self, client, catalog):
+        ids = walk(client, '/api/v1/places/?limit=2&sort=price')
+        prices = {p['id']: p['price'] for p in client.get('/api/v1/places/').get_json()}
+        assert [prices[i] for i in ids] == sorted(prices.values())
+
+    @pytest.mark.parametrize('query', ['limit=0', 'limit=101', 'limit=abc', 'cursor=zz!'])
+    def test_invalid_parameters(self, client, query):
+        assert client.get(f'/api/v1/places/?{query}').status_code == 400
+
+    def test_cursor_of_another_sort_is_rejected(self, client, catalog):
+        response = client.get('/api/v1/places/?limit=2')
+        cursor = response.headers['X-Next-Cursor']
+        response = client.get(f'/api/v1/places/?limit=2&sort=price&cursor={cursor}')
+        assert response.status_code == 400
+
+
+def test_in_memory_pages_break_ties_by_id():
+    repo = InMemoryRepository()
+    start = datetime(2020, 1, 1)
+    objs = [SimpleNamespace(id=f'{i:03}', created_at=start + timedelta(seconds=i // 2))
+            for i in range(7)]
+    for obj in reversed(objs):
+        repo.add(obj)
+    repo.delete('003')
+
+    ids, after = [], None
+    while True:
+        items, after = repo.get_page(2, after)
+        ids += [obj.id for obj in items]
+        if after is None:
+            break
+    assert ids == ['000', '001', '002', '004', '005', '006']
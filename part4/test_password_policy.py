@@ -0,0 +1,80 @@
+"""
+Tests for the configurable password hash policy and rehash on login.
+Run with: pytest test_password_policy.py -v
+"""
+import sys
+
+import pytest
+
+from config import TestingConfig
+from hbnb.app import create_app, db
+from hbnb.app.models.user import User
+from hbnb.app.password_hasher import HashPolicy, _hash
+
+
+def stored_hash(app, email):
+    with app.app_context():
+        return db.session.execute(
+            db.select(User.password).where(User.email == email)).scalar_one()
+
+
+def login(client, password):
+    return client.post('/api/v1/users/login',
+                       json={'email': 'guest@example.com', 'password': password})
+
+
+class TestHashPolicy:
+    """needs_rehash compares stored hashes to the configured policy"""
+
+    def test_bcrypt_cost(self):
+        policy = HashPolicy(rounds=4)
+        assert not policy.needs_rehash(_hash('secret', policy))
+        assert policy._replace(rounds=5).needs_rehash(_hash('secret', policy))
+
+    def test_other_scheme(self):
+        assert HashPolicy(rounds=4).needs_rehash('$argon2id$v=19$m=65536,t=3,p=4$salt$hash')
+        assert HashPolicy(rounds=4).needs_rehash('plain-text')
+
+    def test_from_config(self):
+        assert HashPolicy.from_config({'BCRYPT_LOG_ROUNDS': '6'}).rounds == 6
+        with pytest.raises(ValueError):
+            HashPolicy.from_config({'PASSWORD_HASH_SCHEME': 'md5'})
+
+    def test_testing_config_is_cheap(self):
+        assert TestingConfig.BCRYPT_LOG_ROUNDS == 4
+
+
+class TestRehashOnLogin:
+    """A hash made under another cost is replaced on the next good login"""
+
+    def test_rehash(self, app, client, accounts, monkeypatch):
+        state = app.extensions['password_hasher']
+        original = stored_hash(app, 'guest@example.com')
+        assert original.startswith('$2b$04$')
+
+        monkeypatch.setattr(state, 'policy', state.policy._replace(rounds=5))
+        assert login(client, 'wrong-password').status_code == 401
+        assert stored_hash(app, 'guest@example.com') == original
+
+        assert login(client, 'guest-password').status_code == 200
+        rehashed = stored_hash(app, 'guest@example.com')
+        assert rehashed.startswith('$2b$05$')
+        assert login(client, 'guest-password').status_code == 200
+        assert stored_hash(app, 'guest@example.com') == rehashed
+
+
+class TestArgon2:
+    """The optional argon2id backend"""
+
+    def test_requires_package(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sys.modules['hbnb.app.password_hasher'], 'argon2', None)
+        config = type('ArgonConfig', (TestingConfig,), {'PASSWORD_HASH_SCHEME': 'argon2id'})
+        with pytest.raises(RuntimeError):
+            create_app(config)
+
+    def test_migrates_bcrypt_hashes(self):
+        pytest.importorskip('argon2')
+        bcrypt_hash = _hash('secret', HashPolicy(rounds=4))
+        policy = HashPolicy(scheme='argon2id', time_cost=1, memory_cost=1024, parallelism=1)
+        assert policy.needs_rehash(bcrypt_hash)
+        assert not policy.needs_rehash(_hash('secret', policy))
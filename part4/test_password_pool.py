@@ -0,0 +1,95 @@
+"""
+Tests for password hashing on the bounded worker pool.
+Run with: pytest test_password_pool.py -v
+"""
+import pytest
+
+from conftest import make_app
+from hbnb.app.extensions import password_hasher
+from hbnb.app.password_hasher import PasswordHasherBusy
+
+
+@pytest.fixture
+def pooled_app(tmp_path):
+    """An app hashing on one pool thread, admitting one hash at a time"""
+    return make_app(tmp_path / 'pool.db', PASSWORD_HASH_EXECUTOR='thread',
+                    PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_MAX_PENDING=1,
+                    PASSWORD_HASH_QUEUE_TIMEOUT=0.01)
+
+
+class TestHashing:
+    """hash, verify and hash_many on the pool"""
+
+    def test_hash_and_verify(self, pooled_app):
+        with pooled_app.app_context():
+            pw_hash = password_hasher.hash('secret')
+            assert password_hasher.verify(pw_hash, 'secret')
+            assert not password_hasher.verify(pw_hash, 'other')
+            assert password_hasher.stats()['completed'] == 3
+
+    def test_hash_many_keeps_order(self, pooled_app):
+        passwords = [f'password-{i}' for i in range(5)]
+        with pooled_app.app_context():
+            hashes = password_hasher.hash_many(passwords)
+            assert [password_hasher.verify(h, p) for h, p in zip(hashes, passwords)] == [True] * 5
+            assert not password_hasher.verify(hashes[0], passwords[1])
+
+    def test_empty_password(self, pooled_app):
+        with pooled_app.app_context():
+            with pytest.raises(ValueError):
+                password_hasher.hash('')
+            with pytest.raises(ValueError):
+                password_hasher.hash_many(['ok', None])
+
+    def test_dummy_verify(self, pooled_app):
+        with pooled_app.app_context():
+            assert password_hasher.verify_dummy('anything') is False
+
+    def test_bulk_users(self, app, facade):
+        with app.app_context():
+            users = facade.create_users([
+                {'first_name': f'U{i}', 'last_name': 'Test', 'email': f'u{i}@example.com',
+                 'password': f'pw-{i}'} for i in range(3)])
+            assert [u.verify_password(f'pw-{i}') for i, u in enumerate(users)] == [True] * 3
+
+
+class TestAdmission:
+    """A saturated pool rejects instead of queueing without bound"""
+
+    def test_busy(self, pooled_app):
+        state = pooled_app.extensions['password_hasher']
+        with pooled_app.app_context():
+            assert state._slots.acquire(blocking=False)
+            try:
+                with pytest.raises(PasswordHasherBusy):
+                    password_hasher.hash('secret')
+            finally:
+                state._slots.release()
+            assert state.stats()['rejected'] == 1
+            password_hasher.hash('secret')
+
+    def test_login_gets_503(self, pooled_app):
+        client = pooled_app.test_client()
+        response = client.post('/api/v1/users/', json={
+            'first_name': 'A', 'last_name': 'B', 'email': 'a@example.com', 'password': 'secret'})
+        assert response.status_code == 201
+        state = pooled_app.extensions['password_hasher']
+        state._slots.acquire()
+        try:
+            response = client.post('/api/v1/users/login',
+                                   json={'email': 'a@example.com', 'password': 'secret'})
+        finally:
+            state._slots.release()
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+
+
+class TestStats:
+    """The pool metrics endpoint"""
+
+    def test_admin_only(self, client, accounts):
+        url = '/api/v1/users/password-hashing'
+        assert client.get(url, headers=accounts['guest'][1]).status_code == 403
+        stats = client.get(url, headers=accounts['admin'][1]).get_json()
+        assert stats['executor'] == 'inline'
+        assert {'queue_depth', 'pending', 'rejected'} <= set(stats)
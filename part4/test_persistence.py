@@ -0,0 +1,43 @@
+"""
+Tests for places, reviews and amenities stored in mapped tables
+(SQLAlchemyRepository) instead of per-process dictionaries.
+Run with: pytest test_persistence.py -v
+"""
+from conftest import make_app
+from hbnb.app import db
+from hbnb.app.models.amenity import Amenity
+from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
+
+
+class TestPersistence:
+    """Entities outlive the application instance that created them"""
+
+    def test_entities_are_rows(self, app, create_place, create_amenity, create_review):
+        wifi = create_amenity('WiFi')
+        place = create_place(amenities=[wifi['id']])
+        review = create_review(place['id'])
+
+        with app.app_context():
+            stored = db.session.get(Place, place['id'])
+            assert [a.id for a in stored.amenities] == [wifi['id']]
+            assert db.session.get(Review, review['id']).place_id == place['id']
+            assert Amenity.query.filter_by(name='WiFi').count() == 1
+
+    def test_other_app_sees_the_data(self, database, client, create_place):
+        place = create_place(title='Shared')
+        # A second application on the same file, as another worker would be
+        other = make_app(database).test_client()
+        response = other.get(f"/api/v1/places/{place['id']}")
+        assert response.status_code == 200
+        assert response.get_json()['title'] == 'Shared'
+
+    def test_delete_place_deletes_its_reviews(self, app, client, accounts, create_place,
+                                              create_review):
+        place = create_place()
+        review = create_review(place['id'])
+        response = client.delete(f"/api/v1/places/{place['id']}", headers=accounts['host'][1])
+        assert response.status_code == 200
+        assert client.get(f"/api/v1/places/{place['id']}").status_code == 404
+        with app.app_context():
+            assert db.session.get(Review, review['id']) is None
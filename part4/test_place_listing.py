@@ -0,0 +1,43 @@
+"""
+Tests for the eager-loaded place listing: the number of queries does not
+grow with the number of places.
+Run with: pytest test_place_listing.py -v
+"""
+from conftest import count_queries
+
+
+def listing_queries(app, client):
+    with count_queries(app) as statements:
+        response = client.get('/api/v1/places/', query_string={'embed': 'owner,amenities,reviews'})
+    # Served from the database, not the response cache
+    assert response.headers['X-Cache'] == 'MISS'
+    return response.get_json(), len(statements)
+
+
+class TestPlaceListing:
+    """GET /api/v1/places/ loads relationships in a fixed number of queries"""
+
+    def test_query_count_is_constant(self, app, client, create_place, create_amenity,
+                                     create_review):
+        wifi = create_amenity('WiFi')
+        place = create_place(title='First', amenities=[wifi['id']])
+        create_review(place['id'])
+        _, few = listing_queries(app, client)
+
+        for i in range(5):
+            place = create_place(title=f'More {i}', amenities=[wifi['id']])
+            create_review(place['id'])
+        places, many = listing_queries(app, client)
+
+        assert len(places) == 6
+        assert 0 < many == few
+
+    def test_relationships_are_embedded(self, accounts, client, create_place, create_amenity,
+                                        create_review):
+        wifi = create_amenity('WiFi')
+        place = create_place(amenities=[wifi['id']])
+        create_review(place['id'], rating=5)
+        listed = client.get('/api/v1/places/').get_json()[0]
+        assert listed['owner']['id'] == accounts['host'][0]
+        assert [a['name'] for a in listed['amenities']] == ['WiFi']
+        assert listed['reviews'][0]['rating'] == 5
@@ -0,0 +1,54 @@
+"""
+Tests for the server-side place search: price range, bounding box and
+amenity filters, and sorting.
+Run with: pytest test_place_search.py -v
+"""
+import pytest
+
+
+def ids(response):
+    assert response.status_code == 200, response.get_json()
+    return {place['id'] for place in response.get_json()}
+
+
+@pytest.fixture
+def places(create_place, create_amenity):
+    wifi, pool = create_amenity('WiFi'), create_amenity('Pool')
+    return {
+        'cheap': create_place(title='Cheap', price=40, latitude=10.0, longitude=20.0,
+                              amenities=[wifi['id']]),
+        'middle': create_place(title='Middle', price=150, latitude=10.5, longitude=20.5,
+                               amenities=[wifi['id'], pool['id']]),
+        'luxury': create_place(title='Luxury', price=900, latitude=-33.9, longitude=151.2,
+                               amenities=[pool['id']]),
+        'amenities': (wifi['id'], pool['id']),
+    }
+
+
+class TestPlaceSearch:
+    """GET /api/v1/places/ filters"""
+
+    def test_price_range(self, client, places):
+        assert ids(client.get('/api/v1/places/?max_price=100')) == {places['cheap']['id']}
+        assert ids(client.get('/api/v1/places/?min_price=100&max_price=1000')) == {
+            places['middle']['id'], places['luxury']['id']}
+
+    def test_bounding_box(self, client, places):
+        response = client.get('/api/v1/places/?bbox=9.9,19.9,10.6,20.6')
+        assert ids(response) == {places['cheap']['id'], places['middle']['id']}
+
+    def test_amenities_must_all_match(self, client, places):
+        wifi, pool = places['amenities']
+        assert ids(client.get(f'/api/v1/places/?amenities={wifi},{pool}')) == {
+            places['middle']['id']}
+
+    def test_sort_descending(self, client, places):
+        prices = [p['price'] for p in client.get('/api/v1/places/?sort=-price').get_json()]
+        assert prices == [900, 150, 40]
+
+    @pytest.mark.parametrize('query', [
+        'min_price=x', 'min_price=nan', 'max_price=NaN', 'max_price=inf',
+        'bbox=1,2,3', 'bbox=nan,0,1,1', 'bbox=0,0,95,1', 'sort=bogus',
+    ])
+    def test_invalid_filters(self, client, query):
+        assert client.get(f'/api/v1/places/?{query}').status_code == 400
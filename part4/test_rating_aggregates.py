@@ -0,0 +1,102 @@
+"""
+Tests for the rating aggregates kept on Place (review count, average and
+histogram), updated with every review write.
+Run with: pytest test_rating_aggregates.py -v
+"""
+import threading
+
+import pytest
+
+from hbnb.app import db
+
+
+def aggregates(client, place_id):
+    place = client.get(f'/api/v1/places/{place_id}').get_json()
+    return place['review_count'], place['rating_average'], place['rating_histogram']
+
+
+def histogram(*ratings):
+    return {str(star): ratings.count(star) for star in range(1, 6)}
+
+
+@pytest.fixture
+def two_places(create_place):
+    return create_place(title='A')['id'], create_place(title='B')['id']
+
+
+class TestRatingAggregates:
+    """Aggregates follow creates, updates, moves and deletes"""
+
+    def test_create_and_update(self, client, accounts, two_places, create_review):
+        a, _ = two_places
+        create_review(a, rating=2)
+        review = create_review(a, rating=4, role='admin')
+        assert aggregates(client, a) == (2, 3.0, histogram(2, 4))
+
+        response = client.put(f"/api/v1/reviews/{review['id']}", headers=accounts['admin'][1],
+                              json={'text': 'Better', 'rating': 5, 'place_id': a})
+        assert response.status_code == 200
+        assert aggregates(client, a) == (2, 3.5, histogram(2, 5))
+
+    def test_review_moved_to_another_place(self, client, accounts, two_places, create_review):
+        a, b = two_places
+        create_review(a, rating=1, role='admin')
+        review = create_review(a, rating=5)
+        response = client.put(f"/api/v1/reviews/{review['id']}", headers=accounts['guest'][1],
+                              json={'text': 'Moved', 'rating': 3, 'place_id': b})
+        assert response.status_code == 200
+        assert aggregates(client, a) == (1, 1.0, histogram(1))
+        assert aggregates(client, b) == (1, 3.0, histogram(3))
+
+    def test_delete(self, client, accounts, two_places, create_review):
+        a, _ = two_places
+        review = create_review(a, rating=4)
+        response = client.delete(f"/api/v1/reviews/{review['id']}", headers=accounts['guest'][1])
+        assert response.status_code == 200
+        assert aggregates(client, a) == (0, 0.0, histogram())
+
+    def test_sort_by_rating(self, client, two_places, create_review):
+        a, b = two_places
+        create_review(a, rating=2)
+        create_review(b, rating=5)
+        listed = client.get('/api/v1/places/?sort=-rating').get_json()
+        assert [p['id'] for p in listed] == [b, a]
+
+    def test_repair_command(self, app, client, two_places, create_review):
+        a, _ = two_places
+        create_review(a, rating=4)
+        with app.app_context():
+            db.session.execute(db.text('UPDATE places SET review_count = 99, rating_avg = 9'))
+            db.session.commit()
+        result = app.test_cli_runner().invoke(args=['hbnb', 'repair-ratings'])
+        assert 'Recomputed' in result.output
+        assert aggregates(client, a) == (1, 4.0, histogram(4))
+
+
+class TestConcurrentReviews:
+    """Aggregates are changed in the database, not written back from memory"""
+
+    def test_interleaved_writers(self, app, client, accounts, facade, create_place):
+        place_id = create_place()['id']
+        both_loaded = threading.Barrier(2)
+        errors = []
+
+        def review(role, rating):
+            try:
+                with app.app_context():
+                    # Both sessions read the place before either writes
+                    assert facade.get_place(place_id).review_count == 0
+                    both_loaded.wait(timeout=5)
+                    facade.create_review({'text': role, 'rating': rating,
+                                          'user_id': accounts[role][0], 'place_id': place_id})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=review, args=args)
+                   for args in (('guest', 2), ('admin', 5))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert aggregates(client, place_id) == (2, 3.5, histogram(2, 5))
@@ -0,0 +1,127 @@
+"""
+Tests for the response cache of the hot read endpoints and its backends.
+Run with: pytest test_response_cache.py -v
+"""
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from hbnb.app.cache import FileSystemBackend, MemoryBackend
+
+
+@pytest.fixture
+def place_ids(create_place):
+    return create_place(title='A')['id'], create_place(title='B')['id']
+
+
+class TestCachedEndpoints:
+    """X-Cache reports hits, and writes invalidate the responses they change"""
+
+    def test_hit_after_miss(self, client, place_ids):
+        url = f'/api/v1/places/{place_ids[0]}'
+        assert client.get(url).headers['X-Cache'] == 'MISS'
+        response = client.get(url)
+        assert response.headers['X-Cache'] == 'HIT'
+        assert client.get(url, headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+
+    def test_review_invalidates_its_place(self, client, place_ids, create_review):
+        a, b = place_ids
+        for url in (f'/api/v1/places/{a}', f'/api/v1/places/{b}', '/api/v1/places/'):
+            client.get(url)
+        create_review(b, text='Fresh review')
+        assert client.get(f'/api/v1/places/{a}').headers['X-Cache'] == 'HIT'
+        response = client.get(f'/api/v1/places/{b}')
+        assert response.headers['X-Cache'] == 'MISS'
+        assert [r['text'] for r in response.get_json()['reviews']] == ['Fresh review']
+        assert client.get('/api/v1/places/').headers['X-Cache'] == 'MISS'
+
+    def test_amenity_write_invalidates_listing(self, client, accounts):
+        client.get('/api/v1/amenities/')
+        assert client.get('/api/v1/amenities/').headers['X-Cache'] == 'HIT'
+        client.post('/api/v1/amenities/', headers=accounts['admin'][1], json={'name': 'Pool'})
+        response = client.get('/api/v1/amenities/')
+        assert response.headers['X-Cache'] == 'MISS'
+        assert [a['name'] for a in response.get_json()] == ['Pool']
+
+    def test_hit_keeps_pagination_headers(self, client, place_ids):
+        first = client.get('/api/v1/places/?limit=1')
+        second = client.get('/api/v1/places/?limit=1')
+        assert second.headers['X-Cache'] == 'HIT'
+        assert second.headers['X-Next-Cursor'] == first.headers['X-Next-Cursor']
+
+    def test_errors_not_cached(self, client, place_ids):
+        client.get('/api/v1/places/?fields=bogus')
+        assert client.get('/api/v1/places/?fields=bogus').status_code == 400
+
+    def test_stats(self, client, accounts, place_ids):
+        client.get('/api/v1/places/')
+        client.get('/api/v1/places/')
+        assert client.get('/api/v1/cache/stats', headers=accounts['guest'][1]).status_code == 403
+        stats = client.get('/api/v1/cache/stats', headers=accounts['admin'][1]).get_json()
+        assert stats['backend'] == 'memory'
+        assert stats['hits'] >= 1 and stats['misses'] >= 1
+
+
+class TestMemoryBackend:
+    """In-process LRU bounded by entries, bytes and age"""
+
+    def test_lru_eviction(self):
+        backend = MemoryBackend(2, 10)
+        backend.set('a', b'1')
+        backend.set('b', b'2')
+        backend.get('a')
+        backend.set('c', b'3')
+        assert backend.get('b') is None
+        assert backend.get('a') == b'1'
+
+    def test_byte_bound(self):
+        backend = MemoryBackend(10, 10)
+        backend.set('big', b'x' * 11)
+        assert backend.get('big') is None
+        backend.set('a', b'12345')
+        backend.set('b', b'123456')
+        assert backend.get('a') is None and len(backend) == 1
+
+    def test_ttl(self):
+        backend = MemoryBackend(10, 1000, ttl=0.05)
+        backend.set('k', b'v')
+        assert backend.get('k') == b'v'
+        time.sleep(0.06)
+        assert backend.get('k') is None
+        assert len(backend) == 0
+
+
+class TestFileSystemBackend:
+    """Entries and generations shared by every worker using the directory"""
+
+    def test_shared_between_workers(self, tmp_path):
+        first = FileSystemBackend(str(tmp_path), 3, 10**6)
+        second = FileSystemBackend(str(tmp_path), 3, 10**6)
+        first.set('k', b'v')
+        assert second.get('k') == b'v'
+        assert second.generations(['places']) == [0]
+        first.bump(['places'])
+        assert second.generations(['places']) == [1]
+
+    def test_entry_bound(self, tmp_path):
+        backend = FileSystemBackend(str(tmp_path), 3, 10**6)
+        for i in range(5):
+            backend.set(f'k{i}', b'v')
+        assert len(backend) == 3
+
+
+class TestDefaultBackend:
+    """The shared backend is the default when the server runs several workers"""
+
+    @pytest.mark.parametrize('workers, backend', [('1', 'memory'), ('4', 'filesystem')])
+    def test_web_concurrency(self, workers, backend):
+        env = {k: v for k, v in os.environ.items() if k != 'RESPONSE_CACHE_BACKEND'}
+        env['WEB_CONCURRENCY'] = workers
+        output = subprocess.run(
+            [sys.executable, '-c', 'import config; print(config.Config.RESPONSE_CACHE_BACKEND)'],
+            cwd=Path(__file__).parent, env=env, capture_output=True, text=True, check=True)
+        assert output.stdout.strip() == backend
@@ -0,0 +1,74 @@
+"""
+Tests for seed data loading and the seed marker skipping unchanged files.
+Run with: pytest test_seed.py -v
+"""
+import json
+
+import pytest
+
+from hbnb.app import db
+from hbnb.app.models.seed_marker import SeedMarker
+from hbnb.app.models.user import User
+from hbnb.app.seed import DEFAULT_SEED_FILE, load_seed_data
+
+
+@pytest.fixture
+def seed_data():
+    with open(DEFAULT_SEED_FILE) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def seed_file(tmp_path, seed_data):
+    """A copy of seed_data.json"""
+    path = tmp_path / 'seed_data.json'
+    path.write_text(json.dumps(seed_data))
+    return path
+
+
+def seed(app, *args):
+    return app.test_cli_runner().invoke(args=['hbnb', 'seed', *args]).output
+
+
+def user_count():
+    return db.session.scalar(db.select(db.func.count(User.id)))
+
+
+class TestSeedMarker:
+    """A seed file is loaded once per content"""
+
+    def test_load_then_skip(self, app, seed_data, seed_file):
+        with app.app_context():
+            counts = load_seed_data(str(seed_file))
+            assert counts['users'] == len(seed_data['users'])
+            marker = db.session.get(SeedMarker, 'seed_data.json')
+            assert marker is not None and len(marker.sha256) == 64
+            assert load_seed_data(str(seed_file)) is None
+            assert user_count() == len(seed_data['users'])
+
+    def test_cli(self, app, seed_file):
+        assert 'Seed data loaded: 3 users' in seed(app, '--file', str(seed_file))
+        assert 'unchanged' in seed(app, '--file', str(seed_file))
+        assert 'Seed data loaded: 3 users' in seed(app, '--file', str(seed_file), '--force')
+        with app.app_context():
+            assert user_count() == 3
+
+    def test_changed_file_adds_new_rows(self, app, seed_data, seed_file):
+        seed(app, '--file', str(seed_file))
+        seed_data['users'].append({'first_name': 'New', 'last_name': 'Seed',
+                              'email': 'new@example.com', 'password': 'new-password'})
+        seed_file.write_text(json.dumps(seed_data))
+
+        assert 'Seed data loaded: 4 users' in seed(app, '--file', str(seed_file))
+        with app.app_context():
+            assert user_count() == 4
+            assert db.session.scalar(db.select(db.func.count(User.id))
+                                     .where(User.email == 'new@example.com')) == 1
+
+    def test_missing_or_invalid_file(self, app, tmp_path):
+        invalid = tmp_path / 'seed_data.json'
+        invalid.write_text('{"users": [')
+        with app.app_context():
+            assert load_seed_data(str(tmp_path / 'missing.json')) is None
+            assert load_seed_data(str(invalid)) is None
+            assert db.session.get(SeedMarker, 'seed_data.json') is None
@@ -0,0 +1,92 @@
+"""
+Tests for the compiled response serializers.
+Run with: pytest test_serializers.py -v
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+from hbnb.app.api.v1 import serializers
+from hbnb.app.api.v1.serializers import (
+    PLACE_CARD, compile_plan, many, one, place_columns, place_plan, serialize)
+
+
+class Lazy:
+    """An object whose 'name' is not in __dict__, like an unloaded column"""
+
+    def __init__(self, id):
+        self.id = id
+
+    @property
+    def name(self):
+        return f'lazy-{self.id}'
+
+
+class TestCompilePlan:
+    """Plans read attributes and computed fields"""
+
+    def test_attributes_and_computed(self):
+        plan = compile_plan([('id', 'id'), ('label', lambda o: o.name.upper())])
+        assert serialize(plan, SimpleNamespace(id='1', name='wifi')) == {
+            'id': '1', 'label': 'WIFI'}
+
+    def test_single_attribute(self):
+        plan = compile_plan([('name', 'name')])
+        assert serialize(plan, SimpleNamespace(id='1', name='wifi')) == {'name': 'wifi'}
+
+    def test_unloaded_attribute_falls_back(self):
+        plan = compile_plan([('id', 'id'), ('name', 'name')])
+        assert serialize(plan, Lazy('2')) == {'id': '2', 'name': 'lazy-2'}
+
+    def test_related_objects(self):
+        stub = compile_plan([('id', 'id')])
+        plan = compile_plan([('owner', one(stub, 'owner')), ('items', many(stub, 'items'))])
+        obj = SimpleNamespace(owner=None, items=[SimpleNamespace(id='a'), SimpleNamespace(id='b')])
+        assert serialize(plan, obj) == {'owner': None, 'items': [{'id': 'a'}, {'id': 'b'}]}
+
+
+class TestPlacePlans:
+    """Place plans for sparse field and embed selections"""
+
+    def test_plans_are_cached(self):
+        assert place_plan(('id', 'title'), ()) is place_plan(('id', 'title'), ())
+        assert place_plan() is PLACE_CARD
+
+    def test_selection(self):
+        plan = place_plan(('id', 'rating_average'), ('owner',))
+        place = SimpleNamespace(id='p', rating_avg=3.456, owner=SimpleNamespace(
+            id='u', first_name='A', last_name='B', email='a@example.com'))
+        assert serialize(plan, place) == {
+            'id': 'p', 'rating_average': 3.46,
+            'owner': {'id': 'u', 'first_name': 'A', 'last_name': 'B', 'email': 'a@example.com'}}
+
+    def test_columns(self):
+        assert place_columns(None) is None
+        assert place_columns(('id', 'rating_histogram', 'id')) == (
+            'id', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5')
+
+    def test_timestamps(self):
+        plan = compile_plan(serializers.TIMESTAMPS)
+        moment = datetime(2026, 1, 2, 3, 4, 5)
+        assert serialize(plan, SimpleNamespace(created_at=moment, updated_at=moment)) == {
+            'created_at': '2026-01-02T03:04:05', 'updated_at': '2026-01-02T03:04:05'}
+
+
+class TestApiShapes:
+    """Endpoints return the compiled shapes"""
+
+    def test_place_detail(self, client, create_place, create_amenity, create_review):
+        wifi = create_amenity('Wifi')
+        place_id = create_place(amenities=[wifi['id']])['id']
+        create_review(place_id, rating=5)
+        place = client.get(f'/api/v1/places/{place_id}').get_json()
+        assert set(place) == set(serializers._PLACE_FIELDS) | {'owner', 'amenities', 'reviews'}
+        assert place['owner']['email'] == 'host@example.com'
+        assert place['amenities'] == [{'id': wifi['id'], 'name': 'Wifi'}]
+        assert place['reviews'][0]['rating'] == 5
+        assert place['reviews'][0]['user']['first_name'] == 'Guest'
+
+    def test_review(self, client, create_place, create_review):
+        place_id = create_place()['id']
+        review = create_review(place_id)
+        assert set(review) == {'id', 'text', 'rating', 'user_id', 'user', 'place_id',
+                               'created_at', 'updated_at'}
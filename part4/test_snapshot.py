@@ -0,0 +1,179 @@
+"""
+Tests for the persistent compact InMemoryRepository: a snapshot file plus
+a log of the writes since, replayed on open.
+Run with: pytest test_snapshot.py -v
+"""
+import random
+import threading
+
+import pytest
+
+from hbnb.app.models.place import Place
+from hbnb.app.models.review import Review
+from hbnb.app.models.user import User
+from hbnb.app.persistence.repository import Index, InMemoryRepository
+
+
+@pytest.fixture
+def entities(app):
+    with app.app_context():
+        owner = User(first_name='O', last_name='W', email='owner@example.com', password='x' * 8)
+        users = [User(first_name='U', last_name='S', email=f'u{i}@example.com', password='x' * 8)
+                 for i in range(3)]
+        places = [Place(title=f'P{i}', description='d', price=10.0 + i, latitude=1.0,
+                        longitude=2.0, owner=owner) for i in range(4)]
+        yield owner, users, places
+
+
+@pytest.fixture
+def open_reviews(tmp_path):
+    path = str(tmp_path / 'reviews.snap')
+
+    def open_reviews(indexes=('place_id',), **options):
+        return InMemoryRepository([Index(name) for name in indexes]
+                                  + [Index('rating', ordered=True)],
+                                  model=Review, compact=True, path=path, **options)
+    open_reviews.path = path
+    return open_reviews
+
+
+def contents(repo):
+    return [(r.id, r.text, r.rating, r.place_id, r.user_id, r.created_at) for r in repo.get_all()]
+
+
+def write_some(repo, users, places, seed=1, count=60):
+    rnd = random.Random(seed)
+    live = []
+    for n in range(count):
+        op = rnd.random()
+        if op < .5 or not live:
+            review = Review(text=f't{n}', rating=rnd.randint(1, 5), user=rnd.choice(users),
+                            place=rnd.choice(places))
+            repo.add(review)
+            live.append(review.id)
+        elif op < .8:
+            repo.update(rnd.choice(live), {'text': f'u{n}', 'rating': rnd.randint(1, 5)})
+        else:
+            repo.delete(live.pop(rnd.randrange(len(live))))
+
+
+class TestReopen:
+    """A reopened repository holds the same entities and indexes"""
+
+    @pytest.mark.parametrize('snapshot', [False, True])
+    def test_reopen(self, entities, open_reviews, snapshot):
+        _, users, places = entities
+        repo = open_reviews(snapshot_every=0)
+        write_some(repo, users, places)
+        if snapshot:
+            repo.snapshot()
+            write_some(repo, users, places, seed=2, count=20)
+        expected = contents(repo)
+        by_place = {p.id: sorted(r.id for r in repo.get_all_by_attribute('place_id', [p.id]))
+                    for p in places}
+        by_rating = [(r.rating, r.id) for r in repo.get_range('rating', 2, 4)]
+        repo.close()
+
+        repo = open_reviews(snapshot_every=0)
+        assert contents(repo) == expected
+        assert len(repo) == len(expected)
+        assert {p.id: sorted(r.id for r in repo.get_all_by_attribute('place_id', [p.id]))
+                for p in places} == by_place
+        assert [(r.rating, r.id) for r in repo.get_range('rating', 2, 4)] == by_rating
+        repo.close()
+
+    def test_torn_log_tail(self, entities, open_reviews):
+        _, users, places = entities
+        repo = open_reviews()
+        repo.add(Review(text='last', rating=3, user=users[0], place=places[0]))
+        repo.close()
+        with open(open_reviews.path + '.log', 'ab') as log:
+            log.write(b'\x50\x00\x00\x00abc')
+
+        repo = open_reviews()
+        assert [r.text for r in repo.get_all()] == ['last']
+        repo.add(Review(text='after', rating=4, user=users[0], place=places[1]))
+        repo.close()
+        assert sorted(r.text for r in open_reviews().get_all()) == ['after', 'last']
+
+    def test_index_change_rebuilds(self, entities, open_reviews):
+        _, users, places = entities
+        repo = open_reviews()
+        write_some(repo, users, places)
+        repo.snapshot()
+        repo.close()
+
+        repo = open_reviews(indexes=('user_id',))
+        expected = sorted(r.id for r in repo.get_all() if r.user_id == users[0].id)
+        assert sorted(r.id for r in repo.get_all_by_attribute('user_id', [users[0].id])) == expected
+        repo.close()
+
+    def test_concurrent_writers(self, entities, open_reviews):
+        _, users, places = entities
+        repo = open_reviews(snapshot_every=50)
+        expected = {}
+
+        def work(seed):
+            rnd = random.Random(seed)
+            mine = []
+            for i in range(150):
+                if rnd.random() < .6 or not mine:
+                    review = Review(text=f'{seed}-{i}', rating=rnd.randint(1, 5), user=users[0],
+                                    place=rnd.choice(places))
+                    repo.add(review)
+                    mine.append(review.id)
+                    expected[review.id] = review.text
+                elif rnd.random() < .5:
+                    review_id = rnd.choice(mine)
+                    repo.update(review_id, {'text': f'{seed}-{i}u'})
+                    expected[review_id] = f'{seed}-{i}u'
+                else:
+                    review_id = mine.pop(rnd.randrange(len(mine)))
+                    repo.delete(review_id)
+                    expected.pop(review_id)
+
+        threads = [threading.Thread(target=work, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        repo.close()
+
+        repo = open_reviews(snapshot_every=50)
+        assert {r.id: r.text for r in repo.get_all()} == expected
+        assert len(repo.get_range('rating')) == len(expected)
+        repo.close()
+
+
+class TestPlaces:
+    """Unique indexes and file compatibility checks"""
+
+    def test_unique_across_snapshot(self, entities, tmp_path):
+        owner, _, places = entities
+        path = str(tmp_path / 'places.snap')
+        repo = InMemoryRepository([Index('title', unique=True)], model=Place, compact=True, path=path)
+        repo.add_all(places)
+        repo.snapshot()
+        repo.close()
+
+        repo = InMemoryRepository([Index('title', unique=True)], model=Place, compact=True, path=path)
+        with pytest.raises(ValueError):
+            repo.add(Place(title='P1', description='', price=1.0, latitude=1.0, longitude=2.0,
+                           owner=owner))
+        repo.update(places[1].id, {'title': 'Q1'})
+        repo.add(Place(title='P1', description='', price=1.0, latitude=1.0, longitude=2.0,
+                       owner=owner))
+        assert repo.get_by_attribute('title', 'Q1').id == places[1].id
+        repo.close()
+
+    def test_other_model_rejected(self, entities, tmp_path):
+        _, _, places = entities
+        path = str(tmp_path / 'places.snap')
+        repo = InMemoryRepository(model=Place, compact=True, path=path)
+        repo.add_all(places)
+        repo.snapshot()
+        repo.close()
+        with pytest.raises(ValueError):
+            InMemoryRepository(model=Review, compact=True, path=path)
+        with pytest.raises(ValueError):
+            InMemoryRepository(model=Review, path=path)
@@ -0,0 +1,79 @@
+"""
+Tests for sparse place responses: ?fields= and ?embed= on the place
+listing and detail endpoints.
+Run with: pytest test_sparse_fields.py -v
+"""
+import pytest
+
+from conftest import count_queries
+
+
+@pytest.fixture
+def place_id(create_place, create_amenity, create_review):
+    wifi = create_amenity('Wifi')
+    place_id = create_place(title='Loft', price=80, amenities=[wifi['id']])['id']
+    create_place(title='Villa', price=300)
+    create_review(place_id, rating=3)
+    return place_id
+
+
+class TestListing:
+    """?fields= and ?embed= on /api/v1/places/"""
+
+    def test_fields(self, client, place_id):
+        places = client.get('/api/v1/places/?fields=id,title,price').get_json()
+        assert [set(p) for p in places] == [{'id', 'title', 'price'}] * 2
+
+    def test_fields_with_embed(self, client, place_id):
+        places = client.get('/api/v1/places/?fields=title&embed=amenities').get_json()
+        loft = next(p for p in places if p['title'] == 'Loft')
+        assert set(loft) == {'title', 'amenities'}
+        assert [a['name'] for a in loft['amenities']] == ['Wifi']
+
+    def test_embed_only(self, client, place_id):
+        place = client.get('/api/v1/places/?embed=owner').get_json()[0]
+        assert 'owner' in place and 'rating_histogram' in place
+        assert 'reviews' not in place and 'amenities' not in place
+
+    def test_empty_embed(self, client, place_id):
+        places = client.get('/api/v1/places/?fields=title&embed=').get_json()
+        assert [set(p) for p in places] == [{'title'}] * 2
+
+    def test_with_pagination(self, client, place_id):
+        response = client.get('/api/v1/places/?fields=title&sort=-price&limit=1')
+        assert response.get_json() == [{'title': 'Villa'}]
+        cursor = response.headers['X-Next-Cursor']
+        response = client.get(f'/api/v1/places/?fields=title&sort=-price&limit=1&cursor={cursor}')
+        assert response.get_json() == [{'title': 'Loft'}]
+
+    def test_sparse_listing_runs_fewer_queries(self, app, client, place_id):
+        with count_queries(app) as sparse:
+            client.get('/api/v1/places/?fields=id,title')
+        with count_queries(app) as full:
+            client.get('/api/v1/places/')
+        assert len(sparse) < len(full)
+
+
+class TestDetail:
+    """?fields= and ?embed= on /api/v1/places/<id>"""
+
+    def test_fields_with_embed(self, client, place_id):
+        place = client.get(
+            f'/api/v1/places/{place_id}?fields=rating_average,rating_histogram&embed=reviews'
+        ).get_json()
+        assert set(place) == {'rating_average', 'rating_histogram', 'reviews'}
+        assert place['rating_average'] == 3.0
+
+
+class TestInvalidSelection:
+    """Unknown or empty selections are a 400, not a 500"""
+
+    @pytest.mark.parametrize('query', [
+        '?fields=', '?fields=&embed=', '?fields=,', '?fields=id,bogus', '?embed=users'])
+    def test_listing(self, client, place_id, query):
+        assert client.get(f'/api/v1/places/{query}').status_code == 400
+
+    @pytest.mark.parametrize('query', [
+        '?fields=', '?fields=&embed=', '?fields=,', '?fields=bogus', '?embed=users'])
+    def test_detail(self, client, place_id, query):
+        assert client.get(f'/api/v1/places/{place_id}{query}').status_code == 400
@@ -0,0 +1,74 @@
+"""
+Tests for the grid cell spatial index behind the nearby and nearest
+place endpoints, against a brute-force haversine scan.
+Run with: pytest test_spatial.py -v
+"""
+import random
+
+import pytest
+
+from hbnb.app import db
+from hbnb.app.models.place import Place
+from hbnb.app.models.user import User
+from hbnb.app.persistence.spatial import haversine_km
+
+
+@pytest.fixture
+def points(app, accounts):
+    """(id, latitude, longitude) of 300 places, clustered near a pole, the
+    antimeridian and one city"""
+    rnd = random.Random(1)
+    with app.app_context():
+        owner = db.session.get(User, accounts['host'][0])
+        for i in range(300):
+            lat = rnd.choice([rnd.uniform(-90, 90), rnd.uniform(-89.99, -89.5),
+                              rnd.uniform(10, 10.5)])
+            lon = rnd.choice([rnd.uniform(-180, 180), rnd.uniform(179.8, 180),
+                              rnd.uniform(-180, -179.8), rnd.uniform(20, 20.5)])
+            db.session.add(Place(title=f'P{i}', price=1, latitude=lat, longitude=lon,
+                                 owner=owner))
+        db.session.commit()
+        return [(p.id, p.latitude, p.longitude) for p in Place.query.all()]
+
+
+def closest(points, lat, lon, radius_km=float('inf')):
+    found = sorted((haversine_km(lat, lon, a, b), i) for i, a, b in points)
+    return [i for distance, i in found if distance <= radius_km]
+
+
+class TestSpatial:
+    """GET /api/v1/places/nearby and /nearest"""
+
+    @pytest.mark.parametrize('lat,lon,radius', [
+        (10.2, 20.2, 5), (10.2, 20.2, 50), (0, 179.95, 40), (0, -179.95, 40),
+        (-89.9, 0, 100), (10, 20, 3000), (0, 0, 20000),
+    ])
+    def test_nearby_matches_a_scan(self, client, points, lat, lon, radius):
+        response = client.get(f'/api/v1/places/nearby?lat={lat}&lon={lon}'
+                              f'&radius_km={radius}&limit=100')
+        assert response.status_code == 200
+        assert [p['id'] for p in response.get_json()] == closest(points, lat, lon, radius)[:100]
+
+    @pytest.mark.parametrize('lat,lon', [(10.2, 20.2), (0, 179.95), (89.9, 10)])
+    def test_nearest_matches_a_scan(self, client, points, lat, lon):
+        response = client.get(f'/api/v1/places/nearest?lat={lat}&lon={lon}&k=7')
+        assert response.status_code == 200
+        assert [p['id'] for p in response.get_json()] == closest(points, lat, lon)[:7]
+
+    def test_moved_place_is_found_at_its_new_location(self, client, accounts, create_place):
+        place = create_place(latitude=0, longitude=0)
+        response = client.put(f"/api/v1/places/{place['id']}", headers=accounts['host'][1],
+                              json={'title': place['title'], 'price': place['price'],
+                                    'latitude': 45.0, 'longitude': 45.0,
+                                    'owner_id': place['owner_id'], 'amenities': []})
+        assert response.status_code == 200, response.get_json()
+        nearby = client.get('/api/v1/places/nearby?lat=45&lon=45&radius_km=1').get_json()
+        assert [p['id'] for p in nearby] == [place['id']]
+        assert client.get('/api/v1/places/nearby?lat=0&lon=0&radius_km=1').get_json() == []
+
+    @pytest.mark.parametrize('query', [
+        'nearby?lat=1&lon=2', 'nearby?lat=91&lon=2&radius_km=1',
+        'nearby?lat=1&lon=2&radius_km=-1', 'nearest?lat=1&lon=2&k=0',
+    ])
+    def test_invalid_parameters(self, client, query):
+        assert client.get(f'/api/v1/places/{query}').status_code == 400
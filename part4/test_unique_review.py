@@ -0,0 +1,51 @@
+"""
+Tests for the one-review-per-user-and-place rule, enforced both by the
+facade check and by the reviews table's unique constraint.
+Run with: pytest test_unique_review.py -v
+"""
+import pytest
+
+
+@pytest.fixture
+def place_ids(create_place):
+    return create_place(title='A')['id'], create_place(title='B')['id']
+
+
+def post_review(client, headers, place_id, text='Again'):
+    return client.post('/api/v1/reviews/', headers=headers,
+                       json={'text': text, 'rating': 1, 'place_id': place_id})
+
+
+class TestUniqueReview:
+    """A user reviews each place at most once"""
+
+    def test_second_review_rejected(self, client, accounts, place_ids, create_review):
+        a, _ = place_ids
+        create_review(a)
+        assert post_review(client, accounts['guest'][1], a).status_code == 403
+
+    def test_constraint_backs_up_the_check(self, client, accounts, facade, place_ids,
+                                           create_review, monkeypatch):
+        """A duplicate that slips past the check (a race) still gets a 403"""
+        a, _ = place_ids
+        create_review(a)
+        monkeypatch.setattr(facade.review_repo, 'has_user_reviewed', lambda user, place: False)
+        assert post_review(client, accounts['guest'][1], a).status_code == 403
+        assert client.get(f'/api/v1/places/{a}').get_json()['review_count'] == 1
+
+    def test_review_cannot_move_onto_reviewed_place(self, client, accounts, place_ids,
+                                                    create_review):
+        a, b = place_ids
+        create_review(a)
+        review = create_review(b)
+        response = client.put(f"/api/v1/reviews/{review['id']}", headers=accounts['guest'][1],
+                              json={'text': 'Moved', 'rating': 2, 'place_id': a})
+        assert response.status_code == 403
+
+    def test_has_user_reviewed(self, app, accounts, facade, place_ids, create_review):
+        a, b = place_ids
+        create_review(a)
+        guest_id = accounts['guest'][0]
+        with app.app_context():
+            assert facade.has_user_reviewed(guest_id, a)
+            assert not facade.has_user_reviewed(guest_id, b)
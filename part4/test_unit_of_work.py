@@ -0,0 +1,127 @@
+"""
+Tests for the facade's unit of work: one commit per write, atomic
+multi-entity writes.
+Run with: pytest test_unit_of_work.py -v
+"""
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from hbnb.app import db
+from hbnb.app.models.place import Place
+from hbnb.app.persistence.unit_of_work import after_commit
+
+
+@contextmanager
+def count_commits(app):
+    commits = []
+
+    def collect(conn):
+        commits.append(conn)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'commit', collect)
+    try:
+        yield commits
+    finally:
+        event.remove(engine, 'commit', collect)
+
+
+@pytest.fixture
+def place_body(accounts):
+    return {'title': 'Unit', 'price': 10, 'latitude': 1.0, 'longitude': 2.0,
+            'owner_id': accounts['host'][0], 'amenities': []}
+
+
+def place_count():
+    return db.session.scalar(db.select(db.func.count(Place.id)))
+
+
+class TestOneCommitPerRequest:
+    """Each write endpoint commits once"""
+
+    def test_place_create_and_update(self, app, client, accounts, create_amenity, place_body):
+        headers = accounts['host'][1]
+        amenity_ids = [create_amenity(name)['id'] for name in ('Wifi', 'Pool')]
+        with count_commits(app) as commits:
+            response = client.post('/api/v1/places/', headers=headers,
+                                   json=dict(place_body, amenities=amenity_ids))
+        assert response.status_code == 201 and len(commits) == 1
+
+        with count_commits(app) as commits:
+            response = client.put(f"/api/v1/places/{response.get_json()['id']}", headers=headers,
+                                  json=dict(place_body, amenities=amenity_ids[:1]))
+        assert response.status_code == 200 and len(commits) == 1
+
+    def test_user_update(self, app, client, accounts):
+        user_id, headers = accounts['guest']
+        with count_commits(app) as commits:
+            response = client.put(f'/api/v1/users/{user_id}', headers=headers, json={
+                'first_name': 'G', 'last_name': 'T', 'email': 'guest@example.com',
+                'password': 'new-password'})
+        assert response.status_code == 200 and len(commits) == 1
+        response = client.post('/api/v1/users/login',
+                               json={'email': 'guest@example.com', 'password': 'new-password'})
+        assert response.status_code == 200
+
+
+class TestTransaction:
+    """facade.transaction() groups several writes"""
+
+    def test_commits_once(self, app, facade, accounts, place_body):
+        host_id = accounts['host'][0]
+        with count_commits(app) as commits, app.test_request_context():
+            with facade.transaction():
+                facade.update_user(host_id, {'first_name': 'Both'})
+                facade.create_place(dict(place_body, title='Atomic'))
+            assert place_count() == 1
+            assert facade.get_user(host_id).first_name == 'Both'
+        assert len(commits) == 1
+
+    def test_rolls_back_on_error(self, app, facade, accounts, place_body):
+        host_id = accounts['host'][0]
+        with app.test_request_context():
+            with pytest.raises(RuntimeError):
+                with facade.transaction():
+                    facade.update_user(host_id, {'first_name': 'Rolled'})
+                    facade.create_place(dict(place_body, title='Atomic'))
+                    raise RuntimeError('abort')
+            assert place_count() == 0
+            assert facade.get_user(host_id).first_name == 'Host'
+
+    def test_failed_validation_leaves_nothing_dirty(self, app, client, facade, accounts,
+                                                    place_body):
+        response = client.post('/api/v1/places/', headers=accounts['host'][1], json=place_body)
+        place_id = response.get_json()['id']
+        with app.test_request_context():
+            with pytest.raises(ValueError):
+                facade.update_place(place_id, {'price': -5})
+            assert db.session.get(Place, place_id).price == 10
+
+    def test_after_commit(self, app, facade):
+        calls = []
+        with app.app_context():
+            with facade.transaction():
+                after_commit(lambda: calls.append('committed'))
+                assert calls == []
+            assert calls == ['committed']
+
+            with pytest.raises(RuntimeError):
+                with facade.transaction():
+                    after_commit(lambda: calls.append('rolled back'))
+                    raise RuntimeError('abort')
+            assert calls == ['committed']
+
+            after_commit(lambda: calls.append('now'))
+            assert calls == ['committed', 'now']
+
+    def test_nested(self, app, facade):
+        calls = []
+        with app.app_context():
+            with facade.transaction():
+                with facade.transaction():
+                    after_commit(lambda: calls.append('inner'))
+                assert calls == []
+            assert calls == ['inner']
@@ -0,0 +1,151 @@
+"""
+Tests for the per-process user lookup cache.
+Run with: pytest test_user_cache.py -v
+"""
+import sqlite3
+
+import pytest
+
+from conftest import count_queries
+from hbnb.app.extensions import identity_cache
+
+MISSING = '00000000-0000-0000-0000-000000000000'
+
+
+def user_queries(statements):
+    return [s for s in statements if 'FROM users' in s]
+
+
+def login(client, email, password):
+    return client.post('/api/v1/users/login', json={'email': email, 'password': password})
+
+
+@pytest.fixture
+def register(client):
+    def register(email, password='secret-pw', first_name='New'):
+        response = client.post('/api/v1/users/', json={
+            'first_name': first_name, 'last_name': 'User', 'email': email, 'password': password})
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()['id']
+    return register
+
+
+class TestLookups:
+    """Repeated lookups are served from the cache"""
+
+    def test_hit(self, app, client, accounts):
+        host_id = accounts['host'][0]
+        client.get(f'/api/v1/users/{host_id}')
+        with count_queries(app) as statements:
+            assert client.get(f'/api/v1/users/{host_id}').status_code == 200
+        assert user_queries(statements) == []
+
+    def test_negative_hit(self, app, client, accounts):
+        client.get(f'/api/v1/users/{MISSING}')
+        with count_queries(app) as statements:
+            assert client.get(f'/api/v1/users/{MISSING}').status_code == 404
+        assert user_queries(statements) == []
+
+    def test_stats(self, client, accounts):
+        host_id = accounts['host'][0]
+        client.get(f'/api/v1/users/{host_id}')
+        client.get(f'/api/v1/users/{host_id}')
+        stats = client.get('/api/v1/cache/users', headers=accounts['admin'][1]).get_json()
+        assert stats['enabled'] and stats['hits'] >= 1
+
+
+class TestInvalidation:
+    """Writes through this process drop the entries they change"""
+
+    def test_registration_then_login(self, client, register):
+        assert login(client, 'new@example.com', 'secret-pw').status_code == 401
+        register('new@example.com')
+        assert login(client, ' NEW@example.com', 'secret-pw').status_code == 200
+
+    def test_update(self, client, register):
+        user_id = register('new@example.com')
+        token = login(client, 'new@example.com', 'secret-pw').get_json()['access_token']
+        client.get(f'/api/v1/users/{user_id}')
+        response = client.put(f'/api/v1/users/{user_id}', headers={'Authorization': f'Bearer {token}'},
+                              json={'first_name': 'Renamed', 'last_name': 'User',
+                                    'email': 'moved@example.com', 'password': 'secret-pw'})
+        assert response.status_code == 200
+        assert client.get(f'/api/v1/users/{user_id}').get_json()['first_name'] == 'Renamed'
+        assert login(client, 'new@example.com', 'secret-pw').status_code == 401
+        assert login(client, 'moved@example.com', 'secret-pw').status_code == 200
+
+    def test_delete(self, client, accounts, register):
+        user_id = register('new@example.com')
+        client.get(f'/api/v1/users/{user_id}')
+        response = client.delete(f'/api/v1/users/{user_id}', headers=accounts['admin'][1])
+        assert response.status_code == 204
+        assert client.get(f'/api/v1/users/{user_id}').status_code == 404
+
+
+class TestPasswords:
+    """Password hashes are never cached; logins always check the database"""
+
+    def test_no_password_in_entries(self, app, client, accounts):
+        login(client, 'host@example.com', 'host-password')
+        client.get(f"/api/v1/users/{accounts['host'][0]}")
+        with app.app_context():
+            entries = [value for _, value in identity_cache.cache._entries.values()]
+        assert entries
+        assert all(value is None or 'password' not in value for value in entries)
+
+    def test_change_by_another_process(self, client, database, accounts, register):
+        register('new@example.com', password='old-password')
+        assert login(client, 'new@example.com', 'old-password').status_code == 200
+        with sqlite3.connect(database) as connection:
+            connection.execute(
+                "UPDATE users SET password = (SELECT password FROM users WHERE email = ?) "
+                "WHERE email = ?", ('guest@example.com', 'new@example.com'))
+        connection.close()
+        assert login(client, 'new@example.com', 'old-password').status_code == 401
+        assert login(client, 'new@example.com', 'guest-password').status_code == 200
+
+    def test_delete_by_another_process(self, client, database, register):
+        register('new@example.com')
+        assert login(client, 'new@example.com', 'secret-pw').status_code == 200
+        with sqlite3.connect(database) as connection:
+            connection.execute("DELETE FROM users WHERE email = 'new@example.com'")
+        connection.close()
+        assert login(client, 'new@example.com', 'secret-pw').status_code == 401
+
+
+class TestUniqueness:
+    """Duplicate email checks never trust a cached miss"""
+
+    @pytest.fixture
+    def registered_elsewhere(self, app, database, facade, accounts):
+        # A miss cached by this process, then a registration by another
+        with app.app_context():
+            assert facade.get_user_by_email('new@example.com') is None
+        with sqlite3.connect(database) as connection:
+            connection.execute(
+                "INSERT INTO users (id, first_name, last_name, email, password, is_admin, "
+                "created_at, updated_at) SELECT 'elsewhere', first_name, last_name, "
+                "'new@example.com', password, 0, created_at, updated_at FROM users "
+                "WHERE email = 'guest@example.com'")
+        connection.close()
+
+    def test_registration(self, client, registered_elsewhere):
+        response = client.post('/api/v1/users/', json={
+            'first_name': 'New', 'last_name': 'User', 'email': 'new@example.com',
+            'password': 'secret-pw'})
+        assert response.status_code == 409
+
+    def test_update(self, client, accounts, registered_elsewhere):
+        response = client.put(f"/api/v1/users/{accounts['host'][0]}", headers=accounts['host'][1],
+                              json={'first_name': 'Host', 'last_name': 'User',
+                                    'email': 'new@example.com', 'password': 'host-password'})
+        assert response.status_code == 409
+
+    def test_concurrent_registration(self, client, facade, monkeypatch, accounts):
+        # The check passed, then another request took the email first
+        monkeypatch.setattr(facade, 'get_user_by_email', lambda email, cached=True: None)
+        response = client.post('/api/v1/users/', json={
+            'first_name': 'Guest', 'last_name': 'Again', 'email': 'guest@example.com',
+            'password': 'secret-pw'})
+        assert response.status_code == 409
+        assert client.get('/api/v1/users/').status_code == 200
@@ -1,7 +1,6 @@
 document.addEventListener('DOMContentLoaded', () => {
     const placesList = document.getElementById('places-list');
     const priceFilter = document.getElementById('price-filter');
-    let allPlaces = [];
     
     // Helper function to get cookie value by name
     function getCookie(name) {
@@ -65,23 +64,45 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
-    async function fetchPlaces() {
+    const loadMoreButton = document.getElementById('load-more');
+    const PAGE_SIZE = 12;
+    let currentMaxPrice = null;
+    let nextCursor = null;
+
+    // Fetch one page of places, letting the server apply the price filter.
+    // Without a cursor the list starts over, with one the page is appended.
+    async function fetchPlaces(maxPrice, cursor) {
         try {
-            const response = await fetch('http://127.0.0.1:8000/api/v1/places/');
+            const url = new URL('http://127.0.0.1:8000/api/v1/places/');
+            // Only ask for what the cards render, a page at a time
+            url.searchParams.set('fields', 'id,title,price');
+            url.searchParams.set('embed', 'amenities');
+            url.searchParams.set('limit', PAGE_SIZE);
+            if (maxPrice) {
+                url.searchParams.set('max_price', maxPrice);
+            }
+            if (cursor) {
+                url.searchParams.set('cursor', cursor);
+            }
+            const response = await fetch(url);
             const places = await response.json();
-            allPlaces = places;
-            displayPlaces(places);
-            setupPriceFilter();
+            nextCursor = response.headers.get('X-Next-Cursor');
+            displayPlaces(places, Boolean(cursor));
+            if (loadMoreButton) {
+                loadMoreButton.style.display = nextCursor ? 'block' : 'none';
+            }
         } catch (error) {
             console.error('Error:', error);
             placesList.innerHTML = '<p style="color: var(--gold-color); text-align: center;">Failed to load places. Please make sure the server is running.</p>';
         }
     }
 
-    function displayPlaces(places) {
-        placesList.innerHTML = '';
+    function displayPlaces(places, append) {
+        if (!append) {
+            placesList.innerHTML = '';
+        }
         
-        if (places.length === 0) {
+        if (places.length === 0 && !append) {
             placesList.innerHTML = '<p style="color: var(--gold-color); text-align: center; width: 100%;">No places available. Please add some data to the database.</p>';
             return;
         }
@@ -187,20 +208,24 @@ document.addEventListener('DOMContentLoaded', () => {
         priceFilter.addEventListener('change', filterByPrice);
     }
     
-    // Filter places by price
+    // Filter places by price on the server
     function filterByPrice() {
         const selectedPrice = priceFilter.value;
-        
-        if (selectedPrice === 'all') {
-            displayPlaces(allPlaces);
-        } else {
-            const maxPrice = parseFloat(selectedPrice);
-            const filteredPlaces = allPlaces.filter(place => place.price <= maxPrice);
-            displayPlaces(filteredPlaces);
-        }
+        currentMaxPrice = selectedPrice === 'all' ? null : selectedPrice;
+        fetchPlaces(currentMaxPrice);
+    }
+
+    // Append the next page of the current filter
+    if (loadMoreButton) {
+        loadMoreButton.addEventListener('click', () => {
+            if (nextCursor) {
+                fetchPlaces(currentMaxPrice, nextCursor);
+            }
+        });
     }
     
     // Initialize
     checkAuthentication();
+    setupPriceFilter();
     fetchPlaces();
 });
\ No newline at end of file